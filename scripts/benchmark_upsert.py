@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark pipeline cache writes: row-by-row ORM vs. set-based upsert.
+
+Writes N pipelines into an empty SQLite database (insert pass), then
+writes them again with changed statuses (update pass), and reports the
+SQL statements executed and the wall time of each pass.
+
+Usage (from the repository root):
+    PYTHONPATH=. python scripts/benchmark_upsert.py --count 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import event
+
+from src.database.db import DatabaseManager
+from src.database.models import PipelineModel
+from src.database.pipeline_upsert import upsert_pipelines
+from src.providers.base import Pipeline, PipelineStatus
+
+
+def make_pipelines(count, status):
+    """Build pipelines with distinct IDs."""
+    return [
+        Pipeline(
+            id=str(i),
+            name=f'workflow-{i}',
+            status=status,
+            repository=f'org/repo-{i % 200}',
+            branch='main',
+            commit=f'{i:040x}',
+            commit_message='Update dependencies',
+            author='dev',
+            url=f'https://github.com/org/repo-{i % 200}/actions/workflows/{i}',
+            started_at='2024-01-01T00:00:00Z',
+            finished_at='2024-01-01T00:05:00Z'
+        )
+        for i in range(count)
+    ]
+
+
+def parse_time(value):
+    """Parse an API timestamp into a datetime."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+
+def save_row_by_row(session, pipelines):
+    """The previous write path: one lookup plus one insert or update per pipeline."""
+    for pipeline in pipelines:
+        existing = session.query(PipelineModel).filter_by(id=pipeline.id).first()
+        if existing:
+            existing.status = pipeline.status.value
+            existing.branch = pipeline.branch
+            existing.commit = pipeline.commit
+            existing.commit_message = pipeline.commit_message
+            existing.author = pipeline.author
+            existing.started_at = parse_time(pipeline.started_at)
+            existing.finished_at = parse_time(pipeline.finished_at)
+            existing.updated_at = datetime.utcnow()
+        else:
+            session.add(PipelineModel(
+                id=pipeline.id,
+                name=pipeline.name,
+                status=pipeline.status.value,
+                repository=pipeline.repository,
+                branch=pipeline.branch,
+                commit=pipeline.commit,
+                commit_message=pipeline.commit_message,
+                author=pipeline.author,
+                url=pipeline.url,
+                started_at=parse_time(pipeline.started_at),
+                finished_at=parse_time(pipeline.finished_at)
+            ))
+    session.commit()
+
+
+def save_upsert(session, pipelines):
+    """The set-based write path."""
+    upsert_pipelines(session, pipelines)
+    session.commit()
+
+
+def run(save, count):
+    """Time the insert and update passes of one write path."""
+    handle, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    db = DatabaseManager(db_path)
+    db.init_db()
+    
+    statements = [0]
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+    
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    
+    results = []
+    try:
+        for status in (PipelineStatus.RUNNING, PipelineStatus.SUCCESS):
+            pipelines = make_pipelines(count, status)
+            statements[0] = 0
+            started = time.perf_counter()
+            with db.get_session() as session:
+                save(session, pipelines)
+            results.append((statements[0], time.perf_counter() - started))
+    finally:
+        db.close()
+        os.remove(db_path)
+    return results
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=10000, help='Pipelines written per pass')
+    args = parser.parse_args()
+    
+    print(f"{'path':<14}{'pass':<8}{'statements':>12}{'seconds':>10}")
+    for label, save in (('row-by-row', save_row_by_row), ('upsert', save_upsert)):
+        for pass_name, (statements, seconds) in zip(('insert', 'update'), run(save, args.count)):
+            print(f"{label:<14}{pass_name:<8}{statements:>12}{seconds:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -30,14 +30,23 @@ setup(
         "flask>=3.0.0",
         "python-dotenv>=1.0.0",
         "requests>=2.31.0",
+        "urllib3>=2.0",
         "pyyaml>=6.0.1",
         "click>=8.1.7",
     ],
+    extras_require={
+        "async": ["httpx>=0.27.0"],
+    },
     entry_points={
         "console_scripts": [
             "flowforge=src.cli.main:cli",
             "flowforge-server=src.main:main",
         ],
+        "flowforge.providers": [
+            "github=src.providers.github:GitHubProvider",
+            "github_org=src.providers.github_org:GitHubOrgProvider",
+            "github_async=src.providers.github_async:create_provider",
+        ],
     },
 )
 
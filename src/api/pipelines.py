@@ -5,12 +5,16 @@ Provides REST API for managing CI/CD pipelines across multiple providers,
 inspired by pipedash's unified pipeline interface.
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from typing import Dict, Any, List
 
 from src.providers.registry import ProviderRegistry
 from src.providers.base import Pipeline, PipelineRun
+from src.providers.log_archive import get_log_cache, iter_file, iter_logs
+from src.providers.run_correlation import get_correlator
 from src.database.db import get_db_manager
+from src.database.job_cache import get_job_cache
+from src.utils.errors import ValidationError
 
 pipelines_bp = Blueprint('pipelines', __name__, url_prefix='/api/v1/pipelines')
 
@@ -18,25 +22,40 @@ pipelines_bp = Blueprint('pipelines', __name__, url_prefix='/api/v1/pipelines')
 _provider_registry = ProviderRegistry()
 
 
+# Background poller, once the application has created one
+_poller = None
+
+
 def get_registry() -> ProviderRegistry:
     """Get global provider registry."""
     return _provider_registry
 
 
+def set_poller(poller) -> None:
+    """Expose the background poller to the API."""
+    global _poller
+    _poller = poller
+
+
 @pipelines_bp.route('', methods=['GET'])
 def list_pipelines():
     """
     List all pipelines from all enabled providers.
     
+    Listings are served from the read cache when possible; ``age`` is
+    the number of seconds since each provider's listing was fetched.
+    Providers that fail or miss the deadline are listed under ``errors``
+    and ``timed_out``.
+    
     Returns:
         JSON list of pipelines
     """
     try:
-        pipelines = _provider_registry.fetch_all_pipelines()
+        fetched = _provider_registry.fetch_all_pipelines_detailed(cached=True)
         
         # Convert Pipeline objects to dictionaries
         result = []
-        for pipeline in pipelines:
+        for pipeline in fetched.pipelines:
             result.append({
                 'id': pipeline.id,
                 'name': pipeline.name,
@@ -49,12 +68,19 @@ def list_pipelines():
                 'started_at': pipeline.started_at,
                 'finished_at': pipeline.finished_at,
                 'url': pipeline.url,
-                'provider': pipeline.provider
+                'provider': pipeline.provider,
+                'age': round(fetched.ages.get(pipeline.provider, 0.0), 3),
+                'stale': pipeline.provider in fetched.circuit_open
             })
         
         return jsonify({
             'pipelines': result,
-            'count': len(result)
+            'count': len(result),
+            'age': round(max(fetched.ages.values(), default=0.0), 3),
+            'partial': fetched.partial,
+            'errors': fetched.errors,
+            'timed_out': fetched.timed_out,
+            'circuit_open': fetched.circuit_open
         }), 200
     
     except Exception as e:
@@ -66,7 +92,7 @@ def list_pipelines():
 @pipelines_bp.route('/providers', methods=['GET'])
 def list_providers():
     """
-    List all registered providers.
+    List all registered providers with their circuit breaker health.
     
     Returns:
         JSON list of provider information
@@ -79,7 +105,8 @@ def list_providers():
             'name': provider.name,
             'type': provider.provider_type,
             'enabled': provider.config.enabled,
-            'refresh_interval': provider.config.refresh_interval
+            'refresh_interval': provider.config.refresh_interval,
+            'circuit': _provider_registry.breaker(provider.name).snapshot()
         })
     
     return jsonify({
@@ -88,6 +115,37 @@ def list_providers():
     }), 200
 
 
+@pipelines_bp.route('/stats', methods=['GET'])
+def get_stats():
+    """
+    Get request coalescing and read cache statistics of the provider registry.
+    
+    Returns:
+        JSON object with coalescing and read cache counters
+    """
+    return jsonify({
+        'single_flight': _provider_registry.single_flight.stats(),
+        'read_cache': _provider_registry.read_cache.stats()
+    }), 200
+
+
+@pipelines_bp.route('/poller', methods=['GET'])
+def get_poller_status():
+    """
+    Get the background poller state and each provider's effective poll interval.
+    
+    Returns:
+        JSON object with running flag and per-provider intervals
+    """
+    if _poller is None:
+        return jsonify({'running': False, 'providers': {}}), 200
+    
+    return jsonify({
+        'running': _poller.running,
+        'providers': _poller.effective_intervals()
+    }), 200
+
+
 @pipelines_bp.route('/<provider_name>/pipelines', methods=['GET'])
 def list_provider_pipelines(provider_name: str):
     """
@@ -107,7 +165,7 @@ def list_provider_pipelines(provider_name: str):
         }), 404
     
     try:
-        pipelines = provider.fetch_pipelines()
+        pipelines, age = _provider_registry.read_pipelines(provider)
         
         result = []
         for pipeline in pipelines:
@@ -124,7 +182,95 @@ def list_provider_pipelines(provider_name: str):
         return jsonify({
             'pipelines': result,
             'provider': provider_name,
-            'count': len(result)
+            'count': len(result),
+            'age': round(age, 3)
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
+@pipelines_bp.route('/<provider_name>/pipelines/<pipeline_id>/runs', methods=['GET'])
+def list_pipeline_runs(provider_name: str, pipeline_id: str):
+    """
+    List recent runs of a pipeline.
+    
+    Args:
+        provider_name: Name of the provider
+        pipeline_id: Pipeline identifier
+        
+    Query Parameters:
+        limit: Maximum number of runs (default 10)
+        
+    Returns:
+        JSON list of runs with the age of the data in seconds
+    """
+    provider = _provider_registry.get(provider_name)
+    
+    if not provider:
+        return jsonify({
+            'error': f'Provider {provider_name} not found'
+        }), 404
+    
+    limit = request.args.get('limit', 10, type=int)
+    
+    try:
+        runs, age = _provider_registry.read_pipeline_runs(provider, pipeline_id, limit)
+        
+        result = []
+        for run in runs:
+            result.append({
+                'id': run.id,
+                'pipeline_id': run.pipeline_id,
+                'status': run.status.value,
+                'started_at': run.started_at,
+                'finished_at': run.finished_at,
+                'duration': run.duration
+            })
+        
+        return jsonify({
+            'runs': result,
+            'pipeline_id': pipeline_id,
+            'count': len(result),
+            'age': round(age, 3)
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
+@pipelines_bp.route('/<provider_name>/pipelines/<pipeline_id>/parameters', methods=['GET'])
+def get_pipeline_parameters(provider_name: str, pipeline_id: str):
+    """
+    Get the input parameters a pipeline accepts when triggered.
+    
+    Args:
+        provider_name: Name of the provider
+        pipeline_id: Pipeline identifier
+        
+    Returns:
+        JSON object with the pipeline parameters
+    """
+    provider = _provider_registry.get(provider_name)
+    
+    if not provider:
+        return jsonify({
+            'error': f'Provider {provider_name} not found'
+        }), 404
+    
+    try:
+        return jsonify({
+            'parameters': _provider_registry.single_flight.do(
+                (provider.name, 'get_available_parameters', (pipeline_id,)),
+                provider.get_available_parameters,
+                pipeline_id
+            ),
+            'pipeline_id': pipeline_id,
+            'provider': provider_name
         }), 200
     
     except Exception as e:
@@ -161,10 +307,16 @@ def trigger_pipeline(provider_name: str, pipeline_id: str):
                 'id': run.id,
                 'pipeline_id': run.pipeline_id,
                 'status': run.status.value,
-                'started_at': run.started_at
+                'started_at': run.started_at,
+                'tracking_id': run.tracking_id
             }
         }), 201
     
+    except ValidationError as e:
+        return jsonify({
+            'error': str(e)
+        }), 422
+    
     except NotImplementedError:
         return jsonify({
             'error': 'Pipeline triggering not implemented for this provider'
@@ -176,6 +328,181 @@ def trigger_pipeline(provider_name: str, pipeline_id: str):
         }), 500
 
 
+@pipelines_bp.route('/triggers/<tracking_id>', methods=['GET'])
+def get_trigger(tracking_id: str):
+    """
+    Get the correlation state of a triggered run.
+    
+    Query parameters:
+        wait: Seconds to wait for the run to be resolved (max 30)
+    
+    Args:
+        tracking_id: Tracking ID returned when triggering
+        
+    Returns:
+        JSON object with the trigger state and the resolved run, if any
+    """
+    handle = get_correlator().get(tracking_id)
+    
+    if not handle:
+        return jsonify({
+            'error': f'Trigger {tracking_id} not found'
+        }), 404
+    
+    wait = min(request.args.get('wait', 0, type=float), 30.0)
+    if wait > 0:
+        handle.wait(wait)
+    
+    return jsonify({
+        'trigger': handle.to_dict()
+    }), 200
+
+
+@pipelines_bp.route('/<provider_name>/runs/<run_id>/jobs', methods=['GET'])
+def list_run_jobs(provider_name: str, run_id: str):
+    """
+    List the jobs and steps of a pipeline run.
+    
+    Jobs of finished runs are served from the local database.
+    
+    Args:
+        provider_name: Name of the provider
+        run_id: Run identifier
+        
+    Returns:
+        JSON list of jobs with their steps
+    """
+    provider = _provider_registry.get(provider_name)
+    
+    if not provider:
+        return jsonify({
+            'error': f'Provider {provider_name} not found'
+        }), 404
+    
+    try:
+        jobs = _provider_registry.single_flight.do(
+            (provider.name, 'get_jobs', (run_id,)),
+            get_job_cache().get_jobs,
+            provider,
+            run_id
+        )
+        
+        result = []
+        for job in jobs:
+            result.append({
+                'id': job.id,
+                'name': job.name,
+                'status': job.status.value,
+                'completed': job.completed,
+                'started_at': job.started_at,
+                'finished_at': job.finished_at,
+                'duration': job.duration,
+                'url': job.url,
+                'runner': job.runner,
+                'steps': [
+                    {
+                        'number': step.number,
+                        'name': step.name,
+                        'status': step.status.value,
+                        'started_at': step.started_at,
+                        'finished_at': step.finished_at,
+                        'duration': step.duration
+                    }
+                    for step in job.steps
+                ]
+            })
+        
+        return jsonify({
+            'jobs': result,
+            'run_id': run_id,
+            'count': len(result)
+        }), 200
+    
+    except NotImplementedError:
+        return jsonify({
+            'error': 'Run jobs not implemented for this provider'
+        }), 501
+    
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
+@pipelines_bp.route('/<provider_name>/runs/<run_id>/logs', methods=['GET'])
+def get_run_logs(provider_name: str, run_id: str):
+    """
+    Download or tail the logs of a pipeline run.
+    
+    Logs are streamed in chunks and never buffered in memory. Without
+    query parameters the zip archive is passed through as it downloads;
+    ``job`` extracts one job's log and ``tail`` keeps only the last lines
+    of each log file. Archives of finished run attempts are cached on
+    disk; the run's attempt and state are read from the provider on each
+    request, so a re-run is never answered with the previous attempt.
+    
+    Args:
+        provider_name: Name of the provider
+        run_id: Run identifier
+        
+    Query Parameters:
+        job: Job name to extract
+        tail: Number of trailing lines per log file
+        
+    Returns:
+        Zip archive or plain text log stream
+    """
+    provider = _provider_registry.get(provider_name)
+    
+    if not provider:
+        return jsonify({
+            'error': f'Provider {provider_name} not found'
+        }), 404
+    
+    job = request.args.get('job')
+    tail = request.args.get('tail', type=int)
+    log_cache = get_log_cache()
+    
+    try:
+        run = provider.fetch_run(run_id)
+        attempt = run.attempt if run is not None else None
+        finished = run is not None and run.finished_at is not None
+        archive = log_cache.get(provider.name, run_id, attempt) if finished else None
+        temporary = False
+        
+        if archive is None:
+            if job is None and tail is None and not finished:
+                # Nothing to extract and nothing worth keeping: pass through
+                return Response(
+                    stream_with_context(provider.stream_run_logs(run_id)),
+                    mimetype='application/zip',
+                    headers={'Content-Disposition': f'attachment; filename={run_id}-logs.zip'}
+                )
+            archive, temporary = log_cache.fetch(provider, run_id, keep=finished, attempt=attempt)
+        
+        if job is None and tail is None:
+            return Response(
+                stream_with_context(iter_file(archive)),
+                mimetype='application/zip',
+                headers={'Content-Disposition': f'attachment; filename={run_id}-logs.zip'}
+            )
+        
+        return Response(
+            stream_with_context(iter_logs(archive, job=job, tail=tail, remove=temporary)),
+            mimetype='text/plain'
+        )
+    
+    except NotImplementedError:
+        return jsonify({
+            'error': 'Run logs not implemented for this provider'
+        }), 501
+    
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
 @pipelines_bp.route('/<provider_name>/runs/<run_id>/cancel', methods=['POST'])
 def cancel_run(provider_name: str, run_id: str):
     """
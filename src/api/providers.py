@@ -9,9 +9,9 @@ from flask import Blueprint, jsonify, request
 from typing import Dict, Any
 
 from src.providers.registry import ProviderRegistry
-from src.providers.base import ProviderConfig
-from src.providers.github import GitHubProvider
+from src.providers.plugins import build_provider, get_provider_types
 from src.security.keyring_manager import KeyringManager
+from src.utils.errors import ConfigurationError
 from src.api.pipelines import get_registry
 
 providers_bp = Blueprint('providers', __name__, url_prefix='/api/v1/providers')
@@ -32,6 +32,10 @@ def add_provider():
         "enabled": true,
         "refresh_interval": 30
     }
+    
+    Organization providers use "type": "github_org" with "org" instead of
+    "owner"/"repo", plus optional "include", "exclude", "include_archived"
+    and "max_concurrency" settings.
     """
     try:
         data = request.json
@@ -56,32 +60,13 @@ def add_provider():
         if token:
             KeyringManager.set_token(provider_type, token)
         
-        # Create provider config (without token in config dict)
-        config_dict = {
-            'owner': data.get('owner'),
-            'repo': data.get('repo'),
-            'base_url': data.get('base_url', 'https://api.github.com')
-        }
-        
-        # Get token from keyring if not provided
-        if not token:
-            stored_token = KeyringManager.get_token(provider_type)
-            if stored_token:
-                config_dict['token'] = stored_token
-        
-        config = ProviderConfig(
-            name=name,
-            provider_type=provider_type,
-            enabled=data.get('enabled', True),
-            refresh_interval=data.get('refresh_interval', 30),
-            config=config_dict
-        )
-        
-        # Create provider instance based on type
-        if provider_type == 'github':
-            provider = GitHubProvider(config)
-        else:
-            return jsonify({'error': f'Unsupported provider type: {provider_type}'}), 400
+        # Create provider instance from its type plugin (without the request
+        # token in its config; a stored token is used when none is given)
+        stored_token = None if token else KeyringManager.get_token(provider_type)
+        try:
+            provider = build_provider(name, provider_type, data, token=stored_token)
+        except ConfigurationError as e:
+            return jsonify({'error': str(e)}), 400
         
         # Validate credentials
         if not provider.validate_credentials():
@@ -125,6 +110,17 @@ def list_providers():
     }), 200
 
 
+@providers_bp.route('/types', methods=['GET'])
+def list_provider_types():
+    """List the provider types available from installed plugins."""
+    types = get_provider_types().types()
+    
+    return jsonify({
+        'types': types,
+        'count': len(types)
+    }), 200
+
+
 @providers_bp.route('/<provider_name>', methods=['DELETE'])
 def remove_provider(provider_name: str):
     """Remove a provider."""
@@ -164,11 +160,9 @@ def update_token(provider_name: str):
         # Store token in keyring
         KeyringManager.set_token(provider.provider_type, data['token'])
         
-        # Update provider config
-        provider.token = data['token']
-        provider.session.headers.update({
-            'Authorization': f'token {data["token"]}'
-        })
+        # Update provider config; sessions are shared, so headers are built per request
+        target = getattr(provider, 'async_provider', provider)
+        target.token = data['token']
         
         # Validate new credentials
         if not provider.validate_credentials():
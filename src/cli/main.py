@@ -5,15 +5,19 @@ Provides beautiful command-line interface for FlowForge operations.
 """
 
 import click
+import requests
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from src.config import config
+from src.utils.errors import ConfigurationError
 from src.utils.logger import get_logger
 from src.providers.registry import ProviderRegistry
 from src.providers.base import ProviderConfig
-from src.providers.github import GitHubProvider
+from src.providers.plugins import get_provider_types
+from src.providers.run_correlation import get_correlator
 from src.security.keyring_manager import KeyringManager
 from src.api.pipelines import get_registry
 
@@ -32,6 +36,36 @@ def cli():
     pass
 
 
+def _server_circuits() -> dict:
+    """
+    Read provider circuit breaker states from the running server.
+    
+    The breakers live in the server process, so a local registry never
+    sees their traffic.
+    
+    Returns:
+        Circuit snapshots keyed by provider name, empty if the server is unreachable
+    """
+    try:
+        response = requests.get(f"{config.API_URL}/api/v1/pipelines/providers", timeout=3)
+        response.raise_for_status()
+        return {entry['name']: entry['circuit'] for entry in response.json()['providers']}
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logger.debug(f"Could not read circuit states from {config.API_URL}: {e}")
+        return {}
+
+
+def _circuit_text(circuit) -> str:
+    """Render a circuit snapshot for the status table."""
+    if circuit is None:
+        return "[dim]n/a[/dim]"
+    color = {'closed': 'green', 'half_open': 'yellow', 'open': 'red'}[circuit['state']]
+    text = f"[{color}]{circuit['state'].replace('_', '-')}[/{color}]"
+    if circuit['retry_in'] is not None:
+        text += f" [dim](retry in {circuit['retry_in']}s)[/dim]"
+    return text
+
+
 @cli.command()
 def status():
     """Show FlowForge status and registered providers."""
@@ -52,6 +86,9 @@ def status():
     table.add_column("Status", justify="center")
     table.add_column("Refresh", style="yellow")
     table.add_column("Token", justify="center")
+    table.add_column("Circuit", justify="center")
+    
+    circuits = _server_circuits()
     
     for provider in providers:
         status_icon = "✓" if provider.config.enabled else "✗"
@@ -64,10 +101,13 @@ def status():
             provider.provider_type,
             f"[{status_color}]{status_icon}[/{status_color}]",
             f"{provider.config.refresh_interval}s",
-            "[green]✓" if has_token else "[red]✗"
+            "[green]✓" if has_token else "[red]✗",
+            _circuit_text(circuits.get(provider.name))
         )
     
     console.print(table)
+    if not circuits:
+        console.print(f"[dim]Circuit state unavailable: server at {config.API_URL} not reachable[/dim]")
     console.print(f"\n[dim]Total providers: {len(providers)}[/dim]\n")
 
 
@@ -79,11 +119,11 @@ def provider():
 
 @provider.command('add')
 @click.option('--name', prompt='Provider name', help='Unique name for this provider')
-@click.option('--type', 'provider_type', type=click.Choice(['github'], case_sensitive=False),
+@click.option('--type', 'provider_type', type=click.Choice(get_provider_types().types(), case_sensitive=False),
               prompt='Provider type', help='Type of CI/CD provider')
 @click.option('--token', prompt=True, hide_input=True, help='API token')
 @click.option('--owner', prompt='Owner/Organization', help='GitHub owner or organization')
-@click.option('--repo', prompt='Repository', help='Repository name')
+@click.option('--repo', prompt='Repository', default='', help='Repository name (not used for github_org)')
 @click.option('--enabled/--disabled', default=True, help='Enable this provider')
 @click.option('--refresh-interval', default=30, type=int, help='Polling interval in seconds')
 def add_provider(name, provider_type, token, owner, repo, enabled, refresh_interval):
@@ -101,15 +141,16 @@ def add_provider(name, provider_type, token, owner, repo, enabled, refresh_inter
             config={
                 'owner': owner,
                 'repo': repo,
+                'org': owner if provider_type.lower() == 'github_org' else None,
                 'base_url': 'https://api.github.com'
             }
         )
         
-        # Create provider instance
-        if provider_type.lower() == 'github':
-            provider = GitHubProvider(config)
-        else:
-            console.print(f"[red]Unsupported provider type: {provider_type}[/red]")
+        # Create provider instance from its type plugin
+        try:
+            provider = get_provider_types().create(config)
+        except ConfigurationError as e:
+            console.print(f"[red]{e}[/red]")
             return
         
         # Validate credentials
@@ -191,7 +232,12 @@ def list_pipelines(provider):
             return
         pipelines = provider_instance.fetch_pipelines()
     else:
-        pipelines = registry.fetch_all_pipelines()
+        fetched = registry.fetch_all_pipelines_detailed()
+        pipelines = fetched.pipelines
+        for name, error in fetched.errors.items():
+            console.print(f"[red]Error fetching pipelines from {name}: {error}[/red]")
+        for name in fetched.timed_out:
+            console.print(f"[yellow]Provider '{name}' did not answer in time[/yellow]")
     
     if not pipelines:
         console.print("[yellow]No pipelines found[/yellow]\n")
@@ -232,7 +278,8 @@ def list_pipelines(provider):
 @click.argument('pipeline_id')
 @click.option('--ref', default='main', help='Branch or tag')
 @click.option('--inputs', help='JSON string of workflow inputs')
-def trigger_pipeline(provider_name, pipeline_id, ref, inputs):
+@click.option('--wait', default=0, type=int, help='Seconds to wait for the triggered run to appear')
+def trigger_pipeline(provider_name, pipeline_id, ref, inputs, wait):
     """Trigger a pipeline."""
     import json
     
@@ -250,8 +297,15 @@ def trigger_pipeline(provider_name, pipeline_id, ref, inputs):
         
         with console.status(f"[bold green]Triggering pipeline {pipeline_id}..."):
             run = provider.trigger_pipeline(pipeline_id, parameters)
+            
+            if wait and run.tracking_id:
+                handle = get_correlator().get(run.tracking_id)
+                run = (handle.wait(wait) if handle else None) or run
+            
             console.print(f"[green]✓ Pipeline triggered successfully[/green]")
             console.print(f"Run ID: {run.id}")
+            if run.tracking_id:
+                console.print(f"Tracking ID: {run.tracking_id}")
             console.print(f"Status: {run.status.value}\n")
     
     except Exception as e:
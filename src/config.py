@@ -20,6 +20,8 @@ class Config:
     # Server settings
     HOST: str = os.getenv('HOST', '0.0.0.0')
     PORT: int = int(os.getenv('PORT', '8000'))
+    # Base URL of the running server, used by the CLI for live state
+    API_URL: str = os.getenv('FLOWFORGE_API_URL', f'http://127.0.0.1:{PORT}')
     
     # Database settings (if needed)
     DATABASE_URL: Optional[str] = os.getenv('DATABASE_URL')
@@ -28,6 +30,32 @@ class Config:
     GITHUB_TOKEN: Optional[str] = os.getenv('GITHUB_TOKEN')
     GITHUB_REPO: Optional[str] = os.getenv('GITHUB_REPO')
     
+    # HTTP transport settings
+    HTTP_POOL_MAXSIZE: int = int(os.getenv('HTTP_POOL_MAXSIZE', '20'))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+    HTTP_READ_TIMEOUT: float = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+    HTTP_MAX_RETRIES: int = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+    HTTP_BACKOFF_FACTOR: float = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))
+    
+    # Pipeline fetch settings
+    FETCH_MAX_CONCURRENCY: int = int(os.getenv('FETCH_MAX_CONCURRENCY', '8'))
+    FETCH_DEADLINE: float = float(os.getenv('FETCH_DEADLINE', '20'))
+    READ_CACHE_MAX_ENTRIES: int = int(os.getenv('READ_CACHE_MAX_ENTRIES', '1024'))
+    POLL_JITTER: float = float(os.getenv('POLL_JITTER', '0.1'))
+    POLL_WORKERS: int = int(os.getenv('POLL_WORKERS', '4'))
+    POLL_WRITE_QUEUE_SIZE: int = int(os.getenv('POLL_WRITE_QUEUE_SIZE', '64'))
+    GRAPHQL_RESEED_INTERVAL: float = float(os.getenv('GRAPHQL_RESEED_INTERVAL', '600'))
+    
+    # Provider circuit breaker settings
+    CIRCUIT_FAILURE_RATE: float = float(os.getenv('CIRCUIT_FAILURE_RATE', '0.5'))
+    CIRCUIT_MIN_CALLS: int = int(os.getenv('CIRCUIT_MIN_CALLS', '5'))
+    CIRCUIT_SLOW_CALL_SECONDS: float = float(os.getenv('CIRCUIT_SLOW_CALL_SECONDS', '10'))
+    CIRCUIT_OPEN_SECONDS: float = float(os.getenv('CIRCUIT_OPEN_SECONDS', '30'))
+    
+    # Run log archive cache
+    LOG_CACHE_DIR: Optional[str] = os.getenv('LOG_CACHE_DIR')
+    LOG_CACHE_MAX_BYTES: int = int(os.getenv('LOG_CACHE_MAX_BYTES', str(1024 ** 3)))
+    
     # API settings
     API_KEY: Optional[str] = os.getenv('API_KEY')
     API_SECRET: Optional[str] = os.getenv('API_SECRET')
@@ -0,0 +1,207 @@
+"""
+Database-backed cache of run jobs and steps.
+
+Jobs are cached per run attempt. Once an attempt has finished (as
+reported by the provider's run endpoint) its jobs never change, so they
+are fetched once and served from the local database afterwards. Jobs of
+attempts still in progress are refreshed on demand, rewriting only the
+jobs that have not completed yet. A re-run starts a new attempt with new
+jobs, which replace the cached ones.
+"""
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from src.database.db import DatabaseManager, get_db_manager
+from src.database.models import PipelineJobModel
+from src.providers.base import BaseProvider, PipelineJob, PipelineRun, PipelineStatus, PipelineStep
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp into a naive UTC datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    """Format a stored datetime as an API timestamp."""
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ') if value else None
+
+
+class RunJobCache:
+    """
+    Cache of run jobs in the local database.
+    
+    A run's jobs are served from a single database read once its current
+    attempt has finished; until then they are fetched from the provider
+    and merged.
+    """
+    
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        """
+        Initialize job cache.
+        
+        Args:
+            db: Database manager, defaults to the global one
+        """
+        self.db = db or get_db_manager()
+    
+    def get_jobs(
+        self,
+        provider: BaseProvider,
+        run_id: str,
+        run: Optional[PipelineRun] = None
+    ) -> List[PipelineJob]:
+        """
+        Get the jobs of a run, from the database when they are final.
+        
+        The run's current attempt and state are read from the provider
+        (a conditional request) unless given. Jobs are cached per attempt
+        and become final only once that attempt has finished, so jobs
+        added while it runs and jobs of a later re-run are still fetched.
+        
+        Args:
+            provider: Provider owning the run
+            run_id: Run identifier
+            run: Current state of the run, fetched from the provider when
+                 not given
+        
+        Returns:
+            List of PipelineJob objects with their steps
+        """
+        run_id = str(run_id)
+        if run is None:
+            run = provider.fetch_run(run_id)
+        attempt = run.attempt if run is not None else None
+        
+        with self.db.get_session() as session:
+            rows = self._query(session, provider.name, run_id).filter_by(run_attempt=attempt).order_by(
+                PipelineJobModel.started_at, PipelineJobModel.id
+            ).all()
+            if rows and all(row.run_completed for row in rows):
+                return [self._to_job(row) for row in rows]
+        
+        # The provider is asked without a transaction held open
+        jobs = provider.fetch_run_jobs(run_id)
+        finished = run is not None and run.finished_at is not None
+        final = finished and bool(jobs) and all(job.completed for job in jobs)
+        
+        with self.db.get_session() as session:
+            written = self._store(session, provider.name, run_id, attempt, jobs, final)
+            session.commit()
+        logger.debug(f"{provider.name}: cached {len(jobs)} jobs of run {run_id} ({written} written, final={final})")
+        return jobs
+    
+    def _store(self, session, provider_name: str, run_id: str, attempt: Optional[int],
+               jobs: List[PipelineJob], final: bool) -> int:
+        """Write the jobs of a run attempt, dropping rows of other attempts."""
+        rows = self._query(session, provider_name, run_id).all()
+        existing = {row.id: row for row in rows if row.run_attempt == attempt}
+        for row in rows:
+            if row.run_attempt != attempt:
+                session.delete(row)
+        
+        written = 0
+        for job in jobs:
+            row = existing.get(job.id)
+            if row is None:
+                row = PipelineJobModel(id=job.id, provider=provider_name, run_id=run_id, run_attempt=attempt)
+                session.add(row)
+            elif row.completed:
+                # Finished jobs never change; only mark the cache final
+                row.run_completed = final
+                continue
+            self._fill(row, job, final)
+            written += 1
+        return written
+    
+    def invalidate(self, provider_name: str, run_id: str) -> None:
+        """
+        Drop the cached jobs of a run, e.g. when it is re-run.
+        
+        Args:
+            provider_name: Provider owning the run
+            run_id: Run identifier
+        """
+        with self.db.get_session() as session:
+            self._query(session, provider_name, str(run_id)).delete()
+            session.commit()
+    
+    @staticmethod
+    def _query(session, provider_name: str, run_id: str):
+        """Query the cached job rows of a run."""
+        return session.query(PipelineJobModel).filter_by(provider=provider_name, run_id=run_id)
+    
+    @staticmethod
+    def _fill(row: PipelineJobModel, job: PipelineJob, final: bool) -> None:
+        """Copy a job into its database row."""
+        row.name = job.name
+        row.status = job.status.value
+        row.completed = job.completed
+        row.run_completed = final
+        row.started_at = _parse_time(job.started_at)
+        row.finished_at = _parse_time(job.finished_at)
+        row.duration = job.duration
+        row.url = job.url
+        row.runner = job.runner
+        row.steps = [
+            {
+                'number': step.number,
+                'name': step.name,
+                'status': step.status.value,
+                'started_at': step.started_at,
+                'finished_at': step.finished_at,
+                'duration': step.duration
+            }
+            for step in job.steps
+        ]
+    
+    @staticmethod
+    def _to_job(row: PipelineJobModel) -> PipelineJob:
+        """Build a job from its database row."""
+        return PipelineJob(
+            id=row.id,
+            run_id=row.run_id,
+            name=row.name,
+            status=PipelineStatus(row.status),
+            completed=bool(row.completed),
+            started_at=_format_time(row.started_at),
+            finished_at=_format_time(row.finished_at),
+            duration=row.duration,
+            url=row.url,
+            runner=row.runner,
+            steps=[
+                PipelineStep(
+                    number=step['number'],
+                    name=step['name'],
+                    status=PipelineStatus(step['status']),
+                    started_at=step.get('started_at'),
+                    finished_at=step.get('finished_at'),
+                    duration=step.get('duration')
+                )
+                for step in row.steps or []
+            ]
+        )
+
+
+# Global job cache instance
+_job_cache: Optional[RunJobCache] = None
+
+
+def get_job_cache() -> RunJobCache:
+    """
+    Get global run job cache instance.
+    
+    Returns:
+        RunJobCache instance
+    """
+    global _job_cache
+    
+    if _job_cache is None:
+        _job_cache = RunJobCache()
+    
+    return _job_cache
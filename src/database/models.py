@@ -80,3 +80,65 @@ class PipelineRunModel(Base):
     url = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+
+class PipelineJobModel(Base):
+    """
+    Database model for jobs of pipeline runs.
+    
+    Completed jobs never change, so once a run attempt has finished its
+    jobs are served from here without asking the provider again.
+    """
+    __tablename__ = 'pipeline_jobs'
+    
+    id = Column(String, primary_key=True)
+    provider = Column(String, nullable=False)
+    run_id = Column(String, nullable=False, index=True)
+    run_attempt = Column(Integer)  # attempt the jobs belong to, re-runs start a new one
+    name = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    completed = Column(Boolean, default=False)  # job finished
+    run_completed = Column(Boolean, default=False)  # run attempt finished, cache is final
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    duration = Column(Float)
+    url = Column(String)
+    runner = Column(String)
+    steps = Column(JSON)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SyncCursorModel(Base):
+    """
+    Database model for run-history sync cursors.
+    
+    One row per workflow records where the last incremental sync of its
+    run history stopped, so the next sync only asks for newer runs.
+    """
+    __tablename__ = 'sync_cursors'
+    
+    provider = Column(String, primary_key=True)
+    pipeline_id = Column(String, primary_key=True)
+    since = Column(DateTime, nullable=False)  # created>= bound of the next sync
+    last_run_id = Column(String)  # newest run seen
+    last_run_created = Column(DateTime)
+    in_progress = Column(Boolean, default=False)  # runs since the cursor still running
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class PipelineFingerprintModel(Base):
+    """
+    Database model for pipeline change-detection fingerprints.
+    
+    One row per pipeline holds a digest of the fields the poller compares,
+    plus the values needed to describe a change, so unchanged pipelines
+    are recognized across restarts without rewriting them.
+    """
+    __tablename__ = 'pipeline_fingerprints'
+    
+    provider = Column(String, primary_key=True)
+    pipeline_id = Column(String, primary_key=True)
+    digest = Column(String, nullable=False)  # hash of status, commit, run id and timestamps
+    status = Column(String)
+    run_id = Column(String)
+    commit = Column(String)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
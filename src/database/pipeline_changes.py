@@ -0,0 +1,318 @@
+"""
+Pipeline change detection.
+
+Each pipeline is reduced to a compact fingerprint: a short digest of its
+status, commit, latest run ID and timestamps, plus the status, run ID and
+commit needed to describe a change. Fingerprints are kept in memory and
+in the database. A fresh listing is compared against them so only
+pipelines that really changed are written, and each change is reported
+as a typed event instead of leaving consumers to diff snapshots.
+Pipelines missing from a listing are reported as removed and their
+fingerprints are deleted.
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.database.db import DatabaseManager, get_db_manager
+from src.database.models import PipelineFingerprintModel
+from src.providers.base import Pipeline, PipelineStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeType(Enum):
+    """Kinds of pipeline changes."""
+    ADDED = "added"
+    STATUS_CHANGED = "status_changed"
+    NEW_RUN = "new_run"
+    NEW_COMMIT = "new_commit"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Compact state of a pipeline used to detect changes."""
+    digest: str
+    status: str
+    run_id: Optional[str]
+    commit: Optional[str]
+
+
+@dataclass
+class PipelineChange:
+    """
+    A change of one pipeline between two polls.
+    
+    Attributes:
+        type: Kind of change
+        provider: Provider name
+        pipeline: Pipeline as it is now; for removed pipelines, its last
+            known state
+        previous: Previous status, run ID or commit, depending on the type
+        current: Current status, run ID or commit, depending on the type
+    """
+    type: ChangeType
+    provider: str
+    pipeline: Pipeline
+    previous: Optional[str] = None
+    current: Optional[str] = None
+
+
+@dataclass
+class PipelineDiff:
+    """Pipelines of one provider listing that changed since the last poll."""
+    provider: str
+    changed: List[Pipeline] = field(default_factory=list)
+    fingerprints: Dict[str, Fingerprint] = field(default_factory=dict)
+    events: List[PipelineChange] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
+def fingerprint(pipeline: Pipeline) -> Fingerprint:
+    """
+    Compute the fingerprint of a pipeline.
+    
+    Args:
+        pipeline: Pipeline to fingerprint
+    
+    Returns:
+        Fingerprint of the pipeline
+    """
+    fields = (
+        pipeline.status.value,
+        pipeline.commit or '',
+        pipeline.run_id or '',
+        pipeline.started_at or '',
+        pipeline.finished_at or ''
+    )
+    digest = hashlib.blake2b('\x1f'.join(fields).encode(), digest_size=8).hexdigest()
+    return Fingerprint(digest=digest, status=pipeline.status.value, run_id=pipeline.run_id, commit=pipeline.commit)
+
+
+def _describe(provider: str, pipeline: Pipeline, old: Optional[Fingerprint], new: Fingerprint) -> List[PipelineChange]:
+    """Type the change between two fingerprints of a pipeline."""
+    if old is None:
+        return [PipelineChange(ChangeType.ADDED, provider, pipeline, current=new.status)]
+    
+    events = []
+    if old.status != new.status:
+        events.append(PipelineChange(ChangeType.STATUS_CHANGED, provider, pipeline, old.status, new.status))
+    if old.run_id != new.run_id:
+        events.append(PipelineChange(ChangeType.NEW_RUN, provider, pipeline, old.run_id, new.run_id))
+    if old.commit != new.commit:
+        events.append(PipelineChange(ChangeType.NEW_COMMIT, provider, pipeline, old.commit, new.commit))
+    if not events:
+        events.append(PipelineChange(ChangeType.UPDATED, provider, pipeline))
+    return events
+
+
+def _removed(provider: str, pipeline_id: str, old: Fingerprint) -> PipelineChange:
+    """Describe a pipeline that disappeared, from its last fingerprint."""
+    pipeline = Pipeline(
+        id=pipeline_id,
+        name=pipeline_id,
+        status=PipelineStatus(old.status),
+        repository='',
+        branch='',
+        commit=old.commit or '',
+        provider=provider,
+        run_id=old.run_id
+    )
+    return PipelineChange(ChangeType.REMOVED, provider, pipeline, previous=old.status)
+
+
+class ChangeDetector:
+    """
+    Compares pipeline listings against stored fingerprints.
+    
+    Fingerprints of a provider are loaded from the database on its first
+    listing and kept in memory afterwards. ``diff`` updates the memory
+    right away; if the following write fails, ``forget`` drops the
+    provider so its state is reloaded from the database and the changes
+    are reported again.
+    """
+    
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        """
+        Initialize change detector.
+        
+        Args:
+            db: Database manager, defaults to the global one
+        """
+        self.db = db or get_db_manager()
+        self._known: Dict[str, Dict[str, Fingerprint]] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[PipelineChange], None]] = []
+    
+    def _load(self, provider: str) -> Dict[str, Fingerprint]:
+        """Read the stored fingerprints of a provider."""
+        with self.db.get_session() as session:
+            return {
+                row.pipeline_id: Fingerprint(digest=row.digest, status=row.status, run_id=row.run_id, commit=row.commit)
+                for row in session.query(PipelineFingerprintModel).filter_by(provider=provider)
+            }
+    
+    def diff(self, provider: str, pipelines: Iterable[Pipeline]) -> PipelineDiff:
+        """
+        Find the pipelines of a listing that changed since the last one.
+        
+        Args:
+            provider: Provider name
+            pipelines: Complete pipeline listing of the provider
+        
+        Returns:
+            PipelineDiff with changed pipelines, their new fingerprints,
+            removed pipeline IDs and typed change events
+        """
+        with self._lock:
+            known = self._known.get(provider)
+        if known is None:
+            known = self._load(provider)
+        
+        result = PipelineDiff(provider=provider)
+        seen = set()
+        for pipeline in pipelines:
+            seen.add(pipeline.id)
+            new = fingerprint(pipeline)
+            old = known.get(pipeline.id)
+            if old is not None and old.digest == new.digest:
+                continue
+            result.changed.append(pipeline)
+            result.fingerprints[pipeline.id] = new
+            result.events.extend(_describe(provider, pipeline, old, new))
+        
+        for pipeline_id, old in known.items():
+            if pipeline_id not in seen:
+                result.removed.append(pipeline_id)
+                result.events.append(_removed(provider, pipeline_id, old))
+        
+        with self._lock:
+            self._known[provider] = {
+                pipeline_id: state
+                for pipeline_id, state in {**known, **result.fingerprints}.items()
+                if pipeline_id in seen
+            }
+        return result
+    
+    def forget(self, provider: str) -> None:
+        """
+        Drop the in-memory fingerprints of a provider.
+        
+        Args:
+            provider: Provider name
+        """
+        with self._lock:
+            self._known.pop(provider, None)
+    
+    @staticmethod
+    def save(session, diffs: Iterable[PipelineDiff]) -> int:
+        """
+        Store the new fingerprints of diffs in one executemany upsert.
+        
+        Fingerprints of removed pipelines are deleted. The caller commits.
+        
+        Args:
+            session: Database session
+            diffs: Diffs returned by ``diff``
+        
+        Returns:
+            Number of fingerprints written
+        """
+        diffs = list(diffs)
+        table = PipelineFingerprintModel.__table__
+        for result in diffs:
+            if result.removed:
+                session.execute(table.delete().where(
+                    table.c.provider == result.provider,
+                    table.c.pipeline_id.in_(result.removed)
+                ))
+        
+        rows = [
+            {
+                'provider': result.provider,
+                'pipeline_id': pipeline_id,
+                'digest': state.digest,
+                'status': state.status,
+                'run_id': state.run_id,
+                'commit': state.commit
+            }
+            for result in diffs
+            for pipeline_id, state in result.fingerprints.items()
+        ]
+        if not rows:
+            return 0
+        
+        stmt = sqlite_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.provider, table.c.pipeline_id],
+            set_={
+                'digest': stmt.excluded.digest,
+                'status': stmt.excluded.status,
+                'run_id': stmt.excluded.run_id,
+                'commit': stmt.excluded.commit,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        session.execute(stmt, rows)
+        return len(rows)
+    
+    def add_listener(self, listener: Callable[[PipelineChange], None]) -> None:
+        """
+        Subscribe to pipeline change events.
+        
+        Args:
+            listener: Called with each PipelineChange once it is stored
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[PipelineChange], None]) -> None:
+        """
+        Unsubscribe from pipeline change events.
+        
+        Args:
+            listener: Previously added listener
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def publish(self, events: Iterable[PipelineChange]) -> None:
+        """
+        Deliver change events to listeners.
+        
+        Args:
+            events: Change events, in order
+        """
+        for event in events:
+            logger.debug(f"{event.provider}/{event.pipeline.id}: {event.type.value} {event.previous} -> {event.current}")
+            for listener in list(self._listeners):
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.error(f"Change listener failed on {event.type.value} of {event.pipeline.id}: {e}")
+
+
+# Global change detector instance
+_change_detector: Optional[ChangeDetector] = None
+
+
+def get_change_detector() -> ChangeDetector:
+    """
+    Get global change detector instance.
+    
+    Returns:
+        ChangeDetector instance
+    """
+    global _change_detector
+    
+    if _change_detector is None:
+        _change_detector = ChangeDetector()
+    
+    return _change_detector
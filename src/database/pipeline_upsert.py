@@ -0,0 +1,115 @@
+"""
+Set-based pipeline cache writes.
+
+Pipelines are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+statement executed once over all rows (executemany), instead of looking
+up and updating ORM objects one pipeline at a time. Name, repository
+and URL are kept from the first insert, as the row-by-row path did.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.database.models import PipelineModel
+from src.providers.base import Pipeline
+
+logger = logging.getLogger(__name__)
+
+# Columns refreshed when a cached pipeline is seen again
+UPDATED_COLUMNS = (
+    'status', 'branch', 'commit', 'commit_message', 'author',
+    'started_at', 'finished_at', 'updated_at'
+)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp into a datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def pipeline_rows(pipelines: Iterable[Pipeline]) -> List[Dict[str, Any]]:
+    """
+    Convert pipelines into rows of the pipelines table.
+    
+    Pipelines that can't be converted are logged and skipped.
+    
+    Args:
+        pipelines: Pipelines to convert
+    
+    Returns:
+        List of column dictionaries
+    """
+    now = datetime.utcnow()
+    rows = []
+    for pipeline in pipelines:
+        try:
+            rows.append({
+                'id': pipeline.id,
+                'name': pipeline.name,
+                'status': pipeline.status.value,
+                'repository': pipeline.repository,
+                'branch': pipeline.branch,
+                'commit': pipeline.commit,
+                'commit_message': pipeline.commit_message,
+                'author': pipeline.author,
+                'url': pipeline.url,
+                'started_at': _parse_time(pipeline.started_at),
+                'finished_at': _parse_time(pipeline.finished_at),
+                'created_at': now,
+                'updated_at': now
+            })
+        except Exception as e:
+            logger.error(f"Error saving pipeline {pipeline.id}: {e}")
+    return rows
+
+
+def upsert_pipelines(session, pipelines: Iterable[Pipeline]) -> int:
+    """
+    Insert or update cached pipelines in one executemany statement.
+    
+    The caller commits, so several providers can share a transaction.
+    
+    Args:
+        session: Database session
+        pipelines: Pipelines to save
+    
+    Returns:
+        Number of rows written
+    """
+    rows = pipeline_rows(pipelines)
+    if not rows:
+        return 0
+    
+    stmt = sqlite_insert(PipelineModel.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PipelineModel.__table__.c.id],
+        set_={column: stmt.excluded[column] for column in UPDATED_COLUMNS}
+    )
+    session.execute(stmt, rows)
+    return len(rows)
+
+
+def delete_pipelines(session, pipeline_ids: Iterable[str]) -> int:
+    """
+    Delete cached pipelines in one statement.
+    
+    The caller commits.
+    
+    Args:
+        session: Database session
+        pipeline_ids: IDs of the pipelines to delete
+    
+    Returns:
+        Number of rows deleted
+    """
+    pipeline_ids = list(pipeline_ids)
+    if not pipeline_ids:
+        return 0
+    
+    table = PipelineModel.__table__
+    return session.execute(table.delete().where(table.c.id.in_(pipeline_ids))).rowcount
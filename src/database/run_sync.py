@@ -0,0 +1,281 @@
+"""
+Incremental run-history sync.
+
+Each workflow keeps a cursor in the database. A sync asks the provider
+only for runs created at or after the cursor and upserts them into the
+run history, so the steady-state cost of a refresh follows activity
+rather than history length. The cursor is held back at the oldest run
+still in progress, so runs that change after creation are picked up
+again until they finish. Runs older than the cursor that changed since
+they were stored (a listed latest run whose status or finish time
+differs from its row, or a row reopened by a re-run) are fetched one by
+one and upserted as well.
+
+A sync runs in two phases: ``collect`` reads the cursors and fetches new
+runs from the provider without holding a transaction open, and
+``write`` upserts the fetched runs and advances the cursors in one short
+database session.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import or_
+
+from src.database.db import DatabaseManager, get_db_manager
+from src.database.models import PipelineRunModel, SyncCursorModel
+from src.providers.base import BaseProvider, Pipeline, PipelineRun
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp into a naive UTC datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+@dataclass
+class RunBatch:
+    """Runs fetched for one workflow, waiting to be written."""
+    provider: str
+    pipeline_id: str
+    since: datetime
+    runs: List[PipelineRun]
+
+
+class RunHistorySync:
+    """
+    Synchronizes run history into the database using per-workflow cursors.
+    """
+    
+    def __init__(self, db: Optional[DatabaseManager] = None, initial_lookback: timedelta = timedelta(days=7)):
+        """
+        Initialize run-history sync.
+        
+        Args:
+            db: Database manager, defaults to the global one
+            initial_lookback: History fetched for a workflow without a cursor
+        """
+        self.db = db or get_db_manager()
+        self.initial_lookback = initial_lookback
+    
+    def sync(self, provider: BaseProvider, pipelines: Iterable[Pipeline]) -> Dict[str, int]:
+        """
+        Sync the run history of the workflows of a provider.
+        
+        Workflows whose latest run is already known and unchanged, and
+        that have no run in progress, are skipped without a request.
+        
+        Args:
+            provider: Provider owning the workflows
+            pipelines: Freshly fetched workflows with their latest run
+        
+        Returns:
+            Dictionary of workflow ID -> number of runs inserted or updated
+        """
+        batches = self.collect(provider, pipelines)
+        with self.db.get_session() as session:
+            return self.write(session, batches)
+    
+    def collect(self, provider: BaseProvider, pipelines: Iterable[Pipeline]) -> List[RunBatch]:
+        """
+        Fetch the runs created since each workflow's cursor.
+        
+        The cursors are read in a short session that is closed before
+        any provider request is made.
+        
+        Args:
+            provider: Provider owning the workflows
+            pipelines: Freshly fetched workflows with their latest run
+        
+        Returns:
+            Fetched runs per workflow that is not current
+        """
+        pipelines = list(pipelines)
+        with self.db.get_session() as session:
+            cursors = {
+                cursor.pipeline_id: cursor
+                for cursor in session.query(SyncCursorModel).filter_by(provider=provider.name)
+            }
+            stored = self._stored_runs(session, pipelines)
+        
+        batches = []
+        for pipeline in pipelines:
+            cursor = cursors.get(pipeline.id)
+            stale = self._stale_runs(cursor, pipeline, stored.get(pipeline.id, []))
+            if not stale and self._is_current(cursor, pipeline):
+                continue
+            since = cursor.since if cursor else datetime.utcnow() - self.initial_lookback
+            try:
+                runs = list(provider.iter_runs(pipeline.id, since=since))
+                runs.extend(self._refetch(provider, stale - {run.id for run in runs}))
+            except Exception as e:
+                logger.error(f"Error fetching runs of {provider.name}/{pipeline.id}: {e}")
+                continue
+            batches.append(RunBatch(provider=provider.name, pipeline_id=pipeline.id, since=since, runs=runs))
+        return batches
+    
+    @staticmethod
+    def _stored_runs(session, pipelines: List[Pipeline]) -> Dict[str, List[PipelineRunModel]]:
+        """Read the stored rows of the listed latest runs and of unfinished runs, per workflow."""
+        latest_ids = [pipeline.run_id for pipeline in pipelines if pipeline.run_id]
+        rows = session.query(PipelineRunModel).filter(
+            PipelineRunModel.pipeline_id.in_([pipeline.id for pipeline in pipelines]),
+            or_(PipelineRunModel.id.in_(latest_ids), PipelineRunModel.finished_at.is_(None))
+        )
+        stored: Dict[str, List[PipelineRunModel]] = {}
+        for row in rows:
+            stored.setdefault(row.pipeline_id, []).append(row)
+        return stored
+    
+    @staticmethod
+    def _stale_runs(cursor: Optional[SyncCursorModel], pipeline: Pipeline, rows: List[PipelineRunModel]) -> Set[str]:
+        """
+        Find runs of a workflow that changed but lie before its cursor.
+        
+        These are unfinished rows the cursor no longer covers, e.g. runs
+        reopened by a re-run, and the listed latest run when its status
+        or finish time differs from its row.
+        """
+        if cursor is None:
+            return set()
+        stale = set()
+        for row in rows:
+            if row.id == pipeline.run_id:
+                if row.status != pipeline.status.value or row.finished_at != _parse_time(pipeline.finished_at):
+                    stale.add(row.id)
+            elif row.finished_at is None and row.started_at is not None and row.started_at < cursor.since:
+                stale.add(row.id)
+        return stale
+    
+    @staticmethod
+    def _refetch(provider: BaseProvider, run_ids: Set[str]) -> List[PipelineRun]:
+        """Fetch the current state of individual runs."""
+        runs = []
+        for run_id in sorted(run_ids):
+            run = provider.fetch_run(run_id)
+            if run is not None:
+                runs.append(run)
+        return runs
+    
+    def reopen(self, run_id: str) -> None:
+        """
+        Mark a stored run as unfinished, e.g. when it is re-run.
+        
+        The next sync of its workflow fetches the run again.
+        
+        Args:
+            run_id: Run identifier
+        """
+        with self.db.get_session() as session:
+            session.query(PipelineRunModel).filter_by(id=str(run_id)).update({'finished_at': None})
+            session.commit()
+    
+    def write(self, session, batches: Iterable[RunBatch]) -> Dict[str, int]:
+        """
+        Upsert fetched runs and advance the workflow cursors.
+        
+        Each workflow is committed on its own so one bad batch doesn't
+        discard the others.
+        
+        Args:
+            session: Database session
+            batches: Runs collected by ``collect``
+        
+        Returns:
+            Dictionary of workflow ID -> number of runs inserted or updated
+        """
+        written = {}
+        for batch in batches:
+            try:
+                written[batch.pipeline_id] = self._write_batch(session, batch)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error syncing runs of {batch.provider}/{batch.pipeline_id}: {e}")
+        return written
+    
+    @staticmethod
+    def _is_current(cursor: Optional[SyncCursorModel], pipeline: Pipeline) -> bool:
+        """Check whether a workflow has nothing new since its cursor."""
+        if cursor is None or cursor.in_progress:
+            return False  # Never synced, or runs still in progress
+        latest = _parse_time(pipeline.started_at)
+        if latest is None:
+            return True  # Workflow has no runs
+        return cursor.last_run_created is not None and latest <= cursor.last_run_created
+    
+    def _write_batch(self, session, batch: RunBatch) -> int:
+        """Upsert the runs of one workflow and advance its cursor."""
+        cursor = session.get(SyncCursorModel, (batch.provider, batch.pipeline_id))
+        if cursor is None:
+            cursor = SyncCursorModel(provider=batch.provider, pipeline_id=batch.pipeline_id, since=batch.since)
+            session.add(cursor)
+        
+        runs = batch.runs
+        if not runs:
+            return 0
+        
+        existing = {
+            row.id: row
+            for row in session.query(PipelineRunModel).filter(
+                PipelineRunModel.id.in_([run.id for run in runs])
+            )
+        }
+        
+        written = 0
+        for run in runs:
+            row = existing.get(run.id)
+            if row is None:
+                row = PipelineRunModel(id=run.id, pipeline_id=batch.pipeline_id)
+                session.add(row)
+            elif row.status == run.status.value and row.finished_at == _parse_time(run.finished_at):
+                continue
+            self._fill(row, run)
+            written += 1
+        
+        # Hold the cursor at the oldest unfinished run so its updates are seen; the
+        # finish time marks completion, as skipped or timed-out runs map to PENDING
+        created = [(_parse_time(run.started_at), run) for run in runs if run.started_at]
+        if created:
+            newest_time, newest = max(created, key=lambda item: item[0])
+            open_times = [time for time, run in created if run.finished_at is None]
+            cursor.since = min(open_times) if open_times else newest_time
+            cursor.last_run_id = newest.id
+            cursor.last_run_created = newest_time
+            cursor.in_progress = bool(open_times)
+        
+        logger.debug(f"{batch.provider}/{batch.pipeline_id}: synced {len(runs)} runs ({written} written), next since {cursor.since}")
+        return written
+    
+    @staticmethod
+    def _fill(row: PipelineRunModel, run: PipelineRun) -> None:
+        """Copy a run into its database row."""
+        row.status = run.status.value
+        row.started_at = _parse_time(run.started_at)
+        row.finished_at = _parse_time(run.finished_at)
+        row.duration = run.duration
+        row.parameters = run.parameters
+
+
+# Global run-history sync instance
+_run_sync: Optional[RunHistorySync] = None
+
+
+def get_run_sync() -> RunHistorySync:
+    """
+    Get global run-history sync instance.
+    
+    Returns:
+        RunHistorySync instance
+    """
+    global _run_sync
+    
+    if _run_sync is None:
+        _run_sync = RunHistorySync()
+    
+    return _run_sync
@@ -54,6 +54,8 @@ def start_background_services(registry, poller):
         registry: Provider registry
         poller: Pipeline poller
     """
+    from src.api.pipelines import set_poller
+    
     global _poller
     
     # Load providers from keyring/config if available
@@ -61,6 +63,7 @@ def start_background_services(registry, poller):
     logger.info("Background services ready (start via API or CLI)")
     
     _poller = poller
+    set_poller(poller)
     # Don't auto-start poller - let it be started via API or explicitly
 
 
@@ -0,0 +1,265 @@
+"""
+Asynchronous provider interface.
+
+Defines the async counterpart of BaseProvider, a shared background event
+loop that every async provider runs on, and an adapter that exposes an
+async provider through the synchronous BaseProvider interface so the
+Flask routes and CLI keep working unchanged.
+"""
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, TypeVar
+
+from src.providers.base import (
+    BaseProvider,
+    ProviderConfig,
+    Pipeline,
+    PipelineJob,
+    PipelineRun,
+    PipelineStatus
+)
+from src.providers.rate_limit import current_priority, request_priority
+
+T = TypeVar('T')
+
+
+class AsyncBaseProvider(ABC):
+    """
+    Abstract base class for asynchronous CI/CD provider plugins.
+    
+    Mirrors BaseProvider with coroutine methods, so a single event loop
+    can keep thousands of provider requests in flight at once.
+    """
+    
+    def __init__(self, config: ProviderConfig):
+        """
+        Initialize provider with configuration.
+        
+        Args:
+            config: Provider configuration
+        """
+        self.config = config
+        self.name = config.name
+        self.provider_type = config.provider_type
+    
+    @abstractmethod
+    async def validate_credentials(self) -> bool:
+        """Validate provider credentials."""
+        pass
+    
+    @abstractmethod
+    async def fetch_pipelines(self) -> List[Pipeline]:
+        """Fetch all pipelines from the provider."""
+        pass
+    
+    @abstractmethod
+    async def fetch_pipeline_runs(self, pipeline_id: str, limit: int = 10) -> List[PipelineRun]:
+        """Fetch run history for a pipeline."""
+        pass
+    
+    @abstractmethod
+    async def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
+        """Trigger a pipeline execution."""
+        pass
+    
+    @abstractmethod
+    async def re_run_pipeline(self, run_id: str) -> PipelineRun:
+        """Re-run a previous pipeline execution."""
+        pass
+    
+    @abstractmethod
+    async def cancel_pipeline(self, run_id: str) -> bool:
+        """Cancel a running pipeline."""
+        pass
+    
+    @abstractmethod
+    async def get_pipeline_status(self, pipeline_id: str) -> PipelineStatus:
+        """Get current status of a pipeline."""
+        pass
+    
+    async def get_available_parameters(self, pipeline_id: str) -> Dict[str, Any]:
+        """
+        Get available input parameters for a pipeline.
+        
+        Default implementation returns empty dict.
+        """
+        return {}
+    
+    async def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """
+        Fetch the current state of a single pipeline run.
+        
+        Default implementation returns None (state unknown).
+        """
+        return None
+    
+    async def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """
+        Fetch the jobs and steps of a pipeline run.
+        
+        Default implementation raises NotImplementedError.
+        """
+        raise NotImplementedError(f"{self.provider_type} provider does not expose run jobs")
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream the log archive of a pipeline run.
+        
+        Synchronous, since the archive is handed to the caller chunk by
+        chunk. Default implementation raises NotImplementedError.
+        """
+        raise NotImplementedError(f"{self.provider_type} provider does not expose run logs")
+    
+    async def close(self) -> None:
+        """Release network resources held by the provider."""
+        pass
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name}, type={self.provider_type})"
+
+
+class EventLoopThread:
+    """
+    Event loop running forever in a daemon thread.
+    
+    Synchronous code submits coroutines to it with run(); all async
+    providers share this loop and therefore their connection pools.
+    """
+    
+    def __init__(self):
+        """Create the loop and start its thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name='flowforge-async', daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Thread target running the loop until the process exits."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+    
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result.
+        
+        Must not be called from the loop thread itself.
+        
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum seconds to wait for the result
+        
+        Returns:
+            Result of the coroutine
+        """
+        # Tasks don't inherit the caller's context across threads, so carry
+        # the request priority over explicitly
+        priority = current_priority()
+        
+        async def with_priority():
+            with request_priority(priority):
+                return await coro
+        
+        return asyncio.run_coroutine_threadsafe(with_priority(), self.loop).result(timeout)
+
+
+# Global event loop thread
+_loop_thread: Optional[EventLoopThread] = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """
+    Get global event loop thread, starting it on first use.
+    
+    Returns:
+        EventLoopThread instance
+    """
+    global _loop_thread
+    
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+    
+    return _loop_thread
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the shared event loop from synchronous code.
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Maximum seconds to wait for the result
+    
+    Returns:
+        Result of the coroutine
+    """
+    return get_event_loop_thread().run(coro, timeout)
+
+
+class AsyncProviderAdapter(BaseProvider):
+    """
+    Synchronous BaseProvider facade over an AsyncBaseProvider.
+    
+    Each call is executed on the shared event loop; the wrapped provider
+    stays reachable as ``async_provider`` so the registry and poller can
+    gather many of them in one loop iteration instead.
+    """
+    
+    def __init__(self, async_provider: AsyncBaseProvider):
+        """
+        Initialize adapter.
+        
+        Args:
+            async_provider: Asynchronous provider to wrap
+        """
+        super().__init__(async_provider.config)
+        self.async_provider = async_provider
+    
+    def validate_credentials(self) -> bool:
+        """Validate credentials on the shared event loop."""
+        return run_sync(self.async_provider.validate_credentials())
+    
+    def fetch_pipelines(self) -> List[Pipeline]:
+        """Fetch pipelines on the shared event loop."""
+        return run_sync(self.async_provider.fetch_pipelines())
+    
+    def fetch_pipeline_runs(self, pipeline_id: str, limit: int = 10) -> List[PipelineRun]:
+        """Fetch run history on the shared event loop."""
+        return run_sync(self.async_provider.fetch_pipeline_runs(pipeline_id, limit))
+    
+    def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
+        """Trigger a pipeline on the shared event loop."""
+        return run_sync(self.async_provider.trigger_pipeline(pipeline_id, parameters))
+    
+    def re_run_pipeline(self, run_id: str) -> PipelineRun:
+        """Re-run a pipeline on the shared event loop."""
+        return run_sync(self.async_provider.re_run_pipeline(run_id))
+    
+    def cancel_pipeline(self, run_id: str) -> bool:
+        """Cancel a run on the shared event loop."""
+        return run_sync(self.async_provider.cancel_pipeline(run_id))
+    
+    def get_pipeline_status(self, pipeline_id: str) -> PipelineStatus:
+        """Get pipeline status from the index or on the shared event loop."""
+        pipeline = self.indexed_pipeline(pipeline_id)
+        if pipeline is not None:
+            return pipeline.status
+        return run_sync(self.async_provider.get_pipeline_status(pipeline_id))
+    
+    def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """Fetch a run on the shared event loop."""
+        return run_sync(self.async_provider.fetch_run(run_id))
+    
+    def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """Fetch run jobs on the shared event loop."""
+        return run_sync(self.async_provider.fetch_run_jobs(run_id))
+    
+    def get_available_parameters(self, pipeline_id: str) -> Dict[str, Any]:
+        """Get pipeline parameters on the shared event loop."""
+        return run_sync(self.async_provider.get_available_parameters(pipeline_id))
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream run logs from the wrapped provider."""
+        return self.async_provider.stream_run_logs(run_id, chunk_size)
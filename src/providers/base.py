@@ -5,8 +5,11 @@ Inspired by pipedash plugin architecture, this module defines the common
 interface that all CI/CD providers must implement.
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -62,6 +65,7 @@ class Pipeline:
         finished_at: Finish timestamp (if completed)
         url: Link to pipeline in provider's UI
         provider: Provider name
+        run_id: ID of the latest run, if known
     """
     id: str
     name: str
@@ -75,6 +79,7 @@ class Pipeline:
     finished_at: Optional[str] = None
     url: Optional[str] = None
     provider: Optional[str] = None
+    run_id: Optional[str] = None
 
 
 @dataclass
@@ -90,6 +95,8 @@ class PipelineRun:
         finished_at: Finish timestamp
         duration: Duration in seconds
         parameters: Input parameters used for this run
+        tracking_id: Trigger handle ID while the actual run is being correlated
+        attempt: Attempt number of the run, if the provider supports re-runs
     """
     id: str
     pipeline_id: str
@@ -98,12 +105,133 @@ class PipelineRun:
     finished_at: Optional[str] = None
     duration: Optional[float] = None
     parameters: Dict[str, Any] = None
+    tracking_id: Optional[str] = None
+    attempt: Optional[int] = None
     
     def __post_init__(self):
         if self.parameters is None:
             self.parameters = {}
 
 
+@dataclass
+class PipelineStep:
+    """
+    Represents a single step of a pipeline job.
+    
+    Attributes:
+        number: Step position within the job
+        name: Step name
+        status: Step status
+        started_at: Start timestamp
+        finished_at: Finish timestamp
+        duration: Duration in seconds
+    """
+    number: int
+    name: str
+    status: PipelineStatus
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration: Optional[float] = None
+
+
+@dataclass
+class PipelineJob:
+    """
+    Represents a job of a pipeline run.
+    
+    Attributes:
+        id: Unique job identifier
+        run_id: Parent run ID
+        name: Job name
+        status: Job status
+        completed: Whether the job has finished and will no longer change
+        started_at: Start timestamp
+        finished_at: Finish timestamp
+        duration: Duration in seconds
+        url: Link to job in provider's UI
+        runner: Name of the runner that executed the job
+        steps: Steps of the job, in execution order
+    """
+    id: str
+    run_id: str
+    name: str
+    status: PipelineStatus
+    completed: bool = False
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration: Optional[float] = None
+    url: Optional[str] = None
+    runner: Optional[str] = None
+    steps: List[PipelineStep] = None
+    
+    def __post_init__(self):
+        if self.steps is None:
+            self.steps = []
+
+
+class PipelineIndex:
+    """
+    Latest known state of a provider's pipelines, keyed by pipeline ID.
+    
+    Kept current by whoever lists the provider's pipelines (the poller
+    and the registry), so status lookups are a dictionary access instead
+    of a full listing.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize empty index.
+        
+        Args:
+            clock: Monotonic time source
+        """
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, Pipeline]] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, pipelines: List[Pipeline]) -> None:
+        """
+        Replace the index with a complete pipeline listing.
+        
+        Args:
+            pipelines: Every pipeline of the provider
+        """
+        now = self._clock()
+        with self._lock:
+            self._entries = {pipeline.id: (now, pipeline) for pipeline in pipelines}
+    
+    def put(self, pipeline: Pipeline) -> None:
+        """
+        Store the state of a single pipeline.
+        
+        Args:
+            pipeline: Pipeline object
+        """
+        with self._lock:
+            self._entries[pipeline.id] = (self._clock(), pipeline)
+    
+    def get(self, pipeline_id: str, max_age: Optional[float] = None) -> Optional[Pipeline]:
+        """
+        Get the indexed state of a pipeline.
+        
+        Args:
+            pipeline_id: Pipeline identifier
+            max_age: Maximum age in seconds, None for any age
+            
+        Returns:
+            Pipeline object, or None if unknown or older than max_age
+        """
+        with self._lock:
+            entry = self._entries.get(str(pipeline_id))
+        if entry is None or (max_age is not None and self._clock() - entry[0] > max_age):
+            return None
+        return entry[1]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class BaseProvider(ABC):
     """
     Abstract base class for CI/CD provider plugins.
@@ -123,6 +251,48 @@ class BaseProvider(ABC):
         self.config = config
         self.name = config.name
         self.provider_type = config.provider_type
+        self.pipeline_index = PipelineIndex()
+    
+    @property
+    def status_max_age(self) -> float:
+        """Seconds an indexed pipeline status may be served without a refresh."""
+        return self.config.config.get('status_max_age', 2 * self.config.refresh_interval)
+    
+    @property
+    def max_staleness(self) -> float:
+        """Seconds a cached read may be served while it is being refreshed."""
+        return self.config.config.get('max_staleness', 10 * self.config.refresh_interval)
+    
+    @property
+    def min_refresh_interval(self) -> float:
+        """Shortest poll interval used while pipelines are active or changing."""
+        return self.config.config.get('min_refresh_interval', self.config.refresh_interval / 4)
+    
+    @property
+    def max_refresh_interval(self) -> float:
+        """Longest poll interval the poller backs off to while nothing changes."""
+        return self.config.config.get('max_refresh_interval', 8 * self.config.refresh_interval)
+    
+    def record_pipelines(self, pipelines: List[Pipeline]) -> None:
+        """
+        Record a complete pipeline listing in the status index.
+        
+        Args:
+            pipelines: Every pipeline of the provider
+        """
+        self.pipeline_index.update(pipelines)
+    
+    def indexed_pipeline(self, pipeline_id: str) -> Optional[Pipeline]:
+        """
+        Get a pipeline from the status index if it is fresh enough.
+        
+        Args:
+            pipeline_id: Pipeline identifier
+            
+        Returns:
+            Pipeline object, or None if not indexed within status_max_age
+        """
+        return self.pipeline_index.get(pipeline_id, self.status_max_age)
     
     @abstractmethod
     def validate_credentials(self) -> bool:
@@ -158,6 +328,93 @@ class BaseProvider(ABC):
         """
         pass
     
+    def iter_pipelines(self) -> Iterator[Pipeline]:
+        """
+        Iterate over all pipelines from the provider.
+        
+        Providers backed by paginated APIs should override this to fetch
+        pages lazily, so callers can stop early without fetching extra
+        pages. Default implementation yields from fetch_pipelines().
+        
+        Yields:
+            Pipeline objects
+        """
+        yield from self.fetch_pipelines()
+    
+    def iter_runs(self, pipeline_id: str, since: Optional[Union[str, datetime]] = None) -> Iterator[PipelineRun]:
+        """
+        Iterate over the run history of a pipeline, newest first.
+        
+        Providers backed by paginated APIs should override this to fetch
+        pages lazily. Default implementation yields from
+        fetch_pipeline_runs() and filters on ``since`` locally.
+        
+        Args:
+            pipeline_id: Pipeline identifier
+            since: Only yield runs started at or after this time
+            
+        Yields:
+            PipelineRun objects
+        """
+        if isinstance(since, datetime):
+            since = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        for run in self.fetch_pipeline_runs(pipeline_id):
+            if since and run.started_at and run.started_at < since:
+                continue
+            yield run
+    
+    def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """
+        Fetch the current state of a single pipeline run.
+        
+        This is an optional method that providers can override.
+        Default implementation returns None (state unknown).
+        
+        Args:
+            run_id: Run identifier
+            
+        Returns:
+            PipelineRun object, or None if unknown
+        """
+        return None
+    
+    def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """
+        Fetch the jobs and steps of a pipeline run.
+        
+        This is an optional method that providers can override.
+        
+        Args:
+            run_id: Run identifier
+            
+        Returns:
+            List of PipelineJob objects with their steps
+            
+        Raises:
+            NotImplementedError: If the provider doesn't expose job details
+        """
+        raise NotImplementedError(f"{self.provider_type} provider does not expose run jobs")
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream the log archive of a pipeline run.
+        
+        This is an optional method that providers can override. The
+        archive is yielded in chunks and never held in memory as a whole.
+        
+        Args:
+            run_id: Run identifier
+            chunk_size: Bytes per chunk
+            
+        Returns:
+            Iterator over chunks of the zip log archive
+            
+        Raises:
+            NotImplementedError: If the provider doesn't expose run logs
+        """
+        raise NotImplementedError(f"{self.provider_type} provider does not expose run logs")
+    
     @abstractmethod
     def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
         """
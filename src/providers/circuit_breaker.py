@@ -0,0 +1,210 @@
+"""
+Per-provider circuit breaker.
+
+Tracks the outcome and latency of recent calls to a provider. When too
+many of them fail or are too slow, the circuit opens and calls are
+refused instantly instead of waiting for another timeout. After a
+cool-down a single probe call is let through (half-open); its outcome
+closes the circuit again or re-opens it with a longer cool-down.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional
+
+from src.config import config
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker driven by error rate and latency.
+    """
+    
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        slow_call_seconds: float = 10.0,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            failure_rate: Share of failed or slow calls that opens the circuit
+            min_calls: Calls needed in the window before the rate is judged
+            window: Number of recent calls considered
+            slow_call_seconds: Calls slower than this count as failures
+            open_seconds: Initial cool-down before a probe is allowed
+            max_open_seconds: Upper bound of the cool-down after failed probes
+            clock: Monotonic time source
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = failed
+        self.state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._cooldown = open_seconds
+        self._probing = False
+        self.last_error: Optional[str] = None
+        self.last_latency: Optional[float] = None
+        self.rejected = 0
+    
+    def _refresh_state(self) -> None:
+        """Move an open circuit to half-open once its cool-down has passed."""
+        if self.state == CircuitState.OPEN and self._clock() >= self._opened_at + self._cooldown:
+            self.state = CircuitState.HALF_OPEN
+            self._probing = False
+    
+    def available(self) -> bool:
+        """
+        Check whether a call would be let through, without claiming it.
+        
+        Returns:
+            True if the circuit is closed or ready for a probe
+        """
+        with self._lock:
+            self._refresh_state()
+            if self.state == CircuitState.CLOSED:
+                return True
+            return self.state == CircuitState.HALF_OPEN and not self._probing
+    
+    def allow(self) -> bool:
+        """
+        Claim permission for a call.
+        
+        In the half-open state only one probe call is allowed at a time.
+        
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            self._refresh_state()
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self, duration: float) -> None:
+        """
+        Record a completed call.
+        
+        Args:
+            duration: Call latency in seconds; slow calls count as failures
+        """
+        if duration > self.slow_call_seconds:
+            self.record_failure(f"slow call ({duration:.1f}s)", duration)
+            return
+        
+        with self._lock:
+            self.last_latency = duration
+            if self.state == CircuitState.HALF_OPEN:
+                self._close()
+            else:
+                self._outcomes.append(False)
+    
+    def record_failure(self, error: str, duration: Optional[float] = None) -> None:
+        """
+        Record a failed call.
+        
+        Args:
+            error: Error description
+            duration: Call latency in seconds, if known
+        """
+        with self._lock:
+            self.last_error = error
+            if duration is not None:
+                self.last_latency = duration
+            
+            if self.state == CircuitState.HALF_OPEN:
+                # Failed probe: back off further before the next one
+                self._open(min(self._cooldown * 2, self.max_open_seconds))
+                return
+            
+            self._outcomes.append(True)
+            if self.state == CircuitState.CLOSED and self._tripped():
+                self._open(self.open_seconds)
+    
+    def release(self) -> None:
+        """Give back a probe claim without judging the provider, e.g. on a rate-limit deferral."""
+        with self._lock:
+            self._probing = False
+    
+    def _tripped(self) -> bool:
+        """Check whether the recent failure rate opens the circuit."""
+        if len(self._outcomes) < self.min_calls:
+            return False
+        return sum(self._outcomes) / len(self._outcomes) >= self.failure_rate
+    
+    def _open(self, cooldown: float) -> None:
+        """Open the circuit for a cool-down period."""
+        self.state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._cooldown = cooldown
+        self._probing = False
+    
+    def _close(self) -> None:
+        """Close the circuit and forget past outcomes."""
+        self.state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._cooldown = self.open_seconds
+        self._probing = False
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the breaker state for health reporting.
+        
+        Returns:
+            Dictionary with state, failure rate, latency, last error and
+            seconds until the next probe
+        """
+        with self._lock:
+            self._refresh_state()
+            calls = len(self._outcomes)
+            retry_in = None
+            if self.state == CircuitState.OPEN:
+                retry_in = round(max(0.0, self._opened_at + self._cooldown - self._clock()), 1)
+            return {
+                'state': self.state.value,
+                'failure_rate': round(sum(self._outcomes) / calls, 2) if calls else 0.0,
+                'calls': calls,
+                'last_latency': round(self.last_latency, 3) if self.last_latency is not None else None,
+                'last_error': self.last_error,
+                'rejected': self.rejected,
+                'retry_in': retry_in
+            }
+
+
+def make_breaker() -> CircuitBreaker:
+    """
+    Create a circuit breaker configured from application settings.
+    
+    Returns:
+        CircuitBreaker instance
+    """
+    return CircuitBreaker(
+        failure_rate=config.CIRCUIT_FAILURE_RATE,
+        min_calls=config.CIRCUIT_MIN_CALLS,
+        slow_call_seconds=config.CIRCUIT_SLOW_CALL_SECONDS,
+        open_seconds=config.CIRCUIT_OPEN_SECONDS
+    )
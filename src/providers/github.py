@@ -4,47 +4,242 @@ GitHub Actions provider implementation.
 This module implements the GitHub Actions provider plugin.
 """
 
+import base64
+import logging
+import time
 import requests
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Union
+from src.database.job_cache import get_job_cache
+from src.database.run_sync import get_run_sync
 from src.providers.base import (
     BaseProvider,
     ProviderConfig,
     Pipeline,
+    PipelineJob,
     PipelineRun,
-    PipelineStatus
+    PipelineStatus,
+    PipelineStep
 )
+from src.providers.http_cache import ResponseCache
+from src.providers.log_archive import get_log_cache
+from src.providers.rate_limit import RateLimitGovernor, get_governor
+from src.providers.run_correlation import TriggerHandle, get_correlator
+from src.providers.transport import get_transport
+from src.providers.workflow_inputs import WorkflowInputs, get_schema_cache, validate_inputs
+from src.providers.workflow_metadata import WorkflowMetadata, WorkflowMetadataCache
+from src.utils.errors import ProviderError, RateLimitError, ValidationError
 
+logger = logging.getLogger(__name__)
 
-class GitHubProvider(BaseProvider):
+# Maximum page size accepted by the GitHub REST API
+MAX_PAGE_SIZE = 100
+
+# Number of recently seen run IDs remembered with their workflow
+RUN_WORKFLOW_MEMORY = 1024
+
+
+class GitHubPayloadMixin:
+    """
+    Mapping of GitHub Actions API payloads to FlowForge dataclasses.
+    
+    Shared by the synchronous and asynchronous GitHub providers; expects
+    ``owner``, ``repo`` and ``name`` attributes on the host class.
+    """
+    
+    def _build_pipeline(self, workflow: Dict[str, Any], latest_run: Optional[Dict[str, Any]]) -> Pipeline:
+        """
+        Build a Pipeline from a workflow and its latest run.
+        
+        Args:
+            workflow: Workflow object
+            latest_run: Latest run object, or None
+            
+        Returns:
+            Pipeline object
+        """
+        status = self._map_status(latest_run) if latest_run else PipelineStatus.PENDING
+        
+        return Pipeline(
+            id=str(workflow['id']),
+            name=workflow['name'],
+            status=status,
+            repository=f"{self.owner}/{self.repo}",
+            branch=latest_run.get('head_branch', 'unknown') if latest_run else 'unknown',
+            commit=latest_run.get('head_sha', '') if latest_run else '',
+            commit_message=(latest_run.get('head_commit') or {}).get('message', '') if latest_run else '',
+            author=(latest_run.get('head_commit') or {}).get('author', {}).get('name', '') if latest_run else '',
+            started_at=latest_run.get('created_at') if latest_run else None,
+            finished_at=latest_run.get('updated_at') if latest_run and latest_run.get('status') == 'completed' else None,
+            url=workflow.get('html_url', ''),
+            provider=self.name,
+            run_id=str(latest_run['id']) if latest_run and latest_run.get('id') is not None else None
+        )
+    
+    @staticmethod
+    def _map_status(run_data: Dict[str, Any]) -> PipelineStatus:
+        """
+        Map a GitHub run status/conclusion pair to a PipelineStatus.
+        
+        Args:
+            run_data: Run object
+            
+        Returns:
+            PipelineStatus enum value
+        """
+        status_str = run_data.get('status', 'unknown')
+        conclusion = run_data.get('conclusion')
+        
+        if status_str == 'in_progress' or status_str == 'queued':
+            return PipelineStatus.RUNNING
+        elif conclusion == 'success':
+            return PipelineStatus.SUCCESS
+        elif conclusion == 'failure':
+            return PipelineStatus.FAILURE
+        elif conclusion == 'cancelled':
+            return PipelineStatus.CANCELLED
+        return PipelineStatus.PENDING
+    
+    def _forget_run(self, run_id: Any) -> None:
+        """Drop the cached jobs and logs of a run whose new attempt replaces them, and reopen its history row."""
+        try:
+            get_job_cache().invalidate(self.name, str(run_id))
+            get_log_cache().invalidate(self.name, str(run_id))
+            get_run_sync().reopen(str(run_id))
+        except Exception as e:
+            logger.warning(f"Could not drop cached state of run {run_id}: {e}")
+    
+    @staticmethod
+    def _duration(started_at: Optional[str], finished_at: Optional[str]) -> Optional[float]:
+        """Seconds between two API timestamps, or None if either is missing."""
+        if not started_at or not finished_at:
+            return None
+        started = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+        finished = datetime.fromisoformat(finished_at.replace('Z', '+00:00'))
+        return (finished - started).total_seconds()
+    
+    def _build_job(self, job_data: Dict[str, Any], run_id: str) -> PipelineJob:
+        """
+        Build a PipelineJob from a workflow job object.
+        
+        Args:
+            job_data: Job object
+            run_id: Run ID
+            
+        Returns:
+            PipelineJob object
+        """
+        steps = [
+            PipelineStep(
+                number=step.get('number', index + 1),
+                name=step.get('name', ''),
+                status=self._map_status(step),
+                started_at=step.get('started_at'),
+                finished_at=step.get('completed_at'),
+                duration=self._duration(step.get('started_at'), step.get('completed_at'))
+            )
+            for index, step in enumerate(job_data.get('steps') or [])
+        ]
+        
+        return PipelineJob(
+            id=str(job_data['id']),
+            run_id=str(run_id),
+            name=job_data.get('name', ''),
+            status=self._map_status(job_data),
+            completed=job_data.get('status') == 'completed',
+            started_at=job_data.get('started_at'),
+            finished_at=job_data.get('completed_at'),
+            duration=self._duration(job_data.get('started_at'), job_data.get('completed_at')),
+            url=job_data.get('html_url'),
+            runner=job_data.get('runner_name'),
+            steps=steps
+        )
+    
+    def _build_run(self, run_data: Dict[str, Any], pipeline_id: str) -> PipelineRun:
+        """
+        Build a PipelineRun from a workflow run object.
+        
+        Args:
+            run_data: Run object
+            pipeline_id: Workflow ID
+            
+        Returns:
+            PipelineRun object
+        """
+        # Calculate duration
+        duration = None
+        if run_data.get('created_at') and run_data.get('updated_at'):
+            started = datetime.fromisoformat(run_data['created_at'].replace('Z', '+00:00'))
+            finished = datetime.fromisoformat(run_data['updated_at'].replace('Z', '+00:00'))
+            if run_data.get('status') == 'completed':
+                duration = (finished - started).total_seconds()
+        
+        return PipelineRun(
+            id=str(run_data['id']),
+            pipeline_id=pipeline_id,
+            status=self._map_status(run_data),
+            started_at=run_data.get('created_at'),
+            finished_at=run_data.get('updated_at') if run_data.get('status') == 'completed' else None,
+            duration=duration,
+            attempt=run_data.get('run_attempt')
+        )
+
+
+class GitHubProvider(GitHubPayloadMixin, BaseProvider):
     """
     GitHub Actions provider implementation.
     
     Supports:
-    - Fetching workflows and runs
+    - Fetching workflows and runs (latest runs batched per repository)
     - Triggering workflows via workflow_dispatch
     - Re-running failed workflows
     - Cancelling running workflows
     """
     
-    def __init__(self, config: ProviderConfig):
+    def __init__(self, config: ProviderConfig, session: Optional[requests.Session] = None):
         """
         Initialize GitHub provider.
         
         Args:
             config: Provider configuration with GitHub token and repo info
+            session: Session to use instead of the shared per-host transport session
         """
         super().__init__(config)
         self.token = config.config.get('token')
         self.owner = config.config.get('owner')
         self.repo = config.config.get('repo')
         self.base_url = config.config.get('base_url', 'https://api.github.com')
+        self.batch_runs = config.config.get('batch_runs', True)
+        self.batch_run_pages = config.config.get('batch_run_pages', 3)
+        self.graphql_batch = config.config.get('graphql_batch', True)
+        # Optional workflow_dispatch input shown in the run name (run-name),
+        # used to match dispatched runs exactly
+        self.correlation_input = config.config.get('correlation_input')
+        self.correlation_skew = config.config.get('correlation_skew', 30)
+        self._actor_login: Optional[str] = None
         
-        self.session = requests.Session()
-        if self.token:
-            self.session.headers.update({
-                'Authorization': f'token {self.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            })
+        self._request_count = 0
+        self.last_refresh_requests = 0
+        
+        # Shared keep-alive pool per host; credentials travel per request
+        self.session = session or get_transport().session_for(self.base_url)
+        
+        # Conditional-request cache; 304 replies don't count against the rate limit
+        self.response_cache = ResponseCache(
+            max_entries=config.config.get('response_cache_size', 256)
+        )
+        self.governor = get_governor()
+        
+        # Workflow id -> path/name/inputs, refreshed by every pipeline listing
+        self.workflow_cache = WorkflowMetadataCache(
+            ttl=config.config.get('workflow_cache_ttl', 600)
+        )
+        self._run_workflows: "OrderedDict[str, str]" = OrderedDict()
+        # (workflow id, ref) -> (checked at, blob SHA) of the workflow file
+        self._workflow_blobs: Dict[tuple, tuple] = {}
+        self.validate_inputs = config.config.get('validate_inputs', True)
     
     def validate_credentials(self) -> bool:
         """
@@ -57,7 +252,7 @@ class GitHubProvider(BaseProvider):
             return False
         
         try:
-            response = self.session.get(f'{self.base_url}/user')
+            response = self._get(f'{self.base_url}/user')
             return response.status_code == 200
         except Exception:
             return False
@@ -69,70 +264,316 @@ class GitHubProvider(BaseProvider):
         Returns:
             List of Pipeline objects representing workflows
         """
+        return list(self.iter_pipelines())
+    
+    def iter_pipelines(self) -> Iterator[Pipeline]:
+        """
+        Iterate over GitHub Actions workflows, following pagination lazily.
+        
+        In batched mode (the default) the latest run of every workflow is
+        taken from a few pages of the repository-wide runs listing, and only
+        workflows without a run in that window are looked up individually.
+        The number of requests spent is kept in ``last_refresh_requests``.
+        
+        Yields:
+            Pipeline objects representing workflows
+        
+        Raises:
+            ProviderError: If GitHub answers a listing with an error
+        """
         if not self.owner or not self.repo:
-            return []
+            return
         
-        pipelines = []
+        count = 0
+        requests_before = self._request_count
+        latest_runs: Dict[int, Dict[str, Any]] = {}
+        run_pages = self._iter_recent_run_pages() if self.batch_runs else iter(())
         
         try:
-            # Fetch workflows
             url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows'
-            response = self.session.get(url)
             
+            for workflow in self._paginate(url, 'workflows'):
+                latest_run = self._batched_latest_run(workflow['id'], latest_runs, run_pages)
+                if latest_run is None:
+                    # No run in the batched window, fall back to a direct lookup
+                    latest_run = self._fetch_latest_run(workflow['id'])
+                
+                self._remember_workflow(workflow)
+                if latest_run:
+                    self._remember_run(latest_run['id'], workflow['id'])
+                count += 1
+                yield self._build_pipeline(workflow, latest_run)
+        
+        finally:
+            self.last_refresh_requests = self._request_count - requests_before
+            logger.debug(
+                f"{self.name}: refreshed {count} workflows "
+                f"with {self.last_refresh_requests} requests"
+            )
+    
+    @staticmethod
+    def _batched_latest_run(
+        workflow_id: Any,
+        latest_runs: Dict[int, Dict[str, Any]],
+        run_pages: Iterator[List[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a workflow's latest run in the repository-wide runs listing.
+        
+        Runs are listed newest first, so the first run seen for a workflow
+        is its latest one; further pages are read only on demand.
+        
+        Args:
+            workflow_id: Workflow ID
+            latest_runs: Latest run per workflow ID seen so far, extended in place
+            run_pages: Remaining pages of the runs listing
+            
+        Returns:
+            Latest run object, or None if it isn't in the batched window
+        """
+        latest_run = latest_runs.get(workflow_id)
+        while latest_run is None:
+            page = next(run_pages, None)
+            if page is None:
+                break
+            for run in page:
+                latest_runs.setdefault(run.get('workflow_id'), run)
+            latest_run = latest_runs.get(workflow_id)
+        return latest_run
+    
+    def _iter_recent_run_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the first ``batch_run_pages`` pages of repository runs.
+        
+        Yields:
+            Lists of run objects, newest first
+        """
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs'
+        pages = self._paginate_pages(url, 'workflow_runs')
+        return islice(pages, self.batch_run_pages)
+    
+    def _paginate(
+        self,
+        url: str,
+        key: Optional[str],
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a paginated listing.
+        
+        Args:
+            url: Listing URL
+            key: Response key holding the items, None for top-level arrays
+            params: Query parameters for the first page
+            
+        Yields:
+            Items of the listing
+        """
+        for page in self._paginate_pages(url, key, params):
+            yield from page
+    
+    def _paginate_pages(
+        self,
+        url: str,
+        key: Optional[str],
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the pages of a listing by following ``Link: rel="next"``.
+        
+        Each page is requested only when the previous one has been consumed,
+        so callers that stop early never fetch extra pages.
+        
+        Args:
+            url: Listing URL
+            key: Response key holding the items, None for top-level arrays
+            params: Query parameters for the first page
+            
+        Yields:
+            Lists of items, one per page
+        
+        Raises:
+            ProviderError: If a page is answered with an error
+        """
+        next_url: Optional[str] = url
+        next_params = {'per_page': MAX_PAGE_SIZE, **(params or {})}
+        
+        while next_url:
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
-                return []
+                raise ProviderError(f"GitHub API returned {response.status_code} for {next_url}", self.name)
             
             data = response.json()
+            yield data if key is None else data.get(key, [])
             
-            for workflow in data.get('workflows', []):
-                # Get latest run for status
-                runs_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow["id"]}/runs'
-                runs_response = self.session.get(runs_url, params={'per_page': 1})
-                
-                latest_run = None
-                if runs_response.status_code == 200:
-                    runs_data = runs_response.json()
-                    if runs_data.get('workflow_runs'):
-                        latest_run = runs_data['workflow_runs'][0]
-                
-                # Determine status
-                if latest_run:
-                    status_str = latest_run.get('status', 'unknown')
-                    conclusion = latest_run.get('conclusion')
-                    
-                    if status_str == 'in_progress' or status_str == 'queued':
-                        status = PipelineStatus.RUNNING
-                    elif conclusion == 'success':
-                        status = PipelineStatus.SUCCESS
-                    elif conclusion == 'failure':
-                        status = PipelineStatus.FAILURE
-                    elif conclusion == 'cancelled':
-                        status = PipelineStatus.CANCELLED
-                    else:
-                        status = PipelineStatus.PENDING
-                else:
-                    status = PipelineStatus.PENDING
-                
-                pipeline = Pipeline(
-                    id=str(workflow['id']),
-                    name=workflow['name'],
-                    status=status,
-                    repository=f"{self.owner}/{self.repo}",
-                    branch=latest_run.get('head_branch', 'unknown') if latest_run else 'unknown',
-                    commit=latest_run.get('head_sha', '') if latest_run else '',
-                    commit_message=latest_run.get('head_commit', {}).get('message', '') if latest_run else '',
-                    author=latest_run.get('head_commit', {}).get('author', {}).get('name', '') if latest_run else '',
-                    started_at=latest_run.get('created_at') if latest_run else None,
-                    finished_at=latest_run.get('updated_at') if latest_run and latest_run.get('status') == 'completed' else None,
-                    url=workflow.get('html_url', ''),
-                    provider=self.name
-                )
-                pipelines.append(pipeline)
+            # The next link already carries every query parameter
+            next_url = response.links.get('next', {}).get('url')
+            next_params = None
+    
+    def _fetch_latest_run(self, workflow_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the latest run of a single workflow.
         
-        except Exception as e:
-            print(f"Error fetching GitHub pipelines: {e}")
+        Args:
+            workflow_id: Workflow ID
+            
+        Returns:
+            Latest run object, or None if the workflow has never run
+        """
+        runs_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}/runs'
+        runs_response = self._get(runs_url, params={'per_page': 1})
+        
+        if runs_response.status_code == 200:
+            runs_data = runs_response.json()
+            if runs_data.get('workflow_runs'):
+                return runs_data['workflow_runs'][0]
+        return None
+    
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Issue a conditional GET request through the provider session.
+        
+        Requests carry the cached ETag/Last-Modified validators, and a
+        304 reply is answered with the cached parsed body.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Response object
+            
+        Raises:
+            RateLimitError: If the rate-limit governor defers the request
+        """
+        self.governor.acquire(self._rate_limit_key)
+        self._request_count += 1
+        response = self.response_cache.get(self.session, url, params=params, headers=self._headers)
+        self.governor.update(self._rate_limit_key, response.headers, response.status_code)
+        return response
+    
+    def _post(self, url: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Issue a POST request through the provider session.
+        
+        Args:
+            url: Request URL
+            json: JSON request body
+            
+        Returns:
+            Response object
+            
+        Raises:
+            RateLimitError: If the rate-limit governor defers the request
+        """
+        self.governor.acquire(self._rate_limit_key)
+        self._request_count += 1
+        response = self.session.post(url, json=json, headers=self._headers)
+        self.governor.update(self._rate_limit_key, response.headers, response.status_code)
+        return response
+    
+    @property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, sent per request because the session is shared."""
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if self.token:
+            headers['Authorization'] = f'token {self.token}'
+        return headers
+    
+    @property
+    def _rate_limit_key(self) -> str:
+        """Rate-limit governor bucket for this provider's host and token."""
+        return RateLimitGovernor.bucket_key(self.base_url, self.token)
+    
+    def _remember_workflow(self, workflow: Dict[str, Any]) -> WorkflowMetadata:
+        """Store a workflow object from the API in the metadata cache."""
+        return self.workflow_cache.put(WorkflowMetadata(
+            id=str(workflow['id']),
+            name=workflow.get('name', ''),
+            path=workflow.get('path', ''),
+            state=workflow.get('state')
+        ))
+    
+    def _remember_run(self, run_id: Any, workflow_id: Any) -> None:
+        """Remember which workflow a recently seen run belongs to."""
+        self._run_workflows[str(run_id)] = str(workflow_id)
+        self._run_workflows.move_to_end(str(run_id))
+        while len(self._run_workflows) > RUN_WORKFLOW_MEMORY:
+            self._run_workflows.popitem(last=False)
+    
+    def get_workflow(self, workflow_id: str) -> Optional[WorkflowMetadata]:
+        """
+        Get workflow metadata, from the cache when possible.
+        
+        Args:
+            workflow_id: Workflow ID
+            
+        Returns:
+            WorkflowMetadata, or None if the workflow doesn't exist
+        """
+        metadata = self.workflow_cache.get(workflow_id)
+        if metadata is not None:
+            return metadata
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}'
+        response = self._get(url)
+        if response.status_code != 200:
+            return None
+        return self._remember_workflow(response.json())
+    
+    def invalidate_workflow_metadata(self, workflow_id: Optional[str] = None) -> None:
+        """
+        Drop cached workflow metadata.
+        
+        Args:
+            workflow_id: Workflow to drop, or None to drop all workflows
+        """
+        self.workflow_cache.invalidate(workflow_id)
+        for key in [key for key in self._workflow_blobs if workflow_id is None or key[0] == str(workflow_id)]:
+            self._workflow_blobs.pop(key, None)
+    
+    def get_dispatch_inputs(self, workflow_id: str, ref: Optional[str] = None) -> Optional[WorkflowInputs]:
+        """
+        Get the workflow_dispatch input schema of a workflow.
+        
+        The file's blob SHA is re-checked at most once per metadata TTL
+        (with a conditional request), and the file is parsed only when
+        its SHA is not in the shared schema cache.
+        
+        Args:
+            workflow_id: Workflow ID
+            ref: Git ref to read the workflow file at, default branch if None
+            
+        Returns:
+            WorkflowInputs, or None if the workflow file can't be read
+        """
+        key = (str(workflow_id), ref or '')
+        schema_cache = get_schema_cache()
         
-        return pipelines
+        checked = self._workflow_blobs.get(key)
+        if checked and time.monotonic() - checked[0] <= self.workflow_cache.ttl:
+            schema = schema_cache.get(checked[1])
+            if schema is not None:
+                return schema
+        
+        metadata = self.get_workflow(workflow_id)
+        if metadata is None or not metadata.path:
+            return None
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/contents/{metadata.path}'
+        response = self._get(url, params={'ref': ref} if ref else None)
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        schema = schema_cache.get_or_parse(
+            data['sha'],
+            lambda: base64.b64decode(data.get('content', '')).decode('utf-8')
+        )
+        self._workflow_blobs[key] = (time.monotonic(), data['sha'])
+        if ref is None:
+            self.workflow_cache.set_inputs(workflow_id, schema.inputs)
+        return schema
     
     def fetch_pipeline_runs(self, pipeline_id: str, limit: int = 10) -> List[PipelineRun]:
         """
@@ -145,59 +586,157 @@ class GitHubProvider(BaseProvider):
         Returns:
             List of PipelineRun objects
         """
+        runs = self.iter_runs(pipeline_id, page_size=min(limit, MAX_PAGE_SIZE))
+        return list(islice(runs, limit))
+    
+    def iter_runs(
+        self,
+        pipeline_id: str,
+        since: Optional[Union[str, datetime]] = None,
+        page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[PipelineRun]:
+        """
+        Iterate over workflow runs, newest first, following pagination lazily.
+        
+        Args:
+            pipeline_id: Workflow ID
+            since: Only yield runs created at or after this time
+            page_size: Number of runs requested per page
+            
+        Yields:
+            PipelineRun objects
+        """
         if not self.owner or not self.repo:
-            return []
+            return
         
-        runs = []
+        params: Dict[str, Any] = {'per_page': page_size}
+        if since:
+            if isinstance(since, datetime):
+                since = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+            params['created'] = f'>={since}'
         
         try:
             url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{pipeline_id}/runs'
-            response = self.session.get(url, params={'per_page': limit})
+            for run_data in self._paginate(url, 'workflow_runs', params):
+                self._remember_run(run_data['id'], pipeline_id)
+                yield self._build_run(run_data, pipeline_id)
+        
+        except RateLimitError:
+            raise
+        
+        except Exception as e:
+            logger.error(f"Error fetching pipeline runs: {e}")
+    
+    def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """
+        Fetch the current state and attempt of a workflow run.
+        
+        Requested conditionally, so an unchanged run is answered with a
+        free 304.
+        
+        Args:
+            run_id: Run ID
             
-            if response.status_code != 200:
-                return []
+        Returns:
+            PipelineRun object, or None if the run doesn't exist
+        
+        Raises:
+            ProviderError: If GitHub answers with an error
+        """
+        if not self.owner or not self.repo:
+            return None
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}'
+        response = self._get(url)
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise ProviderError(f"GitHub API returned {response.status_code} for {url}", self.name)
+        
+        run_data = response.json()
+        self._remember_run(run_data['id'], run_data['workflow_id'])
+        return self._build_run(run_data, str(run_data['workflow_id']))
+    
+    def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """
+        Fetch the jobs and steps of the latest attempt of a workflow run.
+        
+        Listings are requested conditionally, so refreshing an unchanged
+        in-progress run is answered with a free 304.
+        
+        Args:
+            run_id: Run ID
             
-            data = response.json()
+        Returns:
+            List of PipelineJob objects with their steps
+        """
+        if not self.owner or not self.repo:
+            return []
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/jobs'
+        return [self._build_job(job_data, run_id) for job_data in self._paginate(url, 'jobs')]
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream the log archive of a workflow run.
+        
+        The request is made eagerly so that errors surface before any
+        chunk is consumed. GitHub redirects to a signed storage URL; the
+        Authorization header is dropped on that cross-host redirect.
+        
+        Args:
+            run_id: Run ID
+            chunk_size: Bytes per chunk
             
-            for run_data in data.get('workflow_runs', []):
-                # Calculate duration
-                duration = None
-                if run_data.get('created_at') and run_data.get('updated_at'):
-                    from datetime import datetime
-                    started = datetime.fromisoformat(run_data['created_at'].replace('Z', '+00:00'))
-                    finished = datetime.fromisoformat(run_data['updated_at'].replace('Z', '+00:00'))
-                    if run_data.get('status') == 'completed':
-                        duration = (finished - started).total_seconds()
-                
-                # Map status
-                status_str = run_data.get('status', 'unknown')
-                conclusion = run_data.get('conclusion')
-                
-                if status_str == 'in_progress' or status_str == 'queued':
-                    status = PipelineStatus.RUNNING
-                elif conclusion == 'success':
-                    status = PipelineStatus.SUCCESS
-                elif conclusion == 'failure':
-                    status = PipelineStatus.FAILURE
-                elif conclusion == 'cancelled':
-                    status = PipelineStatus.CANCELLED
-                else:
-                    status = PipelineStatus.PENDING
-                
-                run = PipelineRun(
-                    id=str(run_data['id']),
-                    pipeline_id=pipeline_id,
-                    status=status,
-                    started_at=run_data.get('created_at'),
-                    finished_at=run_data.get('updated_at') if run_data.get('status') == 'completed' else None,
-                    duration=duration
-                )
-                runs.append(run)
+        Returns:
+            Iterator over chunks of the zip log archive
+            
+        Raises:
+            ProviderError: If the archive can't be downloaded
+            RateLimitError: If the rate-limit governor defers the request
+        """
+        if not self.owner or not self.repo:
+            raise ProviderError("Repository not configured", self.name)
         
-        except Exception as e:
-            print(f"Error fetching pipeline runs: {e}")
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/logs'
+        self.governor.acquire(self._rate_limit_key)
+        self._request_count += 1
+        response = self.session.get(url, headers=self._headers, stream=True)
+        self.governor.update(self._rate_limit_key, response.headers, response.status_code)
+        
+        if response.status_code != 200:
+            response.close()
+            raise ProviderError(f"Failed to download logs of run {run_id}: {response.status_code}", self.name)
+        
+        return self._iter_body(response, chunk_size)
+    
+    @staticmethod
+    def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        """Yield a streamed response body, releasing the connection when done."""
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            response.close()
+    
+    def _dispatch_schema(self, pipeline_id: str, ref: str) -> Optional[WorkflowInputs]:
+        """
+        Get the input schema used to validate a dispatch locally.
         
-        return runs
+        Local validation is optional: if the schema can't be fetched (rate
+        limit, network or API error), the trigger goes ahead unvalidated and
+        GitHub checks the inputs. Only ValidationError propagates.
+        """
+        if not self.validate_inputs:
+            return None
+        try:
+            return self.get_dispatch_inputs(pipeline_id, ref)
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.warning(f"Dispatching workflow {pipeline_id} without local input validation: {e}")
+            return None
     
     def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
         """
@@ -209,23 +748,16 @@ class GitHubProvider(BaseProvider):
             
         Returns:
             PipelineRun object for the triggered run
+            
+        Raises:
+            ValidationError: If the inputs don't match the workflow's dispatch inputs
         """
         if not self.owner or not self.repo:
             raise ValueError("Owner and repo must be set")
         
         try:
-            # Get workflow file path (needed for dispatch)
-            workflow_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{pipeline_id}'
-            workflow_response = self.session.get(workflow_url)
-            
-            if workflow_response.status_code != 200:
-                raise Exception(f"Workflow not found: {workflow_response.status_code}")
-            
-            workflow_data = workflow_response.json()
-            workflow_path = workflow_data['path']
-            
-            # Trigger workflow dispatch
-            dispatch_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_path}/dispatches'
+            # The dispatch endpoint accepts the workflow ID, so no lookup is needed
+            dispatch_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{pipeline_id}/dispatches'
             
             payload = {
                 'ref': parameters.get('ref', 'main') if parameters else 'main'
@@ -233,38 +765,64 @@ class GitHubProvider(BaseProvider):
             
             # Add inputs if provided
             if parameters and 'inputs' in parameters:
-                payload['inputs'] = parameters['inputs']
+                payload['inputs'] = dict(parameters['inputs'])
             
-            response = self.session.post(dispatch_url, json=payload)
+            # Validate locally so bad triggers never reach the API
+            schema = self._dispatch_schema(pipeline_id, payload['ref'])
+            if schema is not None:
+                payload['inputs'] = validate_inputs(schema, payload.get('inputs'))
             
-            if response.status_code == 204:
-                # Successfully triggered, fetch the new run
-                # Note: We need to poll for the new run as GitHub doesn't return it immediately
-                import time
-                time.sleep(2)  # Wait a bit for the run to be created
-                
-                runs = self.fetch_pipeline_runs(pipeline_id, limit=1)
-                if runs:
-                    return runs[0]
-                
-                # If we can't find the run, return a pending run object
-                return PipelineRun(
-                    id=f"pending_{pipeline_id}",
-                    pipeline_id=pipeline_id,
-                    status=PipelineStatus.PENDING,
-                    parameters=parameters
-                )
-            else:
+            # The marker input is only sent to workflows declaring it
+            marker = TriggerHandle.new_id()
+            use_marker = bool(self.correlation_input) and (schema is None or self.correlation_input in schema.inputs)
+            if use_marker:
+                payload.setdefault('inputs', {})[self.correlation_input] = marker
+            
+            dispatched_at = datetime.now(timezone.utc)
+            response = self._post(dispatch_url, json=payload)
+            
+            if response.status_code != 204:
+                if response.status_code in (404, 422):
+                    # Workflow removed, renamed or changed its inputs
+                    self.workflow_cache.invalidate(pipeline_id)
                 raise Exception(f"Failed to trigger workflow: {response.status_code} - {response.text}")
+            
+            # GitHub doesn't return the new run; correlate it in the background
+            handle = get_correlator().track(
+                TriggerHandle(
+                    id=marker,
+                    provider=self.name,
+                    pipeline_id=pipeline_id,
+                    kind='dispatch',
+                    dispatched_at=dispatched_at,
+                    ref=payload['ref'],
+                    actor=self._actor(),
+                    marker=marker if use_marker else None
+                ),
+                self._resolve_dispatch
+            )
+            
+            return PipelineRun(
+                id=f"pending_{pipeline_id}",
+                pipeline_id=pipeline_id,
+                status=PipelineStatus.PENDING,
+                parameters=parameters,
+                tracking_id=handle.id
+            )
         
         except Exception as e:
-            print(f"Error triggering pipeline: {e}")
+            logger.error(f"Error triggering pipeline: {e}")
             raise
     
     def re_run_pipeline(self, run_id: str) -> PipelineRun:
         """
         Re-run a failed workflow run.
         
+        Re-runs keep the run ID; the new attempt is correlated in the
+        background and can be awaited through ``tracking_id``. The run's
+        attempt number is read before the request so the new attempt can
+        be told apart from the one being re-run.
+        
         Args:
             run_id: Run ID to re-run
             
@@ -275,38 +833,127 @@ class GitHubProvider(BaseProvider):
             raise ValueError("Owner and repo must be set")
         
         try:
-            url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/rerun'
-            response = self.session.post(url)
+            run_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}'
+            source = self._get(run_url)
+            source_data = source.json() if source.status_code == 200 else {}
             
-            if response.status_code == 201:
-                # Get the workflow ID first
-                run_info_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}'
-                run_info = self.session.get(run_info_url)
-                
-                if run_info.status_code == 200:
-                    workflow_id = run_info.json()['workflow_id']
-                    
-                    # Fetch the new run
-                    import time
-                    time.sleep(2)
-                    runs = self.fetch_pipeline_runs(str(workflow_id), limit=10)
-                    
-                    # Find the most recent run (should be the re-run)
-                    if runs:
-                        return runs[0]
-                
-                return PipelineRun(
-                    id=f"rerun_{run_id}",
-                    pipeline_id="unknown",
-                    status=PipelineStatus.PENDING
-                )
-            else:
+            dispatched_at = datetime.now(timezone.utc)
+            response = self._post(f'{run_url}/rerun')
+            
+            if response.status_code != 201:
                 raise Exception(f"Failed to re-run: {response.status_code} - {response.text}")
+            self._forget_run(run_id)
+            
+            pipeline_id = self._run_workflows.get(str(run_id)) or str(source_data.get('workflow_id', 'unknown'))
+            handle = get_correlator().track(
+                TriggerHandle(
+                    id=TriggerHandle.new_id(),
+                    provider=self.name,
+                    pipeline_id=pipeline_id,
+                    kind='rerun',
+                    dispatched_at=dispatched_at,
+                    source_run_id=str(run_id),
+                    source_attempt=source_data.get('run_attempt')
+                ),
+                self._resolve_rerun
+            )
+            
+            return PipelineRun(
+                id=str(run_id),
+                pipeline_id=pipeline_id,
+                status=PipelineStatus.PENDING,
+                tracking_id=handle.id
+            )
         
         except Exception as e:
-            print(f"Error re-running pipeline: {e}")
+            logger.error(f"Error re-running pipeline: {e}")
             raise
     
+    def _actor(self) -> Optional[str]:
+        """Login of the authenticated user, looked up once."""
+        if self._actor_login is None and self.token:
+            response = self._get(f'{self.base_url}/user')
+            if response.status_code == 200:
+                self._actor_login = response.json().get('login')
+        return self._actor_login
+    
+    def _resolve_dispatch(self, handle: TriggerHandle) -> List[PipelineRun]:
+        """
+        Find candidate runs for a workflow_dispatch handle.
+        
+        Args:
+            handle: Dispatch handle
+            
+        Returns:
+            Matching runs, oldest first
+        """
+        created_after = handle.dispatched_at - timedelta(seconds=self.correlation_skew)
+        params: Dict[str, Any] = {
+            'event': 'workflow_dispatch',
+            'created': f">={created_after.strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            'per_page': 20
+        }
+        if handle.ref:
+            params['branch'] = handle.ref.split('/')[-1] if handle.ref.startswith('refs/') else handle.ref
+        if handle.actor:
+            params['actor'] = handle.actor
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{handle.pipeline_id}/runs'
+        response = self._get(url, params=params)
+        if response.status_code != 200:
+            return []
+        
+        candidates = response.json().get('workflow_runs', [])
+        if handle.marker:
+            candidates = [
+                run for run in candidates
+                if handle.marker in (run.get('display_title') or run.get('name') or '')
+            ]
+        
+        candidates.sort(key=lambda run: (run.get('created_at') or '', run.get('id', 0)))
+        for run in candidates:
+            self._remember_run(run['id'], handle.pipeline_id)
+        return [self._build_run(run, handle.pipeline_id) for run in candidates]
+    
+    def _new_attempt(self, handle: TriggerHandle, run_data: Dict[str, Any]) -> bool:
+        """
+        Check whether a run payload shows the attempt started by a re-run.
+        
+        The attempt number decides when it was read before the request;
+        otherwise the attempt must have started after the request, within
+        the correlation skew.
+        """
+        if handle.source_attempt is not None:
+            return (run_data.get('run_attempt') or 1) > handle.source_attempt
+        
+        started = run_data.get('run_started_at') or run_data.get('created_at')
+        if not started:
+            return False
+        started_at = datetime.fromisoformat(started.replace('Z', '+00:00'))
+        return started_at >= handle.dispatched_at - timedelta(seconds=self.correlation_skew)
+    
+    def _resolve_rerun(self, handle: TriggerHandle) -> List[PipelineRun]:
+        """
+        Check whether the new attempt of a re-run has started.
+        
+        Args:
+            handle: Re-run handle
+            
+        Returns:
+            The re-run as a single-item list, or an empty list
+        """
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{handle.source_run_id}'
+        response = self._get(url)
+        if response.status_code != 200:
+            return []
+        
+        run_data = response.json()
+        if not self._new_attempt(handle, run_data):
+            return []
+        
+        handle.pipeline_id = str(run_data.get('workflow_id', handle.pipeline_id))
+        return [self._build_run(run_data, handle.pipeline_id)]
+    
     def cancel_pipeline(self, run_id: str) -> bool:
         """
         Cancel a running workflow.
@@ -322,21 +969,50 @@ class GitHubProvider(BaseProvider):
         
         try:
             url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/cancel'
-            response = self.session.post(url)
+            response = self._post(url)
             
             return response.status_code == 202
         
         except Exception as e:
-            print(f"Error cancelling pipeline: {e}")
+            logger.error(f"Error cancelling pipeline: {e}")
             return False
     
     def get_pipeline_status(self, pipeline_id: str) -> PipelineStatus:
-        """Get current workflow status."""
-        pipelines = self.fetch_pipelines()
-        for pipeline in pipelines:
-            if pipeline.id == pipeline_id:
-                return pipeline.status
-        return PipelineStatus.ERROR
+        """
+        Get current workflow status.
+        
+        Served from the status index while it is fresher than
+        ``status_max_age``; otherwise only this workflow's latest run
+        is fetched.
+        
+        Args:
+            pipeline_id: Workflow ID
+            
+        Returns:
+            PipelineStatus enum value
+        """
+        pipeline = self.indexed_pipeline(pipeline_id)
+        if pipeline is not None:
+            return pipeline.status
+        
+        try:
+            latest_run = self._fetch_latest_run(pipeline_id)
+        except RateLimitError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting pipeline status: {e}")
+            return PipelineStatus.ERROR
+        
+        known = self.pipeline_index.get(pipeline_id)
+        if latest_run is None:
+            # A workflow that never ran is pending, an unknown one is an error
+            exists = known is not None or self.get_workflow(pipeline_id) is not None
+            return PipelineStatus.PENDING if exists else PipelineStatus.ERROR
+        
+        if known is not None:
+            workflow = {'id': pipeline_id, 'name': known.name, 'html_url': known.url}
+            self.pipeline_index.put(self._build_pipeline(workflow, latest_run))
+        return self._map_status(latest_run)
     
     def get_available_parameters(self, workflow_id: str) -> Dict[str, Any]:
         """
@@ -352,32 +1028,20 @@ class GitHubProvider(BaseProvider):
             return {}
         
         try:
-            # Get workflow definition
-            url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}'
-            response = self.session.get(url)
-            
-            if response.status_code != 200:
+            schema = self.get_dispatch_inputs(workflow_id)
+            if schema is None or not schema.dispatchable:
                 return {}
             
-            workflow_data = response.json()
-            workflow_path = workflow_data.get('path')
-            
-            # Get workflow file content to parse inputs
-            # Note: This requires additional GitHub API call or parsing YAML
-            # For now, return basic structure
             return {
                 'ref': {
                     'type': 'string',
                     'description': 'Branch or tag to run workflow on',
                     'default': 'main'
                 },
-                'inputs': {
-                    'description': 'Workflow inputs (requires parsing workflow file)',
-                    'type': 'object'
-                }
+                'inputs': schema.inputs
             }
         
         except Exception as e:
-            print(f"Error getting workflow parameters: {e}")
+            logger.error(f"Error getting workflow parameters: {e}")
             return {}
 
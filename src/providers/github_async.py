@@ -0,0 +1,400 @@
+"""
+Asynchronous GitHub Actions provider implementation.
+
+Runs on the shared event loop with a pooled httpx client per API host,
+so hundreds of repositories can be polled without one OS thread per
+in-flight request. Requires the optional ``httpx`` dependency.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for github_async providers
+    httpx = None
+
+from src.providers.async_base import AsyncBaseProvider, AsyncProviderAdapter
+from src.providers.base import (
+    BaseProvider,
+    ProviderConfig,
+    Pipeline,
+    PipelineJob,
+    PipelineRun,
+    PipelineStatus
+)
+from src.providers.github import MAX_PAGE_SIZE, GitHubPayloadMixin, GitHubProvider
+from src.config import config as app_config
+from src.providers.rate_limit import RateLimitGovernor, get_governor
+from src.utils.errors import ConfigurationError, ProviderError
+
+logger = logging.getLogger(__name__)
+
+# Pooled clients shared by every async provider talking to the same host
+_clients: Dict[str, "httpx.AsyncClient"] = {}
+
+
+def _get_client(base_url: str, max_connections: int) -> "httpx.AsyncClient":
+    """
+    Get the pooled client for an API host, creating it on first use.
+    
+    Must be called from the shared event loop.
+    
+    Args:
+        base_url: API base URL
+        max_connections: Connection pool size for a newly created client
+    
+    Returns:
+        httpx.AsyncClient instance
+    """
+    client = _clients.get(base_url)
+    if client is None:
+        # Connection retries and timeouts follow the shared transport settings
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            retries=app_config.HTTP_MAX_RETRIES
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(app_config.HTTP_READ_TIMEOUT, connect=app_config.HTTP_CONNECT_TIMEOUT)
+        )
+        _clients[base_url] = client
+    return client
+
+
+class AsyncGitHubProvider(GitHubPayloadMixin, AsyncBaseProvider):
+    """
+    Asynchronous GitHub Actions provider.
+    
+    Listing, run history, jobs and cancellation run on the async client:
+    latest runs are batched per repository, and the per-workflow fallback
+    lookups are issued concurrently. Triggers, re-runs, workflow
+    parameters and log streaming are delegated to a GitHubProvider with
+    the same configuration, so they get its input validation, run
+    correlation and streaming.
+    """
+    
+    def __init__(self, config: ProviderConfig):
+        """
+        Initialize async GitHub provider.
+        
+        Args:
+            config: Provider configuration with GitHub token and repo info
+        
+        Raises:
+            ConfigurationError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ConfigurationError("The github_async provider requires httpx (pip install httpx)")
+        
+        super().__init__(config)
+        self.token = config.config.get('token')
+        self.owner = config.config.get('owner')
+        self.repo = config.config.get('repo')
+        self.base_url = config.config.get('base_url', 'https://api.github.com')
+        self.batch_run_pages = config.config.get('batch_run_pages', 3)
+        self.max_connections = config.config.get('max_connections', 100)
+        
+        self._request_count = 0
+        self.last_refresh_requests = 0
+        self.governor = get_governor()
+        self._sync: Optional[GitHubProvider] = None
+    
+    @property
+    def _headers(self) -> Dict[str, str]:
+        """Request headers, sent per request because the client is shared."""
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if self.token:
+            headers['Authorization'] = f'token {self.token}'
+        return headers
+    
+    @property
+    def _rate_limit_key(self) -> str:
+        """Rate-limit governor bucket for this provider's host and token."""
+        return RateLimitGovernor.bucket_key(self.base_url, self.token)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """
+        Issue a request through the pooled client and the rate-limit governor.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments passed to the client
+        
+        Returns:
+            Response object
+        """
+        await self.governor.acquire_async(self._rate_limit_key)
+        self._request_count += 1
+        client = _get_client(self.base_url, self.max_connections)
+        response = await client.request(method, url, headers=self._headers, **kwargs)
+        self.governor.update(self._rate_limit_key, response.headers, response.status_code)
+        return response
+    
+    async def _paginate_pages(
+        self,
+        url: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the pages of a listing by following ``Link: rel="next"``.
+        
+        Args:
+            url: Listing URL
+            key: Response key holding the items
+            params: Query parameters for the first page
+        
+        Yields:
+            Lists of items, one per page
+        
+        Raises:
+            ProviderError: If a page is answered with an error
+        """
+        next_url: Optional[str] = url
+        next_params = {'per_page': MAX_PAGE_SIZE, **(params or {})}
+        
+        while next_url:
+            response = await self._request('GET', next_url, params=next_params)
+            if response.status_code != 200:
+                raise ProviderError(f"GitHub API returned {response.status_code} for {next_url}", self.name)
+            
+            yield response.json().get(key, [])
+            
+            next_url = response.links.get('next', {}).get('url')
+            next_params = None
+    
+    async def validate_credentials(self) -> bool:
+        """
+        Validate GitHub credentials.
+        
+        Returns:
+            bool: True if credentials are valid
+        """
+        if not self.token:
+            return False
+        
+        try:
+            response = await self._request('GET', f'{self.base_url}/user')
+            return response.status_code == 200
+        except Exception:
+            return False
+    
+    async def fetch_pipelines(self) -> List[Pipeline]:
+        """
+        Fetch GitHub Actions workflows with their latest run.
+        
+        Returns:
+            List of Pipeline objects representing workflows
+        
+        Raises:
+            ProviderError: If GitHub answers a listing with an error
+        """
+        if not self.owner or not self.repo:
+            return []
+        
+        requests_before = self._request_count
+        repo_url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions'
+        
+        try:
+            workflows = []
+            async for page in self._paginate_pages(f'{repo_url}/workflows', 'workflows'):
+                workflows.extend(page)
+            
+            wanted = {workflow['id'] for workflow in workflows}
+            latest_runs: Dict[int, Dict[str, Any]] = {}
+            pages_read = 0
+            async for page in self._paginate_pages(f'{repo_url}/runs', 'workflow_runs'):
+                for run in page:
+                    latest_runs.setdefault(run.get('workflow_id'), run)
+                pages_read += 1
+                if pages_read >= self.batch_run_pages or wanted.issubset(latest_runs):
+                    break
+            
+            # Workflows without a run in the batched window are looked up concurrently
+            missing = [workflow_id for workflow_id in wanted if workflow_id not in latest_runs]
+            fallbacks = await asyncio.gather(*(self._fetch_latest_run(wid) for wid in missing))
+            latest_runs.update({wid: run for wid, run in zip(missing, fallbacks) if run})
+            
+            return [self._build_pipeline(workflow, latest_runs.get(workflow['id'])) for workflow in workflows]
+        
+        finally:
+            self.last_refresh_requests = self._request_count - requests_before
+    
+    async def _fetch_latest_run(self, workflow_id: Any) -> Optional[Dict[str, Any]]:
+        """Fetch the latest run of a single workflow."""
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}/runs'
+        response = await self._request('GET', url, params={'per_page': 1})
+        if response.status_code == 200:
+            runs = response.json().get('workflow_runs', [])
+            if runs:
+                return runs[0]
+        return None
+    
+    async def fetch_pipeline_runs(self, pipeline_id: str, limit: int = 10) -> List[PipelineRun]:
+        """
+        Fetch workflow run history.
+        
+        Args:
+            pipeline_id: Workflow ID
+            limit: Maximum number of runs to fetch
+        
+        Returns:
+            List of PipelineRun objects
+        """
+        if not self.owner or not self.repo:
+            return []
+        
+        runs: List[PipelineRun] = []
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{pipeline_id}/runs'
+        
+        try:
+            async for page in self._paginate_pages(url, 'workflow_runs', {'per_page': min(limit, MAX_PAGE_SIZE)}):
+                runs.extend(self._build_run(run_data, pipeline_id) for run_data in page)
+                if len(runs) >= limit:
+                    break
+        except Exception as e:
+            logger.error(f"Error fetching pipeline runs for {self.name}: {e}")
+        
+        return runs[:limit]
+    
+    async def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """
+        Fetch the jobs and steps of the latest attempt of a workflow run.
+        
+        Args:
+            run_id: Run ID
+        
+        Returns:
+            List of PipelineJob objects with their steps
+        """
+        if not self.owner or not self.repo:
+            return []
+        
+        jobs: List[PipelineJob] = []
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/jobs'
+        async for page in self._paginate_pages(url, 'jobs'):
+            jobs.extend(self._build_job(job_data, run_id) for job_data in page)
+        return jobs
+    
+    def _sync_provider(self) -> GitHubProvider:
+        """GitHubProvider with the same configuration, for the delegated operations."""
+        if self._sync is None:
+            self._sync = GitHubProvider(self.config)
+        return self._sync
+    
+    async def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
+        """
+        Trigger a workflow via workflow_dispatch.
+        
+        Delegated to GitHubProvider in a worker thread, so inputs are
+        validated locally and the run is correlated through ``tracking_id``.
+        
+        Args:
+            pipeline_id: Workflow ID to trigger
+            parameters: Input parameters (ref and inputs) for the workflow
+        
+        Returns:
+            PipelineRun object for the triggered run
+        
+        Raises:
+            ValidationError: If the inputs don't match the workflow's dispatch inputs
+        """
+        return await asyncio.to_thread(self._sync_provider().trigger_pipeline, pipeline_id, parameters)
+    
+    async def re_run_pipeline(self, run_id: str) -> PipelineRun:
+        """
+        Re-run a workflow run.
+        
+        Delegated to GitHubProvider in a worker thread, so the new attempt
+        is correlated through ``tracking_id``.
+        
+        Args:
+            run_id: Run ID to re-run
+        
+        Returns:
+            PipelineRun object for the new run attempt
+        """
+        return await asyncio.to_thread(self._sync_provider().re_run_pipeline, run_id)
+    
+    async def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """
+        Fetch the current state and attempt of a workflow run.
+        
+        Args:
+            run_id: Run ID
+        
+        Returns:
+            PipelineRun object, or None if the run doesn't exist
+        
+        Raises:
+            ProviderError: If GitHub answers with an error
+        """
+        if not self.owner or not self.repo:
+            return None
+        
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}'
+        response = await self._request('GET', url)
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise ProviderError(f"GitHub API returned {response.status_code} for {url}", self.name)
+        run_data = response.json()
+        return self._build_run(run_data, str(run_data['workflow_id']))
+    
+    async def get_available_parameters(self, pipeline_id: str) -> Dict[str, Any]:
+        """Get workflow inputs through GitHubProvider in a worker thread."""
+        return await asyncio.to_thread(self._sync_provider().get_available_parameters, pipeline_id)
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the log archive of a run through GitHubProvider."""
+        return self._sync_provider().stream_run_logs(run_id, chunk_size)
+    
+    async def cancel_pipeline(self, run_id: str) -> bool:
+        """
+        Cancel a running workflow.
+        
+        Args:
+            run_id: Run ID to cancel
+        
+        Returns:
+            bool: True if cancellation was successful
+        """
+        if not self.owner or not self.repo:
+            return False
+        
+        try:
+            url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/cancel'
+            response = await self._request('POST', url)
+            return response.status_code == 202
+        except Exception as e:
+            logger.error(f"Error cancelling pipeline: {e}")
+            return False
+    
+    async def get_pipeline_status(self, pipeline_id: str) -> PipelineStatus:
+        """Get current workflow status from its latest run."""
+        latest_run = await self._fetch_latest_run(pipeline_id)
+        if latest_run:
+            return self._map_status(latest_run)
+        
+        # A workflow that never ran is pending, an unknown one is an error
+        url = f'{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{pipeline_id}'
+        response = await self._request('GET', url)
+        return PipelineStatus.PENDING if response.status_code == 200 else PipelineStatus.ERROR
+
+
+def create_provider(config: ProviderConfig) -> BaseProvider:
+    """
+    Create an async GitHub provider behind the synchronous provider interface.
+    
+    Used as the ``github_async`` provider plugin.
+    
+    Args:
+        config: Provider configuration
+    
+    Returns:
+        AsyncProviderAdapter wrapping an AsyncGitHubProvider
+    """
+    return AsyncProviderAdapter(AsyncGitHubProvider(config))
@@ -0,0 +1,398 @@
+"""
+GraphQL batch backend for GitHub providers.
+
+Loads the latest workflow-run status of many repositories with a single
+GraphQL query, so polling dozens of single-repository GitHub providers
+costs a handful of requests instead of one REST fan-out per repository.
+Results are mapped to the regular Pipeline dataclass.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.providers.base import BaseProvider, Pipeline, PipelineStatus
+from src.providers.rate_limit import RateLimitGovernor, get_governor
+
+logger = logging.getLogger(__name__)
+
+REPOSITORY_FIELDS = '''
+    nameWithOwner
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: %(commit_depth)d) {
+            nodes {
+              oid
+              message
+              author { name }
+              checkSuites(first: %(suite_depth)d) {
+                nodes {
+                  status
+                  conclusion
+                  branch { name }
+                  workflowRun {
+                    databaseId
+                    createdAt
+                    updatedAt
+                    workflow { databaseId name url }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+'''
+
+
+def graphql_url(base_url: str) -> str:
+    """
+    Derive the GraphQL endpoint from a REST API base URL.
+    
+    Args:
+        base_url: REST API base URL (github.com or GitHub Enterprise)
+    
+    Returns:
+        GraphQL endpoint URL
+    """
+    base_url = base_url.rstrip('/')
+    if base_url.endswith('/api/v3'):
+        return base_url[:-len('/v3')] + '/graphql'
+    return base_url + '/graphql'
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse an API timestamp into an aware datetime."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class GraphQLBatchFetcher:
+    """
+    Fetches the latest workflow status of many GitHub repositories at once.
+    
+    Compatible providers are grouped by API host and token, and every
+    group is loaded with as few GraphQL queries as the point budget allows.
+    Batch size adapts to the observed query cost: it shrinks when a query
+    costs more than ``max_query_cost`` points or when the remaining
+    GraphQL quota runs low.
+    
+    Only workflows with a recent run on the default branch show up in the
+    GraphQL result, so the first refresh of a provider goes through its
+    REST path and later refreshes merge onto that snapshot. The snapshot
+    is reseeded through REST every ``reseed_interval`` seconds, which
+    picks up runs on other branches and drops deleted workflows.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int = 25,
+        max_query_cost: int = 50,
+        commit_depth: int = 5,
+        suite_depth: int = 20,
+        governor: Optional[RateLimitGovernor] = None,
+        reseed_interval: float = 600,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize GraphQL batch fetcher.
+        
+        Args:
+            max_batch_size: Maximum number of repositories per query
+            max_query_cost: Target upper bound of rate-limit points per query
+            commit_depth: Number of recent default-branch commits inspected
+            suite_depth: Number of check suites inspected per commit
+            governor: Rate-limit governor, defaults to the global one
+            reseed_interval: Seconds after which a snapshot is reloaded through REST
+            clock: Monotonic time source
+        """
+        self.max_batch_size = max_batch_size
+        self.max_query_cost = max_query_cost
+        self.commit_depth = commit_depth
+        self.suite_depth = suite_depth
+        self.governor = governor or get_governor()
+        self.reseed_interval = reseed_interval
+        self._clock = clock
+        
+        self._cost_per_repo: Dict[Tuple[str, str], float] = {}
+        self._remaining: Dict[Tuple[str, str], int] = {}
+        self._snapshots: Dict[str, Dict[str, Pipeline]] = {}
+        self._seeded_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def supports(provider: BaseProvider) -> bool:
+        """
+        Check whether a provider can be served by the batch backend.
+        
+        Args:
+            provider: Provider instance
+        
+        Returns:
+            bool: True if the provider opted in and targets a single repository
+        """
+        return bool(
+            getattr(provider, 'graphql_batch', False)
+            and getattr(provider, 'owner', None)
+            and getattr(provider, 'repo', None)
+            and getattr(provider, 'token', None)
+        )
+    
+    @staticmethod
+    def group(providers: List[BaseProvider]) -> Dict[Tuple[str, str], List[BaseProvider]]:
+        """
+        Group compatible providers by GraphQL endpoint and token.
+        
+        Args:
+            providers: Compatible provider instances
+        
+        Returns:
+            Dictionary mapping (endpoint, token) to providers
+        """
+        groups: Dict[Tuple[str, str], List[BaseProvider]] = {}
+        for provider in providers:
+            groups.setdefault(GraphQLBatchFetcher.group_key(provider), []).append(provider)
+        return groups
+    
+    @staticmethod
+    def group_key(provider: BaseProvider) -> Tuple[str, str]:
+        """
+        Get the batch group of a compatible provider.
+        
+        Args:
+            provider: Compatible provider instance
+        
+        Returns:
+            Tuple of GraphQL endpoint and token
+        """
+        return (graphql_url(provider.base_url), provider.token)
+    
+    def fetch(
+        self,
+        providers: List[BaseProvider],
+        load: Optional[Callable[[BaseProvider], List[Pipeline]]] = None
+    ) -> Dict[str, Union[List[Pipeline], BaseException]]:
+        """
+        Fetch pipelines for a group of providers sharing endpoint and token.
+        
+        A provider whose REST load fails gets its error in the result
+        instead of failing the whole group.
+        
+        Args:
+            providers: Providers from a single group
+            load: Loads a provider through REST for its first snapshot and
+                  reseeds, defaults to the provider's own fetch_pipelines
+        
+        Returns:
+            Dictionary mapping provider name to its pipelines or the raised error
+        """
+        results: Dict[str, Union[List[Pipeline], BaseException]] = {}
+        pending: List[BaseProvider] = []
+        
+        for provider in providers:
+            if self.needs_seed(provider.name):
+                # Load the full workflow list through REST on first sight and now and then
+                results[provider.name] = self._seed(provider, load)
+            else:
+                pending.append(provider)
+        
+        if not pending:
+            return results
+        
+        key = (graphql_url(pending[0].base_url), pending[0].token)
+        start = 0
+        while start < len(pending):
+            batch = pending[start:start + self._batch_size(key)]
+            start += len(batch)
+            results.update(self._fetch_batch(key, batch))
+        
+        return results
+    
+    def needs_seed(self, provider_name: str) -> bool:
+        """
+        Check whether a provider's snapshot is missing or due for a REST reload.
+        
+        Args:
+            provider_name: Provider name
+        
+        Returns:
+            True if the next fetch loads the provider through REST
+        """
+        with self._lock:
+            seeded_at = self._seeded_at.get(provider_name)
+        return seeded_at is None or self._clock() - seeded_at >= self.reseed_interval
+    
+    def _seed(
+        self,
+        provider: BaseProvider,
+        load: Optional[Callable[[BaseProvider], List[Pipeline]]] = None
+    ) -> Union[List[Pipeline], BaseException]:
+        """Fetch a provider through REST and replace its snapshot, returning any error raised."""
+        try:
+            pipelines = load(provider) if load else provider.fetch_pipelines()
+        except Exception as e:
+            logger.warning(f"REST load of {provider.name} failed: {e}")
+            return e
+        with self._lock:
+            self._snapshots[provider.name] = {pipeline.id: pipeline for pipeline in pipelines}
+            self._seeded_at[provider.name] = self._clock()
+        return pipelines
+    
+    def _batch_size(self, key: Tuple[str, str]) -> int:
+        """Compute how many repositories fit in the next query's point budget."""
+        with self._lock:
+            cost_per_repo = self._cost_per_repo.get(key)
+            remaining = self._remaining.get(key)
+        
+        if not cost_per_repo:
+            return self.max_batch_size
+        
+        budget = self.max_query_cost
+        if remaining is not None:
+            # Never let a single query eat more than a small slice of what's left
+            budget = min(budget, max(1, remaining // 10))
+        
+        return max(1, min(self.max_batch_size, int(budget / cost_per_repo)))
+    
+    def _build_query(self, batch: List[BaseProvider]) -> str:
+        """Build an aliased query covering every repository in the batch."""
+        fields = REPOSITORY_FIELDS % {
+            'commit_depth': self.commit_depth,
+            'suite_depth': self.suite_depth
+        }
+        parts = [
+            f'r{index}: repository(owner: {json.dumps(provider.owner)}, name: {json.dumps(provider.repo)}) {{{fields}}}'
+            for index, provider in enumerate(batch)
+        ]
+        parts.append('rateLimit { cost remaining limit resetAt }')
+        return 'query {\n' + '\n'.join(parts) + '\n}'
+    
+    def _fetch_batch(
+        self,
+        key: Tuple[str, str],
+        batch: List[BaseProvider]
+    ) -> Dict[str, Union[List[Pipeline], BaseException]]:
+        """Run one batched query and map the result back to each provider."""
+        url, token = key
+        first = batch[0]
+        rate_limit_key = RateLimitGovernor.bucket_key(first.base_url, token, resource='graphql')
+        
+        self.governor.acquire(rate_limit_key)
+        response = first.session.post(url, json={'query': self._build_query(batch)}, headers=first._headers)
+        self.governor.update(rate_limit_key, response.headers, response.status_code)
+        
+        if response.status_code != 200:
+            logger.warning(f"GraphQL batch failed with {response.status_code}, falling back to REST")
+            return {provider.name: self._seed(provider) for provider in batch}
+        
+        payload = response.json()
+        data = payload.get('data') or {}
+        self._record_cost(key, data.get('rateLimit'), len(batch))
+        
+        results = {}
+        for index, provider in enumerate(batch):
+            repository = data.get(f'r{index}')
+            if repository is None:
+                # Missing or inaccessible repository; let REST report it
+                results[provider.name] = self._seed(provider)
+            else:
+                results[provider.name] = self._merge(provider, repository)
+        return results
+    
+    def _record_cost(self, key: Tuple[str, str], rate_limit: Optional[Dict[str, Any]], batch_size: int) -> None:
+        """Remember the observed cost per repository and the remaining points."""
+        if not rate_limit:
+            return
+        
+        cost = rate_limit.get('cost') or 1
+        with self._lock:
+            observed = cost / batch_size
+            previous = self._cost_per_repo.get(key)
+            self._cost_per_repo[key] = observed if previous is None else (previous + observed) / 2
+            self._remaining[key] = rate_limit.get('remaining')
+        
+        logger.debug(f"GraphQL batch of {batch_size} repositories cost {cost} points")
+    
+    def _merge(self, provider: BaseProvider, repository: Dict[str, Any]) -> List[Pipeline]:
+        """
+        Merge the latest run per workflow onto the provider's snapshot.
+        
+        The query only covers recent default-branch commits, so a snapshot
+        entry is replaced only by the same run or a newer one; a newer run
+        on another branch, known from the REST seed, is kept until the
+        next reseed.
+        """
+        latest: Dict[str, Pipeline] = {}
+        target = (repository.get('defaultBranchRef') or {}).get('target') or {}
+        
+        for commit in (target.get('history') or {}).get('nodes', []):
+            for suite in (commit.get('checkSuites') or {}).get('nodes', []):
+                run = suite.get('workflowRun')
+                if not run or not run.get('workflow'):
+                    continue
+                pipeline = self._build_pipeline(provider, repository, commit, suite, run)
+                if self._supersedes(pipeline, latest.get(pipeline.id)):
+                    latest[pipeline.id] = pipeline
+        
+        with self._lock:
+            snapshot = self._snapshots.setdefault(provider.name, {})
+            for workflow_id, pipeline in latest.items():
+                if self._supersedes(pipeline, snapshot.get(workflow_id)):
+                    snapshot[workflow_id] = pipeline
+            return list(snapshot.values())
+    
+    @staticmethod
+    def _supersedes(pipeline: Pipeline, current: Optional[Pipeline]) -> bool:
+        """Check whether a workflow's run replaces the one known so far: same run, or created later."""
+        if current is None or current.started_at is None or pipeline.run_id == current.run_id:
+            return True
+        if pipeline.started_at is None:
+            return False
+        return _parse_time(pipeline.started_at) > _parse_time(current.started_at)
+    
+    @staticmethod
+    def _build_pipeline(
+        provider: BaseProvider,
+        repository: Dict[str, Any],
+        commit: Dict[str, Any],
+        suite: Dict[str, Any],
+        run: Dict[str, Any]
+    ) -> Pipeline:
+        """Map a check suite and its workflow run to a Pipeline."""
+        status = provider._map_status({
+            'status': (suite.get('status') or '').lower(),
+            'conclusion': (suite.get('conclusion') or '').lower() or None
+        })
+        if suite.get('status') in ('REQUESTED', 'WAITING', 'PENDING'):
+            status = PipelineStatus.PENDING
+        
+        return Pipeline(
+            id=str(run['workflow']['databaseId']),
+            name=run['workflow']['name'],
+            status=status,
+            repository=repository.get('nameWithOwner', f"{provider.owner}/{provider.repo}"),
+            branch=(suite.get('branch') or {}).get('name', 'unknown'),
+            commit=commit.get('oid', ''),
+            commit_message=commit.get('message', ''),
+            author=(commit.get('author') or {}).get('name', ''),
+            started_at=run.get('createdAt'),
+            finished_at=run.get('updatedAt') if suite.get('status') == 'COMPLETED' else None,
+            url=run['workflow'].get('url', ''),
+            provider=provider.name,
+            run_id=str(run['databaseId']) if run.get('databaseId') is not None else None
+        )
+    
+    def forget(self, provider_name: str) -> None:
+        """
+        Drop the snapshot of a provider.
+        
+        Args:
+            provider_name: Provider name
+        """
+        with self._lock:
+            self._snapshots.pop(provider_name, None)
+            self._seeded_at.pop(provider_name, None)
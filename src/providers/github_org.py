@@ -0,0 +1,386 @@
+"""
+Organization-wide GitHub Actions provider.
+
+Watches every repository of a GitHub organization through a single
+provider instance, instead of one provider (and one session and keyring
+lookup) per repository.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatch
+from typing import List, Dict, Any, Iterator, Optional, Union
+
+from src.providers.base import (
+    ProviderConfig,
+    Pipeline,
+    PipelineJob,
+    PipelineRun,
+    PipelineStatus
+)
+from src.providers.github import GitHubProvider
+from src.providers.transport import get_transport
+from src.utils.errors import ProviderError
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubOrgProvider(GitHubProvider):
+    """
+    GitHub Actions provider covering a whole organization.
+    
+    Repositories are discovered from the organization listing and
+    filtered with include/exclude glob patterns and an archived filter.
+    Their workflow status is fetched concurrently, up to
+    ``max_concurrency`` at a time, over one shared connection pool.
+    Repositories without a push for ``idle_after_days`` are re-checked
+    only every ``idle_recheck_interval`` seconds.
+    
+    Configuration keys:
+        org: Organization login
+        include: Glob patterns of repositories to watch (default: all)
+        exclude: Glob patterns of repositories to skip
+        include_archived: Whether archived repositories are watched
+        max_concurrency: Maximum number of repositories fetched at once
+        discovery_interval: Seconds between repository re-discovery
+        idle_after_days: Days without a push after which a repository is idle
+        idle_recheck_interval: Seconds between refreshes of idle repositories
+    """
+    
+    def __init__(self, config: ProviderConfig):
+        """
+        Initialize GitHub organization provider.
+        
+        Args:
+            config: Provider configuration with GitHub token and organization
+        """
+        # Work on a copy so the caller's configuration is left untouched
+        options = dict(config.config)
+        if options.get('org') and not options.get('owner'):
+            options['owner'] = options['org']
+        config = replace(config, config=options)
+        
+        super().__init__(config)
+        self.org = self.owner
+        self.repo = None
+        
+        self.include = options.get('include') or ['*']
+        self.exclude = options.get('exclude') or []
+        self.include_archived = options.get('include_archived', False)
+        self.max_concurrency = options.get('max_concurrency', 8)
+        self.discovery_interval = options.get('discovery_interval', 600)
+        self.idle_after = timedelta(days=options.get('idle_after_days', 30))
+        self.idle_recheck_interval = options.get('idle_recheck_interval', 3600)
+        
+        # One keep-alive pool large enough for every concurrent repository fetch
+        self.session = get_transport().session_for(self.base_url, pool_maxsize=self.max_concurrency)
+        
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._repositories: Dict[str, Dict[str, Any]] = {}
+        self._discovered_at = 0.0
+        self._children: Dict[str, GitHubProvider] = {}
+        self._repo_pipelines: Dict[str, List[Pipeline]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._pipeline_repos: Dict[str, str] = {}
+        self._run_repos: Dict[str, str] = {}
+    
+    def validate_credentials(self) -> bool:
+        """
+        Validate GitHub credentials against the organization.
+        
+        Returns:
+            bool: True if the organization is accessible
+        """
+        if not self.token or not self.org:
+            return False
+        
+        try:
+            response = self._get(f'{self.base_url}/orgs/{self.org}')
+            return response.status_code == 200
+        except Exception:
+            return False
+    
+    def discover_repositories(self, force: bool = False) -> List[str]:
+        """
+        Discover the organization repositories matching the filters.
+        
+        The listing is cached for ``discovery_interval`` seconds.
+        
+        Args:
+            force: Re-discover even if the cached listing is still fresh
+        
+        Returns:
+            List of watched repository names
+        """
+        if not force and self._repositories and time.time() - self._discovered_at < self.discovery_interval:
+            return list(self._repositories)
+        
+        repositories = {}
+        url = f'{self.base_url}/orgs/{self.org}/repos'
+        for repository in self._paginate(url, None, {'type': 'all'}):
+            if self._is_watched(repository):
+                repositories[repository['name']] = repository
+        
+        with self._lock:
+            self._repositories = repositories
+            self._discovered_at = time.time()
+            for name in list(self._children):
+                if name not in repositories:
+                    self._forget_repository(name)
+        
+        logger.debug(f"{self.name}: watching {len(repositories)} repositories in {self.org}")
+        return list(repositories)
+    
+    def _is_watched(self, repository: Dict[str, Any]) -> bool:
+        """Apply the archived filter and include/exclude patterns."""
+        name = repository.get('name', '')
+        if repository.get('archived') and not self.include_archived:
+            return False
+        if not any(fnmatch(name, pattern) for pattern in self.include):
+            return False
+        return not any(fnmatch(name, pattern) for pattern in self.exclude)
+    
+    def _forget_repository(self, name: str) -> None:
+        """Drop all state kept for a repository that is no longer watched."""
+        self._children.pop(name, None)
+        self._repo_pipelines.pop(name, None)
+        self._checked_at.pop(name, None)
+        for mapping in (self._pipeline_repos, self._run_repos):
+            for key in [key for key, repo in mapping.items() if repo == name]:
+                del mapping[key]
+    
+    def _child(self, name: str) -> GitHubProvider:
+        """Get the per-repository provider, sharing this provider's session."""
+        with self._lock:
+            child = self._children.get(name)
+            if child is None:
+                child_config = ProviderConfig(
+                    name=self.name,
+                    provider_type='github',
+                    enabled=self.config.enabled,
+                    refresh_interval=self.config.refresh_interval,
+                    config={**self.config.config, 'owner': self.org, 'repo': name}
+                )
+                child = GitHubProvider(child_config, session=self.session)
+                self._children[name] = child
+            return child
+    
+    def _is_due(self, name: str, now: float) -> bool:
+        """Check whether a repository should be refreshed in this cycle."""
+        checked_at = self._checked_at.get(name)
+        if checked_at is None:
+            return True
+        
+        # Repositories with activity in flight are always refreshed
+        pipelines = self._repo_pipelines.get(name, [])
+        if any(p.status == PipelineStatus.RUNNING for p in pipelines):
+            return True
+        
+        pushed_at = self._repositories.get(name, {}).get('pushed_at')
+        if pushed_at:
+            pushed = datetime.fromisoformat(pushed_at.replace('Z', '+00:00'))
+            if datetime.now(timezone.utc) - pushed > self.idle_after:
+                return now - checked_at >= self.idle_recheck_interval
+        
+        return True
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded executor used for concurrent repository fetches."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix=f'flowforge-{self.name}'
+            )
+        return self._executor
+    
+    def _refresh_repository(self, name: str) -> List[Pipeline]:
+        """Fetch and remember the pipelines of a single repository."""
+        pipelines = self._child(name).fetch_pipelines()
+        with self._lock:
+            self._repo_pipelines[name] = pipelines
+            self._checked_at[name] = time.time()
+            for pipeline in pipelines:
+                self._pipeline_repos[pipeline.id] = name
+        return pipelines
+    
+    def _refresh_repositories(self, names: List[str]) -> Dict[str, Exception]:
+        """
+        Refresh repositories concurrently.
+        
+        Args:
+            names: Repositories to refresh
+        
+        Returns:
+            Errors of the repositories that failed, by name
+        """
+        # Each fetch runs in a copy of the caller's context to keep its request priority
+        futures = {
+            name: self._get_executor().submit(copy_context().run, self._refresh_repository, name)
+            for name in names
+        }
+        
+        errors = {}
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error fetching pipelines of {self.org}/{name}: {e}")
+                errors[name] = e
+        return errors
+    
+    def fetch_pipelines(self) -> List[Pipeline]:
+        """
+        Fetch workflows of every watched repository concurrently.
+        
+        Idle repositories that are not due for a re-check are served from
+        the previous refresh. A failing repository is logged and keeps its
+        previous pipelines; only when every due repository fails is the
+        refresh reported as failed, so the circuit breaker sees it.
+        
+        Returns:
+            List of Pipeline objects across the organization
+        
+        Raises:
+            ProviderError: If no due repository could be refreshed
+        """
+        if not self.org:
+            return []
+        
+        requests_before = self._request_count
+        try:
+            names = self.discover_repositories()
+        except Exception as e:
+            if not self._repositories:
+                raise
+            logger.error(f"Error discovering repositories of {self.org}: {e}")
+            names = list(self._repositories)
+        
+        now = time.time()
+        due = [name for name in names if self._is_due(name, now)]
+        errors = self._refresh_repositories(due)
+        if due and len(errors) == len(due):
+            raise ProviderError(
+                f"Failed to fetch all {len(due)} due repositories of {self.org}: {next(iter(errors.values()))}",
+                self.name
+            )
+        
+        self.last_refresh_requests = (
+            self._request_count - requests_before
+            + sum(self._children[name].last_refresh_requests for name in due if name in self._children)
+        )
+        logger.debug(
+            f"{self.name}: refreshed {len(due)} of {len(names)} repositories "
+            f"with {self.last_refresh_requests} requests"
+        )
+        
+        with self._lock:
+            return [p for name in names for p in self._repo_pipelines.get(name, [])]
+    
+    def iter_pipelines(self) -> Iterator[Pipeline]:
+        """
+        Iterate over workflows of every watched repository.
+        
+        Yields:
+            Pipeline objects across the organization
+        """
+        yield from self.fetch_pipelines()
+    
+    def _repo_for_pipeline(self, pipeline_id: str) -> str:
+        """Resolve the repository owning a workflow."""
+        name = self._pipeline_repos.get(str(pipeline_id))
+        if name is None:
+            self.fetch_pipelines()
+            name = self._pipeline_repos.get(str(pipeline_id))
+        if name is None:
+            raise ValueError(f"Unknown workflow {pipeline_id} in organization {self.org}")
+        return name
+    
+    def _repo_for_run(self, run_id: str) -> str:
+        """
+        Resolve the repository owning a run.
+        
+        Runs are known once listed, iterated or correlated after a
+        trigger through this provider; other runs are rejected instead of
+        being searched for in every repository.
+        """
+        name = self._run_repos.get(str(run_id))
+        if name is not None:
+            return name
+        
+        with self._lock:
+            children = list(self._children.items())
+        for name, child in children:
+            if str(run_id) in child._run_workflows:
+                self._run_repos[str(run_id)] = name
+                return name
+        raise ValueError(f"Unknown run {run_id} in organization {self.org}")
+    
+    def iter_runs(
+        self,
+        pipeline_id: str,
+        since: Optional[Union[str, datetime]] = None,
+        page_size: int = 100
+    ) -> Iterator[PipelineRun]:
+        """
+        Iterate over runs of a workflow in its owning repository.
+        
+        Args:
+            pipeline_id: Workflow ID
+            since: Only yield runs created at or after this time
+            page_size: Number of runs requested per page
+        
+        Yields:
+            PipelineRun objects
+        """
+        name = self._repo_for_pipeline(pipeline_id)
+        for run in self._child(name).iter_runs(pipeline_id, since=since, page_size=page_size):
+            self._run_repos[run.id] = name
+            yield run
+    
+    def trigger_pipeline(self, pipeline_id: str, parameters: Dict[str, Any] = None) -> PipelineRun:
+        """Trigger a workflow in its owning repository."""
+        return self._child(self._repo_for_pipeline(pipeline_id)).trigger_pipeline(pipeline_id, parameters)
+    
+    def re_run_pipeline(self, run_id: str) -> PipelineRun:
+        """Re-run a workflow run in its owning repository."""
+        return self._child(self._repo_for_run(run_id)).re_run_pipeline(run_id)
+    
+    def fetch_run(self, run_id: str) -> Optional[PipelineRun]:
+        """Fetch the state of a workflow run from its owning repository."""
+        return self._child(self._repo_for_run(run_id)).fetch_run(run_id)
+    
+    def fetch_run_jobs(self, run_id: str) -> List[PipelineJob]:
+        """Fetch the jobs of a workflow run in its owning repository."""
+        return self._child(self._repo_for_run(run_id)).fetch_run_jobs(run_id)
+    
+    def stream_run_logs(self, run_id: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the log archive of a workflow run from its owning repository."""
+        return self._child(self._repo_for_run(run_id)).stream_run_logs(run_id, chunk_size)
+    
+    def cancel_pipeline(self, run_id: str) -> bool:
+        """Cancel a workflow run in its owning repository."""
+        return self._child(self._repo_for_run(run_id)).cancel_pipeline(run_id)
+    
+    def get_pipeline_status(self, pipeline_id: str) -> PipelineStatus:
+        """Get current workflow status from the index or its owning repository."""
+        pipeline = self.indexed_pipeline(pipeline_id)
+        if pipeline is not None:
+            return pipeline.status
+        return self._child(self._repo_for_pipeline(pipeline_id)).get_pipeline_status(pipeline_id)
+    
+    def invalidate_workflow_metadata(self, workflow_id: Optional[str] = None) -> None:
+        """Drop cached workflow metadata in every repository."""
+        with self._lock:
+            children = list(self._children.values())
+        for child in children:
+            child.invalidate_workflow_metadata(workflow_id)
+    
+    def get_available_parameters(self, workflow_id: str) -> Dict[str, Any]:
+        """Get workflow inputs from its owning repository."""
+        return self._child(self._repo_for_pipeline(workflow_id)).get_available_parameters(workflow_id)
@@ -0,0 +1,193 @@
+"""
+Conditional-request cache for provider HTTP sessions.
+
+Stores the ETag/Last-Modified validators and the parsed JSON body of
+GET responses, so repeated polls can be answered with a 304 Not Modified
+reply instead of a full download. On GitHub, 304 replies do not count
+against the primary rate limit.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached validators and parsed body for a single URL.
+    
+    Attributes:
+        data: Parsed JSON body
+        etag: ETag validator returned by the server
+        last_modified: Last-Modified validator returned by the server
+        headers: Response headers of the original 200 reply
+        links: Parsed Link header of the original 200 reply
+        size: Approximate size of the body in bytes
+    """
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    links: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    size: int = 0
+
+
+class CachedResponse:
+    """
+    Response-like wrapper around a cached or freshly parsed JSON body.
+    
+    Exposes the subset of the ``requests.Response`` interface used by
+    providers, so cached replies can be used interchangeably with real ones.
+    """
+    
+    def __init__(self, entry: CacheEntry, from_cache: bool, headers: Optional[Dict[str, str]] = None):
+        self._entry = entry
+        self.status_code = 200
+        self.from_cache = from_cache
+        self.headers = requests.structures.CaseInsensitiveDict(headers or entry.headers)
+        self.links = entry.links
+    
+    def json(self) -> Any:
+        """Return the parsed body without re-parsing."""
+        return self._entry.data
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of conditional GET responses.
+    
+    Entries are keyed by URL, query parameters and the Authorization
+    header, so sessions shared between tokens never leak data across them.
+    The cache is bounded both by entry count and by approximate body size.
+    """
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize response cache.
+        
+        Args:
+            max_entries: Maximum number of cached URLs
+            max_bytes: Maximum total size of cached bodies in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        
+        # A hit is a 304 reply served from the cache; anything else is a miss
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _make_key(url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Tuple:
+        params_key = tuple(sorted((params or {}).items()))
+        auth = (headers or {}).get('Authorization')
+        return (url, params_key, auth)
+    
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ):
+        """
+        Issue a conditional GET request through the given session.
+        
+        Args:
+            session: Session used to send the request
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+            **kwargs: Additional arguments passed to ``session.get``
+        
+        Returns:
+            CachedResponse for 200/304 replies, the raw response otherwise
+        """
+        request_headers = dict(headers or {})
+        key = self._make_key(url, params, {**session.headers, **request_headers})
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        
+        if entry is not None:
+            if entry.etag:
+                request_headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                request_headers['If-Modified-Since'] = entry.last_modified
+        
+        response = session.get(url, params=params, headers=request_headers, **kwargs)
+        
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.hits += 1
+            return CachedResponse(entry, from_cache=True, headers={**entry.headers, **response.headers})
+        
+        with self._lock:
+            self.misses += 1
+        
+        if response.status_code != 200:
+            return response
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return response
+        
+        new_entry = CacheEntry(
+            data=response.json(),
+            etag=etag,
+            last_modified=last_modified,
+            headers=dict(response.headers),
+            links=response.links,
+            size=len(response.content or b'')
+        )
+        self._store(key, new_entry)
+        return CachedResponse(new_entry, from_cache=False)
+    
+    def _store(self, key: Tuple, entry: CacheEntry) -> None:
+        """Insert an entry and evict least recently used ones past the bounds."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            
+            if entry.size > self.max_bytes:
+                return
+            
+            self._entries[key] = entry
+            self._size += entry.size
+            
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entry count, size, hits (304 replies served
+            from the cache) and misses (replies fetched in full)
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,272 @@
+"""
+Run log archives on disk.
+
+Log archives can be hundreds of megabytes, so they are never held in
+memory: downloads are streamed to disk in chunks, and job logs are
+extracted from the zip archive one buffered line at a time. Archives of
+finished run attempts are kept in a size-bounded disk cache and reused;
+a re-run starts a new attempt, which is cached separately.
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.config import config
+from src.providers.base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the provider or disk at a time
+LOG_CHUNK_SIZE = 64 * 1024
+
+# Full job logs sit at the archive root as "<index>_<job name>.txt"
+_JOB_LOG = re.compile(r'^\d+_(?P<job>.+)\.txt$')
+
+
+class LogArchiveCache:
+    """
+    Size-bounded disk cache of run log archives.
+    
+    Archives are written to a temporary file and renamed into place once
+    complete, so concurrent readers never see a partial archive. The
+    least recently used archives are evicted when the cache grows past
+    ``max_bytes``.
+    """
+    
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1024 ** 3):
+        """
+        Initialize log archive cache.
+        
+        Args:
+            directory: Cache directory, defaults to ./flowforge_logs
+            max_bytes: Maximum total size of cached archives
+        """
+        self.directory = Path(directory) if directory else Path.cwd() / 'flowforge_logs'
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+    
+    def _run_directory(self, provider_name: str) -> Path:
+        """Directory of a provider's cached archives."""
+        return self.directory / re.sub(r'[^A-Za-z0-9_.-]', '_', provider_name)
+    
+    @staticmethod
+    def _run_name(run_id: str) -> str:
+        """File name stem of a run's archives."""
+        return re.sub(r'[^A-Za-z0-9_.-]', '_', str(run_id))
+    
+    def _path(self, provider_name: str, run_id: str, attempt: Optional[int] = None) -> Path:
+        """Location of a cached archive."""
+        suffix = f'-{attempt}' if attempt is not None else ''
+        return self._run_directory(provider_name) / f'{self._run_name(run_id)}{suffix}.zip'
+    
+    def get(self, provider_name: str, run_id: str, attempt: Optional[int] = None) -> Optional[Path]:
+        """
+        Get a cached archive.
+        
+        Args:
+            provider_name: Provider name
+            run_id: Run identifier
+            attempt: Run attempt, if the provider reports one
+        
+        Returns:
+            Path of the archive, or None if not cached
+        """
+        path = self._path(provider_name, run_id, attempt)
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        return path
+    
+    def invalidate(self, provider_name: str, run_id: str) -> None:
+        """
+        Remove the cached archives of every attempt of a run.
+        
+        Args:
+            provider_name: Provider name
+            run_id: Run identifier
+        """
+        directory = self._run_directory(provider_name)
+        name = self._run_name(run_id)
+        for path in [directory / f'{name}.zip', *directory.glob(f'{name}-*.zip')]:
+            path.unlink(missing_ok=True)
+    
+    def fetch(
+        self,
+        provider: BaseProvider,
+        run_id: str,
+        keep: bool,
+        attempt: Optional[int] = None
+    ) -> Tuple[Path, bool]:
+        """
+        Get the archive of a run attempt, downloading it if it isn't cached.
+        
+        Args:
+            provider: Provider owning the run
+            run_id: Run identifier
+            keep: Whether to keep the download in the cache (finished attempts only)
+            attempt: Run attempt, if the provider reports one
+        
+        Returns:
+            Tuple of archive path and whether it is a temporary file the
+            caller must delete
+        """
+        cached = self.get(provider.name, run_id, attempt)
+        if cached is not None:
+            return cached, False
+        
+        path = self._path(provider.name, run_id, attempt)
+        temporary = self._write(path.parent, provider.stream_run_logs(run_id))
+        
+        if not keep:
+            return temporary, True
+        
+        os.replace(temporary, path)
+        self._evict()
+        return path, False
+    
+    def _write(self, directory: Path, chunks: Iterable[bytes]) -> Path:
+        """Stream chunks into a new temporary file in the cache directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        handle, name = tempfile.mkstemp(dir=directory, suffix='.part')
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        except BaseException:
+            os.remove(name)
+            raise
+        return Path(name)
+    
+    def _evict(self) -> None:
+        """Remove least recently used archives until the cache fits."""
+        with self._lock:
+            archives: List[Tuple[float, int, Path]] = []
+            for path in self.directory.glob('*/*.zip'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                archives.append((stat.st_mtime, stat.st_size, path))
+            
+            total = sum(size for _, size, _ in archives)
+            for _, size, path in sorted(archives):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logger.debug(f"Evicted log archive {path}")
+
+
+def select_log_files(archive: zipfile.ZipFile, job: Optional[str] = None) -> List[zipfile.ZipInfo]:
+    """
+    Select the log files of an archive to extract.
+    
+    Args:
+        archive: Open log archive
+        job: Job name to extract, or None for every job
+    
+    Returns:
+        Full job logs from the archive root, or the step logs of the job
+        if the archive has no full log for it
+    """
+    entries = [info for info in archive.infolist() if not info.is_dir()]
+    root_logs = [info for info in entries if '/' not in info.filename]
+    
+    if job is None:
+        return root_logs or entries
+    
+    wanted = job.lower()
+    selected = []
+    for info in root_logs:
+        match = _JOB_LOG.match(info.filename)
+        if match and match.group('job').lower() == wanted:
+            selected.append(info)
+    if selected:
+        return selected
+    return [info for info in entries if info.filename.split('/')[0].lower() == wanted]
+
+
+def iter_logs(
+    archive_path: Path,
+    job: Optional[str] = None,
+    tail: Optional[int] = None,
+    remove: bool = False
+) -> Iterator[bytes]:
+    """
+    Stream log text out of an archive.
+    
+    Each file is preceded by a ``==> name <==`` header. With ``tail``,
+    only the last lines of each file are emitted; lines are streamed
+    through a bounded buffer, so memory use does not depend on log size.
+    
+    Args:
+        archive_path: Path of the log archive
+        job: Job name to extract, or None for every job
+        tail: Number of trailing lines per file, or None for everything
+        remove: Delete the archive once done (temporary downloads)
+    
+    Yields:
+        Chunks of log text
+    """
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in select_log_files(archive, job):
+                yield f'==> {info.filename} <==\n'.encode()
+                with archive.open(info) as log:
+                    if tail is None:
+                        while True:
+                            chunk = log.read(LOG_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            yield chunk
+                    else:
+                        yield from deque(log, maxlen=max(tail, 0))
+                yield b'\n'
+    finally:
+        if remove:
+            Path(archive_path).unlink(missing_ok=True)
+
+
+def iter_file(path: Path) -> Iterator[bytes]:
+    """
+    Stream a file from disk in chunks.
+    
+    Args:
+        path: File path
+    
+    Yields:
+        Chunks of the file
+    """
+    with open(path, 'rb') as stream:
+        while True:
+            chunk = stream.read(LOG_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+# Global log archive cache instance
+_log_cache: Optional[LogArchiveCache] = None
+
+
+def get_log_cache() -> LogArchiveCache:
+    """
+    Get global log archive cache instance.
+    
+    Returns:
+        LogArchiveCache instance configured from application settings
+    """
+    global _log_cache
+    
+    if _log_cache is None:
+        _log_cache = LogArchiveCache(config.LOG_CACHE_DIR, config.LOG_CACHE_MAX_BYTES)
+    
+    return _log_cache
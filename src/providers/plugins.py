@@ -0,0 +1,212 @@
+"""
+Provider type plugins.
+
+Provider types are discovered from the ``flowforge.providers`` entry
+point group; each entry point names a provider class or a factory that
+takes a ProviderConfig. Plugin modules are imported only when the first
+provider of their type is created, so unused providers (and their HTTP
+client dependencies) cost nothing at startup. Extra providers can be
+shipped as separate packages that declare the same entry point group.
+"""
+
+import logging
+import threading
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable, Dict, List, Optional
+
+from src.providers.base import BaseProvider, ProviderConfig
+from src.utils.errors import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Entry point group scanned for provider types
+ENTRY_POINT_GROUP = 'flowforge.providers'
+
+# Built-in provider types, available even when the package isn't installed
+BUILTIN_PROVIDERS = {
+    'github': 'src.providers.github:GitHubProvider',
+    'github_org': 'src.providers.github_org:GitHubOrgProvider',
+    'github_async': 'src.providers.github_async:create_provider',
+}
+
+# Optional provider settings copied from request data when present
+PROVIDER_SETTINGS = ('org', 'include', 'exclude', 'include_archived', 'max_concurrency')
+
+ProviderFactory = Callable[[ProviderConfig], BaseProvider]
+
+
+class ProviderTypeRegistry:
+    """
+    Registry of provider types with lazy plugin loading.
+    
+    Entry points are listed from package metadata without importing
+    anything; a plugin module is imported the first time its type is
+    instantiated and the loaded factory is reused afterwards.
+    """
+    
+    def __init__(self, group: str = ENTRY_POINT_GROUP, builtins: Optional[Dict[str, str]] = None):
+        """
+        Initialize provider type registry.
+        
+        Args:
+            group: Entry point group to discover
+            builtins: Provider type -> "module:attribute" fallbacks
+        """
+        self.group = group
+        self.builtins = BUILTIN_PROVIDERS if builtins is None else builtins
+        self._entry_points: Optional[Dict[str, EntryPoint]] = None
+        self._factories: Dict[str, ProviderFactory] = {}
+        self._lock = threading.Lock()
+    
+    def _discover(self) -> Dict[str, EntryPoint]:
+        """List provider entry points, without loading them."""
+        if self._entry_points is None:
+            discovered = {
+                name: EntryPoint(name=name, value=value, group=self.group)
+                for name, value in self.builtins.items()
+            }
+            for entry_point in entry_points(group=self.group):
+                discovered[entry_point.name] = entry_point
+            self._entry_points = discovered
+        return self._entry_points
+    
+    def types(self) -> List[str]:
+        """
+        Get the names of all available provider types.
+        
+        Returns:
+            Sorted list of provider type names
+        """
+        with self._lock:
+            return sorted(set(self._discover()) | set(self._factories))
+    
+    def register(self, provider_type: str, factory: ProviderFactory) -> None:
+        """
+        Register a provider type directly, e.g. from tests or embedding code.
+        
+        Args:
+            provider_type: Provider type name
+            factory: Provider class or factory taking a ProviderConfig
+        """
+        with self._lock:
+            self._factories[provider_type] = factory
+    
+    def load(self, provider_type: str) -> ProviderFactory:
+        """
+        Get the factory of a provider type, importing its plugin on first use.
+        
+        Args:
+            provider_type: Provider type name
+        
+        Returns:
+            Provider class or factory taking a ProviderConfig
+        
+        Raises:
+            ConfigurationError: If the type is unknown or its plugin fails to load
+        """
+        with self._lock:
+            factory = self._factories.get(provider_type)
+            if factory is not None:
+                return factory
+            
+            entry_point = self._discover().get(provider_type)
+            if entry_point is None:
+                raise ConfigurationError(f"Unsupported provider type: {provider_type}")
+            
+            try:
+                factory = entry_point.load()
+            except Exception as e:
+                raise ConfigurationError(f"Failed to load provider plugin '{provider_type}': {e}")
+            
+            logger.debug(f"Loaded provider plugin '{provider_type}' from {entry_point.value}")
+            self._factories[provider_type] = factory
+            return factory
+    
+    def create(self, config: ProviderConfig) -> BaseProvider:
+        """
+        Create a provider instance for a configuration.
+        
+        Args:
+            config: Provider configuration; ``provider_type`` selects the plugin
+        
+        Returns:
+            Provider instance
+        
+        Raises:
+            ConfigurationError: If the provider type is unknown
+        """
+        return self.load(config.provider_type)(config)
+
+
+# Global provider type registry instance
+_provider_types: Optional[ProviderTypeRegistry] = None
+
+
+def get_provider_types() -> ProviderTypeRegistry:
+    """
+    Get global provider type registry instance.
+    
+    Returns:
+        ProviderTypeRegistry instance
+    """
+    global _provider_types
+    
+    if _provider_types is None:
+        _provider_types = ProviderTypeRegistry()
+    
+    return _provider_types
+
+
+def create_provider(config: ProviderConfig) -> BaseProvider:
+    """
+    Create a provider instance using the global provider type registry.
+    
+    Args:
+        config: Provider configuration
+    
+    Returns:
+        Provider instance
+    
+    Raises:
+        ConfigurationError: If the provider type is unknown
+    """
+    return get_provider_types().create(config)
+
+
+def build_provider(name: str, provider_type: str, data: Dict[str, Any],
+                   token: Optional[str] = None) -> BaseProvider:
+    """
+    Create a provider from API or CLI settings.
+    
+    Args:
+        name: Unique provider name
+        provider_type: Provider type name
+        data: Provider settings (owner, repo, base_url, enabled,
+            refresh_interval and the optional PROVIDER_SETTINGS)
+        token: API token to configure, if any
+    
+    Returns:
+        Provider instance
+    
+    Raises:
+        ConfigurationError: If the provider type is unknown
+    """
+    config_dict = {
+        'owner': data.get('owner'),
+        'repo': data.get('repo'),
+        'base_url': data.get('base_url', 'https://api.github.com')
+    }
+    for key in PROVIDER_SETTINGS:
+        if key in data:
+            config_dict[key] = data[key]
+    if token:
+        config_dict['token'] = token
+    
+    config = ProviderConfig(
+        name=name,
+        provider_type=provider_type,
+        enabled=data.get('enabled', True),
+        refresh_interval=data.get('refresh_interval', 30),
+        config=config_dict
+    )
+    return create_provider(config)
@@ -0,0 +1,326 @@
+"""
+Rate-limit-aware request governor shared across providers.
+
+Tracks the remaining request quota per host/token from the
+X-RateLimit-* and Retry-After response headers, paces background
+traffic so the budget lasts until the reset time, and lets interactive
+API calls skip ahead of poller traffic.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from src.utils.errors import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(Enum):
+    """Priority class of an outgoing provider request."""
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    'flowforge_request_priority', default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Run the enclosed provider calls with the given priority.
+    
+    Usage:
+        with request_priority(RequestPriority.BACKGROUND):
+            provider.fetch_pipelines()
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> RequestPriority:
+    """Get the priority of requests issued from the current context."""
+    return _current_priority.get()
+
+
+@dataclass
+class RateLimitBucket:
+    """
+    Quota state of a single host/token pair.
+    
+    Attributes:
+        limit: Requests allowed per window, as last reported
+        remaining: Requests left in the current window
+        reset_at: Epoch time at which the window resets
+        blocked_until: Epoch time before which no request may be sent
+        next_background_at: Earliest epoch time for the next paced background request
+    """
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: Optional[float] = None
+    blocked_until: float = 0.0
+    next_background_at: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert bucket state to a dictionary."""
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset_at': self.reset_at,
+            'blocked_until': self.blocked_until or None
+        }
+
+
+class RateLimitGovernor:
+    """
+    Request governor that every provider call passes through.
+    
+    Interactive requests are only held back by hard limits (exhausted
+    quota or Retry-After). Background requests additionally stop at a
+    reserve kept for interactive traffic and, once quota runs low, are
+    spaced out evenly until the reset time. Background work that would
+    have to wait longer than ``max_wait`` is deferred with RateLimitError.
+    """
+    
+    def __init__(
+        self,
+        reserve_fraction: float = 0.1,
+        pace_threshold: float = 0.5,
+        max_wait: float = 30.0,
+        max_stretch: float = 8.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize rate-limit governor.
+        
+        Args:
+            reserve_fraction: Share of the quota reserved for interactive calls
+            pace_threshold: Remaining share below which background calls are paced
+            max_wait: Longest a request may sleep before it is deferred
+            max_stretch: Largest poll interval multiplier reported to the poller
+            clock: Time source (epoch seconds)
+            sleep: Sleep function
+        """
+        self.reserve_fraction = reserve_fraction
+        self.pace_threshold = pace_threshold
+        self.max_wait = max_wait
+        self.max_stretch = max_stretch
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def bucket_key(base_url: str, token: Optional[str], resource: str = 'core') -> str:
+        """
+        Build the bucket key for a host/token pair.
+        
+        Args:
+            base_url: Provider API base URL
+            token: API token (only a digest is kept)
+            resource: Rate-limit resource (core, graphql, search, ...)
+        
+        Returns:
+            Bucket key string
+        """
+        host = urlparse(base_url).netloc or base_url
+        digest = hashlib.sha256((token or '').encode()).hexdigest()[:12]
+        return f"{host}:{digest}:{resource}"
+    
+    def acquire(self, key: str, priority: Optional[RequestPriority] = None) -> None:
+        """
+        Wait until a request may be sent on the given bucket.
+        
+        Args:
+            key: Bucket key
+            priority: Request priority, defaults to the current context
+        
+        Raises:
+            RateLimitError: If the request would have to wait longer than max_wait
+        """
+        delay = self._reserve_slot(key, priority or current_priority())
+        if delay > 0:
+            self._sleep(delay)
+    
+    async def acquire_async(self, key: str, priority: Optional[RequestPriority] = None) -> None:
+        """
+        Wait until a request may be sent, without blocking the event loop.
+        
+        Args:
+            key: Bucket key
+            priority: Request priority, defaults to the current context
+        
+        Raises:
+            RateLimitError: If the request would have to wait longer than max_wait
+        """
+        delay = self._reserve_slot(key, priority or current_priority())
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _reserve_slot(self, key: str, priority: RequestPriority) -> float:
+        """Reserve the next send slot on a bucket and return how long to wait for it."""
+        with self._lock:
+            bucket = self._buckets.setdefault(key, RateLimitBucket())
+            now = self._clock()
+            send_at = self._earliest_send_time(bucket, priority, now)
+            delay = send_at - now
+            
+            if delay > self.max_wait:
+                raise RateLimitError(
+                    f"Rate limit for {key.split(':')[0]} exhausted, retry in {delay:.0f}s",
+                    retry_after=delay
+                )
+            
+            if priority == RequestPriority.BACKGROUND:
+                bucket.next_background_at = max(send_at, now) + self._pace_interval(bucket, now)
+            if bucket.remaining is not None and bucket.remaining > 0:
+                bucket.remaining -= 1
+        
+        if delay > 0:
+            logger.debug(f"Rate limit governor delaying {priority.value} request on {key} by {delay:.2f}s")
+        return delay
+    
+    def _earliest_send_time(self, bucket: RateLimitBucket, priority: RequestPriority, now: float) -> float:
+        """Compute when a request of the given priority may be sent."""
+        send_at = max(now, bucket.blocked_until)
+        reset_at = bucket.reset_at if bucket.reset_at and bucket.reset_at > now else None
+        
+        if bucket.remaining is None or reset_at is None:
+            return send_at
+        
+        if bucket.remaining <= 0:
+            return max(send_at, reset_at)
+        
+        if priority == RequestPriority.BACKGROUND:
+            if bucket.remaining <= self._reserve(bucket):
+                return max(send_at, reset_at)
+            return max(send_at, bucket.next_background_at)
+        
+        return send_at
+    
+    def _reserve(self, bucket: RateLimitBucket) -> int:
+        """Number of requests held back for interactive traffic."""
+        return int((bucket.limit or 0) * self.reserve_fraction)
+    
+    def _pace_interval(self, bucket: RateLimitBucket, now: float) -> float:
+        """Spacing between background requests so the budget lasts until reset."""
+        if not bucket.limit or bucket.remaining is None or not bucket.reset_at:
+            return 0.0
+        if bucket.remaining / bucket.limit >= self.pace_threshold:
+            return 0.0
+        
+        budget = bucket.remaining - self._reserve(bucket)
+        window = bucket.reset_at - now
+        if budget <= 0 or window <= 0:
+            return 0.0
+        return window / budget
+    
+    def update(self, key: str, headers: Mapping[str, str], status_code: int) -> None:
+        """
+        Update bucket state from response headers.
+        
+        Args:
+            key: Bucket key
+            headers: Response headers
+            status_code: Response status code
+        """
+        now = self._clock()
+        
+        with self._lock:
+            bucket = self._buckets.setdefault(key, RateLimitBucket())
+            
+            limit = headers.get('X-RateLimit-Limit')
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset = headers.get('X-RateLimit-Reset')
+            retry_after = headers.get('Retry-After')
+            
+            try:
+                if limit is not None:
+                    bucket.limit = int(limit)
+                if remaining is not None:
+                    bucket.remaining = int(remaining)
+                if reset is not None:
+                    bucket.reset_at = float(reset)
+                if retry_after is not None:
+                    bucket.blocked_until = max(bucket.blocked_until, now + float(retry_after))
+            except ValueError:
+                logger.warning(f"Ignoring malformed rate-limit headers for {key}")
+            
+            if status_code in (403, 429) and bucket.remaining == 0 and bucket.reset_at:
+                bucket.blocked_until = max(bucket.blocked_until, bucket.reset_at)
+    
+    def state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of all tracked buckets.
+        
+        Returns:
+            Dictionary mapping bucket keys to their state
+        """
+        with self._lock:
+            return {key: bucket.to_dict() for key, bucket in self._buckets.items()}
+    
+    def remaining_fraction(self) -> float:
+        """
+        Get the lowest remaining quota share across all active buckets.
+        
+        Returns:
+            Value between 0.0 (exhausted) and 1.0 (untouched)
+        """
+        now = self._clock()
+        fraction = 1.0
+        
+        with self._lock:
+            for bucket in self._buckets.values():
+                if bucket.blocked_until > now:
+                    return 0.0
+                if bucket.limit and bucket.remaining is not None and (bucket.reset_at or 0) > now:
+                    fraction = min(fraction, bucket.remaining / bucket.limit)
+        
+        return fraction
+    
+    def interval_multiplier(self) -> float:
+        """
+        Get the factor by which background poll intervals should be stretched.
+        
+        Returns:
+            1.0 while quota is plentiful, up to max_stretch as it runs out
+        """
+        fraction = self.remaining_fraction()
+        if fraction >= self.pace_threshold:
+            return 1.0
+        
+        shortage = (self.pace_threshold - fraction) / self.pace_threshold
+        return 1.0 + shortage * (self.max_stretch - 1.0)
+
+
+# Global governor instance
+_governor: Optional[RateLimitGovernor] = None
+
+
+def get_governor() -> RateLimitGovernor:
+    """
+    Get global rate-limit governor instance.
+    
+    Returns:
+        RateLimitGovernor instance
+    """
+    global _governor
+    
+    if _governor is None:
+        _governor = RateLimitGovernor()
+    
+    return _governor
@@ -5,8 +5,50 @@ The registry maintains a list of configured providers and provides
 methods to interact with them collectively.
 """
 
-from typing import List, Dict, Optional
-from src.providers.base import BaseProvider, ProviderConfig, Pipeline
+import asyncio
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Dict, Optional, Tuple, TypeVar, Union
+from src.config import config as app_config
+from src.providers.async_base import AsyncProviderAdapter, run_sync
+from src.providers.base import BaseProvider, ProviderConfig, Pipeline, PipelineRun
+from src.providers.circuit_breaker import CircuitBreaker, make_breaker
+from src.providers.github_graphql import GraphQLBatchFetcher
+from src.providers.single_flight import SingleFlight
+from src.providers.swr_cache import StaleWhileRevalidateCache
+from src.utils.errors import CircuitOpenError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of fetching pipelines from every enabled provider.
+    
+    Attributes:
+        pipelines: Pipelines of the providers that answered in time
+        errors: Provider name -> error message for providers that failed
+        timed_out: Names of providers that missed the deadline
+        ages: Provider name -> age in seconds of its pipelines
+        circuit_open: Providers skipped by their circuit breaker; their
+                      last cached pipelines are returned, if any
+    """
+    pipelines: List[Pipeline] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    ages: Dict[str, float] = field(default_factory=dict)
+    circuit_open: List[str] = field(default_factory=list)
+    
+    @property
+    def partial(self) -> bool:
+        """Whether some providers are missing or served from stale data."""
+        return bool(self.errors or self.timed_out or self.circuit_open)
 
 
 class ProviderRegistry:
@@ -17,9 +59,50 @@ class ProviderRegistry:
     a collection of provider instances and provides unified access.
     """
     
-    def __init__(self):
-        """Initialize empty registry."""
+    def __init__(self, max_concurrency: Optional[int] = None, deadline: Optional[float] = None):
+        """
+        Initialize empty registry.
+        
+        Args:
+            max_concurrency: Maximum number of providers fetched at once
+            deadline: Seconds to wait for all providers when fetching pipelines
+        """
         self._providers: Dict[str, BaseProvider] = {}
+        self._graphql = GraphQLBatchFetcher(reseed_interval=app_config.GRAPHQL_RESEED_INTERVAL)
+        self.max_concurrency = max_concurrency or app_config.FETCH_MAX_CONCURRENCY
+        self.deadline = deadline or app_config.FETCH_DEADLINE
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.single_flight = SingleFlight()
+        self.read_cache = StaleWhileRevalidateCache(max_entries=app_config.READ_CACHE_MAX_ENTRIES)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listeners: List[Callable[[str, str], None]] = []
+    
+    def add_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Subscribe to provider registration changes.
+        
+        Args:
+            listener: Called with ('registered' or 'unregistered', provider name)
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Unsubscribe from provider registration changes.
+        
+        Args:
+            listener: Previously added listener
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, event: str, name: str) -> None:
+        """Tell listeners about a registration change."""
+        for listener in list(self._listeners):
+            try:
+                listener(event, name)
+            except Exception as e:
+                logger.error(f"Registry listener failed on {event} '{name}': {e}")
     
     def register(self, provider: BaseProvider) -> None:
         """
@@ -35,6 +118,8 @@ class ProviderRegistry:
             raise ValueError(f"Provider '{provider.name}' already registered")
         
         self._providers[provider.name] = provider
+        self._breakers[provider.name] = make_breaker()
+        self._notify('registered', provider.name)
     
     def unregister(self, name: str) -> None:
         """
@@ -45,6 +130,10 @@ class ProviderRegistry:
         """
         if name in self._providers:
             del self._providers[name]
+            self._graphql.forget(name)
+            self._breakers.pop(name, None)
+            self.read_cache.invalidate(lambda key: key[0] == name)
+            self._notify('unregistered', name)
     
     def get(self, name: str) -> Optional[BaseProvider]:
         """
@@ -94,25 +183,435 @@ class ProviderRegistry:
             if provider.provider_type == provider_type
         ]
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded executor used for concurrent provider fetches."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix='flowforge-registry'
+            )
+        return self._executor
+    
+    def _submit(self, fn: Callable[..., T], *args: Any) -> Future:
+        """Run a call on the executor in a copy of the caller's context, keeping its request priority."""
+        return self._get_executor().submit(copy_context().run, fn, *args)
+    
     def fetch_all_pipelines(self) -> List[Pipeline]:
         """
         Fetch pipelines from all enabled providers.
         
         Returns:
-            List of all pipelines from all providers
+            List of all pipelines from the providers that answered in time
+        """
+        return self.fetch_all_pipelines_detailed().pipelines
+    
+    def fetch_all_pipelines_detailed(
+        self,
+        deadline: Optional[float] = None,
+        cached: bool = False
+    ) -> FetchResult:
+        """
+        Fetch pipelines from all enabled providers concurrently.
+        
+        Providers are fetched on a bounded executor, so total latency is
+        close to that of the slowest provider. Providers that fail or miss
+        the deadline are reported instead of delaying the others.
+        
+        With ``cached``, providers with a cached listing within their
+        max-staleness are answered from the read cache; listings older
+        than the refresh interval are revalidated in the background.
+        
+        Args:
+            deadline: Seconds to wait for all providers, defaults to the
+                      registry deadline
+            cached: Serve listings from the read cache when possible
+        
+        Returns:
+            FetchResult with partial results and per-provider failures
+        """
+        expires = time.monotonic() + (self.deadline if deadline is None else deadline)
+        providers = self.get_enabled()
+        by_name = {provider.name: provider for provider in providers}
+        result = FetchResult()
+        
+        # Providers behind an open circuit are skipped instantly
+        for provider in [p for p in providers if not self.breaker(p.name).available()]:
+            self._serve_open(provider, result)
+        providers = [p for p in providers if p.name not in result.circuit_open]
+        
+        if cached:
+            providers = [p for p in providers if not self._serve_cached(p, result)]
+        
+        pending = self._submit_fetches(providers)
+        self._gather(pending, expires, by_name, result)
+        
+        for future, (_, group) in pending.items():
+            future.cancel()
+            for provider in group:
+                logger.warning(f"Fetching pipelines from {provider.name} missed the deadline")
+                result.timed_out.append(provider.name)
+        
+        return result
+    
+    def _submit_fetches(self, providers: List[BaseProvider]) -> Dict[Future, Tuple[str, List[BaseProvider]]]:
+        """
+        Start fetching providers, batching those that can share requests.
+        
+        Repositories sharing a GitHub host and token are loaded in GraphQL
+        batches and async providers are gathered on the shared event loop
+        in one go; every other provider gets a task of its own.
+        
+        Args:
+            providers: Providers to fetch
+        
+        Returns:
+            Dictionary mapping each task to its kind and providers; each
+            task returns provider name -> pipelines or the raised error
+        """
+        pending: Dict[Future, Tuple[str, List[BaseProvider]]] = {}
+        scheduled = set()
+        
+        compatible = [p for p in providers if self._graphql.supports(p)]
+        for group in self._graphql.group(compatible).values():
+            if len(group) < 2:
+                continue
+            pending[self._submit(self._fetch_batch, group)] = ('graphql', group)
+            scheduled.update(provider.name for provider in group)
+        
+        adapters = [p for p in providers if isinstance(p, AsyncProviderAdapter)]
+        if adapters:
+            pending[self._submit(self.fetch_async_pipelines, adapters)] = ('async', adapters)
+            scheduled.update(adapter.name for adapter in adapters)
+        
+        for provider in providers:
+            if provider.name not in scheduled:
+                pending[self._submit(self._fetch_one, provider)] = ('rest', [provider])
+        return pending
+    
+    def _gather(
+        self,
+        pending: Dict[Future, Tuple[str, List[BaseProvider]]],
+        expires: float,
+        by_name: Dict[str, BaseProvider],
+        result: FetchResult
+    ) -> None:
+        """Add finished fetch tasks to a result until all are done or the deadline passes."""
+        while pending:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                return
+            
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, group = pending.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    if kind == 'graphql':
+                        logger.warning(f"GraphQL batch fetch failed, falling back to REST: {e}")
+                        for provider in group:
+                            pending[self._submit(self._fetch_one, provider)] = ('rest', [provider])
+                        continue
+                    outcome = {provider.name: e for provider in group}
+                self._record_outcome(outcome, by_name, result)
+    
+    def _record_outcome(
+        self,
+        outcome: Dict[str, Union[List[Pipeline], BaseException]],
+        by_name: Dict[str, BaseProvider],
+        result: FetchResult
+    ) -> None:
+        """Add the pipelines or errors of finished providers to a result."""
+        for name, pipelines in outcome.items():
+            if isinstance(pipelines, CircuitOpenError):
+                self._serve_open(by_name[name], result)
+            elif isinstance(pipelines, BaseException):
+                logger.error(f"Error fetching pipelines from {name}: {pipelines}")
+                result.errors[name] = str(pipelines)
+            else:
+                by_name[name].record_pipelines(pipelines)
+                self.read_cache.put(self._pipelines_key(by_name[name]), pipelines)
+                result.pipelines.extend(pipelines)
+                result.ages[name] = 0.0
+    
+    def _serve_open(self, provider: BaseProvider, result: FetchResult) -> None:
+        """Add the last cached listing of a provider with an open circuit to a result."""
+        result.circuit_open.append(provider.name)
+        hit = self.read_cache.peek(self._pipelines_key(provider), float('inf'))
+        if hit is None:
+            result.errors[provider.name] = f"Circuit open for provider {provider.name}"
+            return
+        
+        pipelines, age = hit
+        result.pipelines.extend(pipelines)
+        result.ages[provider.name] = age
+    
+    def _serve_cached(self, provider: BaseProvider, result: FetchResult) -> bool:
+        """Add a provider's cached listing to a result, revalidating it if stale."""
+        hit = self.read_cache.peek(self._pipelines_key(provider), provider.max_staleness)
+        if hit is None:
+            return False
+        
+        pipelines, age = hit
+        if age > provider.config.refresh_interval:
+            self.read_cache.revalidate(self._pipelines_key(provider), lambda: self.fetch_pipelines(provider))
+        result.pipelines.extend(pipelines)
+        result.ages[provider.name] = age
+        return True
+    
+    @staticmethod
+    def _pipelines_key(provider: BaseProvider) -> Tuple[str, str, tuple]:
+        """Read cache key of a provider's pipeline listing."""
+        return (provider.name, 'fetch_pipelines', ())
+    
+    def fetch_pipelines(self, provider: BaseProvider) -> List[Pipeline]:
         """
-        all_pipelines = []
+        Fetch the pipelines of one provider, sharing any identical fetch in flight.
+        
+        The fresh listing is stored in the read cache.
         
-        for provider in self.get_enabled():
+        Args:
+            provider: Provider instance
+        
+        Returns:
+            List of the provider's pipelines
+        """
+        pipelines = self._call(provider, self._pipelines_key(provider), provider.fetch_pipelines)
+        self.read_cache.put(self._pipelines_key(provider), pipelines)
+        return pipelines
+    
+    def breaker(self, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of a provider.
+        
+        Args:
+            name: Provider name
+        
+        Returns:
+            CircuitBreaker instance
+        """
+        return self._breakers.setdefault(name, make_breaker())
+    
+    def _call(self, provider: BaseProvider, key: Tuple, fn: Callable[..., T], *args: Any) -> T:
+        """Call a provider through its circuit breaker, sharing identical calls in flight."""
+        return self.single_flight.do(key, self._guarded, provider, fn, *args)
+    
+    def _guarded(self, provider: BaseProvider, fn: Callable[..., T], *args: Any) -> T:
+        """Call a provider if its circuit allows it and record the outcome."""
+        breaker = self.breaker(provider.name)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for provider {provider.name}", provider.name)
+        
+        started = time.monotonic()
+        try:
+            result = fn(*args)
+        except RateLimitError:
+            # Deferred by our own governor; says nothing about provider health
+            breaker.release()
+            raise
+        except Exception as e:
+            breaker.record_failure(str(e), time.monotonic() - started)
+            raise
+        breaker.record_success(time.monotonic() - started)
+        return result
+    
+    def _read(self, provider: BaseProvider, key: Tuple, fn: Callable[..., T], *args: Any) -> Tuple[T, float]:
+        """Read through the cache, falling back to any cached value while the circuit is open."""
+        if not self.breaker(provider.name).available():
+            hit = self.read_cache.peek(key, float('inf'))
+            if hit is None:
+                raise CircuitOpenError(f"Circuit open for provider {provider.name}", provider.name)
+            return hit
+        
+        return self.read_cache.get(
+            key,
+            lambda: self._call(provider, key, fn, *args),
+            provider.config.refresh_interval,
+            provider.max_staleness
+        )
+    
+    def read_pipelines(self, provider: BaseProvider) -> Tuple[List[Pipeline], float]:
+        """
+        Read the pipelines of one provider through the read cache.
+        
+        The provider's refresh interval is the TTL; after it the cached
+        listing is served while a background refresh runs.
+        
+        Args:
+            provider: Provider instance
+        
+        Returns:
+            Tuple of pipelines and their age in seconds
+        """
+        return self._read(provider, self._pipelines_key(provider), provider.fetch_pipelines)
+    
+    def read_pipeline_runs(
+        self,
+        provider: BaseProvider,
+        pipeline_id: str,
+        limit: int = 10
+    ) -> Tuple[List[PipelineRun], float]:
+        """
+        Read recent runs of a pipeline through the read cache.
+        
+        Args:
+            provider: Provider instance
+            pipeline_id: Pipeline identifier
+            limit: Maximum number of runs
+        
+        Returns:
+            Tuple of runs and their age in seconds
+        """
+        key = (provider.name, 'fetch_pipeline_runs', (str(pipeline_id), limit))
+        return self._read(provider, key, provider.fetch_pipeline_runs, pipeline_id, limit)
+    
+    def _fetch_one(self, provider: BaseProvider) -> Dict[str, Union[List[Pipeline], BaseException]]:
+        """Fetch the pipelines of a single provider."""
+        return {provider.name: self.fetch_pipelines(provider)}
+    
+    def _fetch_batch(self, group: List[BaseProvider]) -> Dict[str, Union[List[Pipeline], BaseException]]:
+        """
+        Fetch a GraphQL batch, sharing an identical batch in flight.
+        
+        Members due for a REST seed load through fetch_pipelines, so they
+        pass their circuit breaker on their own. The others join the query
+        only if their circuit allows a call, and each gets its outcome
+        recorded; members behind an open circuit get a CircuitOpenError.
+        """
+        def fetch():
+            batch, guarded, outcome = self._admit_batch(group)
+            started = time.monotonic()
             try:
-                pipelines = provider.fetch_pipelines()
-                all_pipelines.extend(pipelines)
+                results = self._graphql.fetch(batch, load=self.fetch_pipelines)
             except Exception as e:
-                # Log error but continue with other providers
-                print(f"Error fetching pipelines from {provider.name}: {e}")
+                self._record_batch(guarded, e, time.monotonic() - started)
+                raise
+            
+            duration = time.monotonic() - started
+            for name in guarded:
+                self._record_batch([name], results[name], duration)
+            outcome.update(results)
+            return outcome
+        
+        names = tuple(provider.name for provider in group)
+        return self.single_flight.do((names, 'fetch_pipelines_batch', ()), fetch)
+    
+    def _admit_batch(
+        self,
+        group: List[BaseProvider]
+    ) -> Tuple[List[BaseProvider], List[str], Dict[str, Union[List[Pipeline], BaseException]]]:
+        """Split a batch into members to fetch, those admitted by their circuit, and those refused."""
+        batch, guarded, refused = [], [], {}
+        for provider in group:
+            if self._graphql.needs_seed(provider.name):
+                batch.append(provider)
+            elif self.breaker(provider.name).allow():
+                batch.append(provider)
+                guarded.append(provider.name)
+            else:
+                refused[provider.name] = CircuitOpenError(f"Circuit open for provider {provider.name}", provider.name)
+        return batch, guarded, refused
+    
+    def _record_batch(self, names: Iterable[str], result: Any, duration: float) -> None:
+        """Record a batch outcome on the circuits of the named providers."""
+        for name in names:
+            if isinstance(result, RateLimitError):
+                self.breaker(name).release()
+            elif isinstance(result, BaseException):
+                self.breaker(name).record_failure(str(result), duration)
+            else:
+                self.breaker(name).record_success(duration)
+    
+    def fetch_graphql_pipelines(
+        self,
+        providers: List[BaseProvider]
+    ) -> Dict[str, List[Pipeline]]:
+        """
+        Fetch pipelines of GraphQL-capable GitHub providers in batches.
+        
+        Compatible providers among ``providers`` sharing a host and token
+        are loaded with batched GraphQL queries and their listings are
+        stored in the read cache. Providers without a batch partner,
+        behind an open circuit, failing their REST seed or in a failed
+        batch are left out, so the caller fetches them one by one.
+        
+        Args:
+            providers: Provider instances
+        
+        Returns:
+            Dictionary mapping provider name to its pipelines
+        """
+        compatible = [p for p in providers if self._graphql.supports(p) and self.breaker(p.name).available()]
+        by_name = {provider.name: provider for provider in compatible}
+        results: Dict[str, List[Pipeline]] = {}
+        for group in self._graphql.group(compatible).values():
+            if len(group) < 2:
+                continue
+            try:
+                outcome = self._fetch_batch(group)
+            except Exception as e:
+                logger.warning(f"GraphQL batch fetch failed, falling back to REST: {e}")
                 continue
+            for name, pipelines in outcome.items():
+                if not isinstance(pipelines, BaseException):
+                    self.read_cache.put(self._pipelines_key(by_name[name]), pipelines)
+                    results[name] = pipelines
+        return results
+    
+    def fetch_async_pipelines(
+        self,
+        providers: List[BaseProvider]
+    ) -> Dict[str, Union[List[Pipeline], BaseException]]:
+        """
+        Fetch pipelines of async-backed providers concurrently.
+        
+        All async providers among ``providers`` are gathered on the shared
+        event loop, so their requests are in flight at the same time
+        without a thread per request. Other providers are ignored, and
+        callers gathering the same providers at once share one gather.
+        Providers behind an open circuit get a CircuitOpenError.
+        
+        Args:
+            providers: Provider instances
+            
+        Returns:
+            Dictionary mapping provider name to its pipelines or the raised error
+        """
+        adapters = [p for p in providers if isinstance(p, AsyncProviderAdapter)]
+        refused: Dict[str, Union[List[Pipeline], BaseException]] = {
+            adapter.name: CircuitOpenError(f"Circuit open for provider {adapter.name}", adapter.name)
+            for adapter in adapters
+            if not self.breaker(adapter.name).available()
+        }
+        adapters = [adapter for adapter in adapters if adapter.name not in refused]
+        if not adapters:
+            return refused
+        
+        async def gather():
+            return await asyncio.gather(
+                *(adapter.async_provider.fetch_pipelines() for adapter in adapters),
+                return_exceptions=True
+            )
+        
+        def fetch():
+            started = time.monotonic()
+            results = run_sync(gather())
+            duration = time.monotonic() - started
+            
+            outcome = {}
+            for adapter, result in zip(adapters, results):
+                breaker = self.breaker(adapter.name)
+                if isinstance(result, RateLimitError):
+                    breaker.release()
+                elif isinstance(result, BaseException):
+                    breaker.record_failure(str(result), duration)
+                else:
+                    breaker.record_success(duration)
+                outcome[adapter.name] = result
+            return outcome
         
-        return all_pipelines
+        names = tuple(adapter.name for adapter in adapters)
+        return {**refused, **self.single_flight.do((names, 'fetch_pipelines_async', ()), fetch)}
     
     def count(self) -> int:
         """
@@ -125,7 +624,14 @@ class ProviderRegistry:
     
     def clear(self) -> None:
         """Clear all registered providers."""
+        names = list(self._providers)
+        for name in names:
+            self._graphql.forget(name)
         self._providers.clear()
+        self._breakers.clear()
+        self.read_cache.invalidate()
+        for name in names:
+            self._notify('unregistered', name)
     
     def __repr__(self) -> str:
         return f"ProviderRegistry(count={self.count()})"
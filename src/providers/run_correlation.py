@@ -0,0 +1,354 @@
+"""
+Correlation of triggered pipeline runs.
+
+Dispatch APIs such as GitHub's workflow_dispatch don't return the run
+they create. Triggering therefore returns a TriggerHandle immediately,
+and a background RunCorrelator polls the provider with backoff until the
+dispatched run can be identified, without blocking the caller.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.providers.base import PipelineRun
+from src.utils.errors import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Resolver returning candidate runs for a handle, oldest first
+Resolver = Callable[['TriggerHandle'], Iterable[PipelineRun]]
+
+
+@dataclass
+class TriggerHandle:
+    """
+    Tracking handle for a triggered or re-run pipeline.
+    
+    Attributes:
+        id: Unique handle identifier, also used as correlation marker
+        provider: Provider name
+        pipeline_id: Pipeline the run belongs to (may be unknown for re-runs)
+        kind: 'dispatch' for new runs, 'rerun' for re-runs
+        dispatched_at: When the trigger request was accepted
+        ref: Git ref the run was dispatched on
+        actor: Login of the user that dispatched the run
+        marker: Unique value passed to the run for exact matching
+        source_run_id: Run being re-run
+        source_attempt: Attempt number of the re-run run before the request
+        state: 'pending', 'resolved' or 'timeout'
+        run: Resolved run, once known
+        attempts: Number of correlation polls made
+    """
+    id: str
+    provider: str
+    pipeline_id: str
+    kind: str
+    dispatched_at: datetime
+    ref: Optional[str] = None
+    actor: Optional[str] = None
+    marker: Optional[str] = None
+    source_run_id: Optional[str] = None
+    source_attempt: Optional[int] = None
+    state: str = 'pending'
+    run: Optional[PipelineRun] = None
+    attempts: int = 0
+    finished_at: Optional[float] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+    
+    @staticmethod
+    def new_id() -> str:
+        """Generate a unique handle identifier."""
+        return uuid.uuid4().hex
+    
+    def done(self) -> bool:
+        """Check whether correlation has finished, successfully or not."""
+        return self._done.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[PipelineRun]:
+        """
+        Wait for the run to be resolved.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            Resolved PipelineRun, or None if not resolved (yet)
+        """
+        self._done.wait(timeout)
+        return self.run
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert handle to dictionary.
+        
+        Returns:
+            Dictionary representation of the handle and its resolved run
+        """
+        run = None
+        if self.run:
+            run = {
+                'id': self.run.id,
+                'pipeline_id': self.run.pipeline_id,
+                'status': self.run.status.value,
+                'started_at': self.run.started_at,
+                'finished_at': self.run.finished_at
+            }
+        
+        return {
+            'id': self.id,
+            'provider': self.provider,
+            'pipeline_id': self.pipeline_id,
+            'kind': self.kind,
+            'state': self.state,
+            'dispatched_at': self.dispatched_at.isoformat(),
+            'attempts': self.attempts,
+            'run': run
+        }
+
+
+class RunCorrelator:
+    """
+    Background worker resolving trigger handles to pipeline runs.
+    
+    Every tracked handle is polled through its resolver with exponential
+    backoff, from ``initial_delay`` up to ``max_delay`` seconds, until a
+    run is found or ``timeout`` seconds have passed. A dispatched run is
+    claimed by at most one handle, so concurrent triggers of the same
+    pipeline resolve to distinct runs. Only a correlation marker makes the
+    match exact; without one, runs are claimed oldest first and two
+    dispatches of the same pipeline and ref racing each other may swap runs.
+    """
+    
+    def __init__(
+        self,
+        initial_delay: float = 1.0,
+        max_delay: float = 15.0,
+        timeout: float = 300.0,
+        retention: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize run correlator.
+        
+        Args:
+            initial_delay: Seconds before the first poll
+            max_delay: Maximum seconds between polls
+            timeout: Seconds after which an unresolved handle gives up
+            retention: Seconds finished handles stay retrievable
+            clock: Monotonic time source
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.retention = retention
+        self._clock = clock
+        
+        self._handles: Dict[str, TriggerHandle] = {}
+        self._resolvers: Dict[str, Resolver] = {}
+        self._started: Dict[str, float] = {}
+        self._claimed: Set[Tuple[str, str]] = set()
+        self._queue: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+    
+    def track(self, handle: TriggerHandle, resolver: Resolver) -> TriggerHandle:
+        """
+        Start correlating a handle in the background.
+        
+        Args:
+            handle: Handle of the triggered run
+            resolver: Callable returning candidate runs for the handle
+        
+        Returns:
+            The tracked handle
+        """
+        with self._condition:
+            self._handles[handle.id] = handle
+            self._resolvers[handle.id] = resolver
+            self._started[handle.id] = self._clock()
+            self._schedule(handle.id, self.initial_delay)
+            self._ensure_thread()
+            self._condition.notify()
+        return handle
+    
+    def get(self, handle_id: str) -> Optional[TriggerHandle]:
+        """
+        Get a tracked handle.
+        
+        Args:
+            handle_id: Handle identifier
+        
+        Returns:
+            TriggerHandle, or None if unknown or expired
+        """
+        with self._condition:
+            return self._handles.get(handle_id)
+    
+    def poll(self, handle_id: str) -> Optional[PipelineRun]:
+        """
+        Run one correlation attempt for a handle immediately.
+        
+        Args:
+            handle_id: Handle identifier
+        
+        Returns:
+            Resolved PipelineRun, or None
+        """
+        with self._condition:
+            handle = self._handles.get(handle_id)
+            resolver = self._resolvers.get(handle_id)
+        if handle is None or resolver is None:
+            return handle.run if handle else None
+        
+        self._attempt(handle, resolver)
+        return handle.run
+    
+    def stop(self) -> None:
+        """Stop the background thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+    
+    def _ensure_thread(self) -> None:
+        """Start the background thread if needed; caller holds the lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='flowforge-correlator', daemon=True)
+            self._thread.start()
+    
+    def _schedule(self, handle_id: str, delay: float) -> None:
+        """Queue the next poll of a handle; caller holds the lock."""
+        heapq.heappush(self._queue, (self._clock() + delay, next(self._sequence), handle_id))
+    
+    def _run(self) -> None:
+        """Thread target polling due handles."""
+        while True:
+            with self._condition:
+                while self._running and (not self._queue or self._queue[0][0] > self._clock()):
+                    wait = self._queue[0][0] - self._clock() if self._queue else None
+                    self._condition.wait(wait)
+                if not self._running:
+                    return
+                _, _, handle_id = heapq.heappop(self._queue)
+                handle = self._handles.get(handle_id)
+                resolver = self._resolvers.get(handle_id)
+            
+            if handle is not None and resolver is not None:
+                self._attempt(handle, resolver)
+            self._prune()
+    
+    def _attempt(self, handle: TriggerHandle, resolver: Resolver) -> None:
+        """Poll a handle once and resolve, reschedule or expire it."""
+        if handle.done():
+            return
+        
+        handle.attempts += 1
+        candidates = self._candidates(handle, resolver)
+        
+        with self._condition:
+            if handle.done():
+                return
+            
+            run = self._claim(handle, candidates)
+            if run is not None:
+                self._finish(handle, 'resolved', run)
+                logger.debug(f"Correlated {handle.kind} {handle.id} to run {run.id} after {handle.attempts} polls")
+            else:
+                self._retry_or_expire(handle)
+    
+    @staticmethod
+    def _candidates(handle: TriggerHandle, resolver: Resolver) -> List[PipelineRun]:
+        """Ask a resolver for candidate runs, treating failures as no candidates."""
+        try:
+            return list(resolver(handle))
+        except RateLimitError:
+            return []
+        except Exception as e:
+            logger.warning(f"Correlating {handle.kind} {handle.id} of {handle.provider} failed: {e}")
+            return []
+    
+    def _claim(self, handle: TriggerHandle, candidates: List[PipelineRun]) -> Optional[PipelineRun]:
+        """
+        Pick the run of a handle among candidates; caller holds the lock.
+        
+        Dispatched runs are claimed oldest first, so each run goes to one
+        handle only. Without a marker, concurrent dispatches of the same
+        pipeline and ref can't be told apart and may swap runs; that case
+        is logged.
+        """
+        if handle.kind != 'dispatch':
+            return candidates[0] if candidates else None
+        
+        unclaimed = [run for run in candidates if (handle.provider, run.id) not in self._claimed]
+        if not unclaimed:
+            return None
+        if handle.marker is None and len(unclaimed) > 1:
+            logger.warning(
+                f"Dispatch {handle.id} of {handle.provider} has no correlation marker and "
+                f"{len(unclaimed)} candidate runs; claiming the oldest, which may belong to a concurrent dispatch"
+            )
+        
+        self._claimed.add((handle.provider, unclaimed[0].id))
+        return unclaimed[0]
+    
+    def _retry_or_expire(self, handle: TriggerHandle) -> None:
+        """Schedule the next poll of an unresolved handle or give up; caller holds the lock."""
+        elapsed = self._clock() - self._started[handle.id]
+        if elapsed >= self.timeout:
+            self._finish(handle, 'timeout', None)
+            logger.warning(f"Gave up correlating {handle.kind} {handle.id} of {handle.provider}")
+            return
+        
+        if not any(queued_id == handle.id for _, _, queued_id in self._queue):
+            delay = min(self.max_delay, self.initial_delay * 2 ** handle.attempts)
+            self._schedule(handle.id, delay)
+    
+    def _finish(self, handle: TriggerHandle, state: str, run: Optional[PipelineRun]) -> None:
+        """Mark a handle as finished; caller holds the lock."""
+        handle.state = state
+        handle.run = run
+        handle.finished_at = self._clock()
+        self._resolvers.pop(handle.id, None)
+        handle._done.set()
+    
+    def _prune(self) -> None:
+        """Drop finished handles past their retention period."""
+        now = self._clock()
+        with self._condition:
+            expired = [
+                handle_id for handle_id, handle in self._handles.items()
+                if handle.finished_at is not None and now - handle.finished_at > self.retention
+            ]
+            for handle_id in expired:
+                handle = self._handles.pop(handle_id)
+                self._started.pop(handle_id, None)
+                if handle.run is not None:
+                    self._claimed.discard((handle.provider, handle.run.id))
+
+
+# Global correlator instance
+_correlator: Optional[RunCorrelator] = None
+
+
+def get_correlator() -> RunCorrelator:
+    """
+    Get global run correlator instance.
+    
+    Returns:
+        RunCorrelator instance
+    """
+    global _correlator
+    
+    if _correlator is None:
+        _correlator = RunCorrelator()
+    
+    return _correlator
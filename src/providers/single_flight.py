@@ -0,0 +1,105 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same thing share one execution: the
+first caller runs the function, the others wait for it and receive the
+same result or exception. Nothing is cached once the call has finished.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of concurrent identical calls.
+    
+    Keys are tuples such as ``(provider, operation, args)``; the
+    operation name is used to break the metrics down.
+    """
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced: Counter = Counter()
+    
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function, or wait for the identical call already in flight.
+        
+        Args:
+            key: Identity of the call, e.g. (provider, operation, args)
+            fn: Function to run
+            *args: Arguments passed to the function
+        
+        Returns:
+            Result of the shared call
+        
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced[self._operation(key)] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    @staticmethod
+    def _operation(key: Hashable) -> str:
+        """Operation name of a key, for metrics."""
+        if isinstance(key, tuple) and len(key) > 1:
+            return str(key[1])
+        return str(key)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+        
+        Returns:
+            Dictionary with executed calls, coalesced calls in total and
+            per operation, and calls currently in flight
+        """
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': sum(self.coalesced.values()),
+                'coalesced_by_operation': dict(self.coalesced),
+                'in_flight': len(self._calls)
+            }
@@ -0,0 +1,209 @@
+"""
+Stale-while-revalidate cache for provider reads.
+
+Values younger than their TTL are served as they are. Once the TTL has
+passed, the stale value is still served immediately and a single
+background refresh replaces it. Values older than the max-staleness cap
+are never served; the caller waits for a fresh load instead.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """A cached value and when it was loaded."""
+    value: Any
+    stored_at: float
+    refreshing: bool = False
+
+
+class StaleWhileRevalidateCache:
+    """
+    Thread-safe, size-bounded LRU cache with background revalidation.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        refresh_workers: int = 4,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of cached values
+            refresh_workers: Threads used for background refreshes
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.refresh_workers = refresh_workers
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor used for background refreshes."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.refresh_workers,
+                thread_name_prefix='flowforge-swr'
+            )
+        return self._executor
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a freshly loaded value.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = _Entry(value=value, stored_at=self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def peek(self, key: Hashable, max_staleness: float) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached value without loading or refreshing it.
+        
+        Args:
+            key: Cache key
+            max_staleness: Maximum age in seconds of a value that may be served
+        
+        Returns:
+            Tuple of value and age in seconds, or None if absent or too old
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            age = self._clock() - entry.stored_at
+            if age > max_staleness:
+                return None
+            self._entries.move_to_end(key)
+            return entry.value, age
+    
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float,
+        max_staleness: float
+    ) -> Tuple[Any, float]:
+        """
+        Get a value, serving stale data while it is revalidated.
+        
+        Args:
+            key: Cache key
+            loader: Callable loading a fresh value
+            ttl: Seconds a value is fresh
+            max_staleness: Seconds after which a stale value is not served
+        
+        Returns:
+            Tuple of value and its age in seconds
+        """
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            age = self._clock() - entry.stored_at if entry else None
+            
+            if entry is not None and age <= max_staleness:
+                self._entries.move_to_end(key)
+                if age <= ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    refresh = True
+                value = entry.value
+            else:
+                self.misses += 1
+                entry = None
+        
+        if entry is None:
+            value = loader()
+            self.put(key, value)
+            return value, 0.0
+        
+        if refresh:
+            self.revalidate(key, loader)
+        return value, age
+    
+    def revalidate(self, key: Hashable, loader: Callable[[], Any]) -> bool:
+        """
+        Start a background refresh of a cached value unless one is running.
+        
+        Args:
+            key: Cache key
+            loader: Callable loading a fresh value
+        
+        Returns:
+            True if a refresh was started
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refreshing:
+                return False
+            entry.refreshing = True
+            self.refreshes += 1
+        
+        # Refresh in the caller's context so it keeps the caller's request priority
+        self._get_executor().submit(copy_context().run, self._refresh, key, loader, entry)
+        return True
+    
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], entry: _Entry) -> None:
+        """Reload a stale value in the background."""
+        try:
+            self.put(key, loader())
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {e}")
+            with self._lock:
+                entry.refreshing = False
+    
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Drop cached values.
+        
+        Args:
+            predicate: Selects keys to drop, or None for everything
+        """
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entry count, fresh and stale hits, misses and
+            background refreshes
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes
+            }
@@ -0,0 +1,223 @@
+"""
+Shared HTTP transport for provider plugins.
+
+Provides one tuned ``requests.Session`` per API host, so every provider
+pointing at the same base URL reuses the same keep-alive pool. Sessions
+apply connect/read timeouts to every request, retry idempotent calls
+with exponential backoff and jitter on 5xx and connection errors,
+and record a per-host request latency histogram.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import config
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe per-host histogram of request latencies.
+    
+    Latencies are counted into fixed buckets (see LATENCY_BUCKETS), with
+    a final overflow bucket for anything slower.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize histogram.
+        
+        Args:
+            buckets: Ascending bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self._counts: Dict[str, list] = {}
+        self._totals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, host: str, seconds: float) -> None:
+        """
+        Record one request latency.
+        
+        Args:
+            host: Request host
+            seconds: Request duration in seconds
+        """
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.setdefault(host, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._totals[host] = self._totals.get(host, 0.0) + seconds
+    
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get histogram contents.
+        
+        Returns:
+            Dictionary mapping host to request count, mean latency and bucket counts
+        """
+        labels = [f'le_{bound}' for bound in self.buckets] + ['le_inf']
+        with self._lock:
+            result = {}
+            for host, counts in self._counts.items():
+                total = sum(counts)
+                result[host] = {
+                    'count': total,
+                    'mean': self._totals[host] / total if total else 0.0,
+                    'buckets': dict(zip(labels, counts))
+                }
+            return result
+
+
+class TimeoutSession(requests.Session):
+    """
+    Session applying default timeouts and recording request latency.
+    """
+    
+    def __init__(self, timeout: Tuple[float, float], histogram: LatencyHistogram):
+        """
+        Initialize session.
+        
+        Args:
+            timeout: Default (connect, read) timeout in seconds
+            histogram: Histogram receiving request latencies
+        """
+        super().__init__()
+        self.timeout = timeout
+        self.histogram = histogram
+    
+    def request(self, method, url, **kwargs):
+        """Send a request with the default timeout unless one is given."""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        
+        started = time.monotonic()
+        try:
+            return super().request(method, url, **kwargs)
+        finally:
+            self.histogram.observe(urlparse(url).netloc, time.monotonic() - started)
+
+
+class HttpTransport:
+    """
+    Factory of shared, tuned sessions keyed by API host.
+    """
+    
+    def __init__(
+        self,
+        pool_maxsize: int = 20,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_jitter: float = 0.5
+    ):
+        """
+        Initialize transport.
+        
+        Args:
+            pool_maxsize: Keep-alive connections kept per host
+            connect_timeout: Connect timeout in seconds
+            read_timeout: Read timeout in seconds
+            max_retries: Retries on 5xx and connection errors
+            backoff_factor: Base of the exponential backoff in seconds
+            backoff_jitter: Maximum random jitter added to each backoff
+        """
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        self.histogram = LatencyHistogram()
+        self._sessions: Dict[str, TimeoutSession] = {}
+        self._pool_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def _make_adapter(self, pool_maxsize: int) -> HTTPAdapter:
+        """Build an adapter with the configured pool size and retry policy."""
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            # 429 is left to the rate-limit governor, which caps how long a Retry-After may block
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    
+    def session_for(self, base_url: str, pool_maxsize: Optional[int] = None) -> requests.Session:
+        """
+        Get the shared session for an API host.
+        
+        Sessions carry no credentials; providers send their own
+        Authorization header with every request.
+        
+        Args:
+            base_url: API base URL
+            pool_maxsize: Minimum pool size needed by the caller; the pool
+                          is enlarged if it is currently smaller
+        
+        Returns:
+            Shared session for the host
+        """
+        parsed = urlparse(base_url)
+        host = f'{parsed.scheme}://{parsed.netloc}'
+        wanted = max(pool_maxsize or 0, self.pool_maxsize)
+        
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = TimeoutSession(self.timeout, self.histogram)
+                self._sessions[host] = session
+            
+            if self._pool_sizes.get(host, 0) < wanted:
+                session.mount(f'{host}/', self._make_adapter(wanted))
+                self._pool_sizes[host] = wanted
+            
+            return session
+    
+    def stats(self) -> Dict[str, object]:
+        """
+        Get transport statistics.
+        
+        Returns:
+            Dictionary with pool sizes per host and the latency histogram
+        """
+        with self._lock:
+            pools = dict(self._pool_sizes)
+        return {'pools': pools, 'latency': self.histogram.snapshot()}
+
+
+# Global transport instance
+_transport: Optional[HttpTransport] = None
+
+
+def get_transport() -> HttpTransport:
+    """
+    Get global HTTP transport instance.
+    
+    Returns:
+        HttpTransport instance configured from application settings
+    """
+    global _transport
+    
+    if _transport is None:
+        _transport = HttpTransport(
+            pool_maxsize=config.HTTP_POOL_MAXSIZE,
+            connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+            read_timeout=config.HTTP_READ_TIMEOUT,
+            max_retries=config.HTTP_MAX_RETRIES,
+            backoff_factor=config.HTTP_BACKOFF_FACTOR
+        )
+    
+    return _transport
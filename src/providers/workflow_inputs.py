@@ -0,0 +1,244 @@
+"""
+Workflow dispatch input schemas.
+
+Parses the ``workflow_dispatch`` inputs of GitHub Actions workflow files
+and validates trigger payloads against them locally. Parsed schemas are
+cached by the blob SHA of the workflow file, so a file is parsed once
+per revision no matter how many providers or API clients ask for it.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+from src.utils.errors import ValidationError
+
+# Input types supported by workflow_dispatch
+INPUT_TYPES = ('string', 'boolean', 'number', 'choice', 'environment')
+
+
+@dataclass
+class WorkflowInputs:
+    """
+    Dispatch input schema of a workflow file.
+    
+    Attributes:
+        dispatchable: Whether the workflow has a workflow_dispatch trigger
+        inputs: Input name -> type, description, required, default and options
+    """
+    dispatchable: bool
+    inputs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _triggers(document: Dict[Any, Any]) -> Dict[str, Any]:
+    """Normalize the ``on`` section of a workflow to a trigger mapping."""
+    # YAML 1.1 reads a bare ``on`` key as boolean True
+    triggers = document.get('on', document.get(True))
+    
+    if isinstance(triggers, str):
+        return {triggers: None}
+    if isinstance(triggers, list):
+        return {name: None for name in triggers}
+    return triggers if isinstance(triggers, dict) else {}
+
+
+def _parse_input(spec: Any) -> Dict[str, Any]:
+    """Parse one declared input, treating a malformed spec as an optional string."""
+    if not isinstance(spec, dict):
+        spec = {}
+    
+    input_type = spec.get('type', 'string')
+    options = spec.get('options')
+    return {
+        'type': input_type if input_type in INPUT_TYPES else 'string',
+        'description': spec.get('description', ''),
+        'required': bool(spec.get('required', False)),
+        'default': spec.get('default'),
+        'options': [str(option) for option in options] if isinstance(options, list) else []
+    }
+
+
+def parse_dispatch_inputs(content: str) -> WorkflowInputs:
+    """
+    Parse the workflow_dispatch inputs of a workflow file.
+    
+    Args:
+        content: Workflow file content (YAML)
+    
+    Returns:
+        WorkflowInputs describing the dispatch trigger
+    
+    Raises:
+        ValidationError: If the file is not a valid workflow
+    """
+    try:
+        document = yaml.safe_load(content) or {}
+    except yaml.YAMLError as e:
+        raise ValidationError(f"Invalid workflow file: {e}")
+    
+    if not isinstance(document, dict):
+        raise ValidationError("Invalid workflow file: expected a mapping")
+    
+    triggers = _triggers(document)
+    if 'workflow_dispatch' not in triggers:
+        return WorkflowInputs(dispatchable=False)
+    
+    dispatch = triggers.get('workflow_dispatch')
+    declared = dispatch.get('inputs') if isinstance(dispatch, dict) else None
+    if not isinstance(declared, dict):
+        declared = {}
+    
+    inputs = {str(name): _parse_input(spec) for name, spec in declared.items()}
+    return WorkflowInputs(dispatchable=True, inputs=inputs)
+
+
+def _dispatch_value(value: Any) -> str:
+    """Convert an input value to the string the dispatch API expects."""
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _input_error(name: str, spec: Dict[str, Any], value: Any) -> Optional[str]:
+    """Check one supplied input against its spec, returning the problem if any."""
+    text = _dispatch_value(value)
+    
+    if spec['type'] == 'boolean' and text not in ('true', 'false'):
+        return f"input '{name}' must be true or false"
+    if spec['type'] == 'number':
+        try:
+            float(text)
+        except ValueError:
+            return f"input '{name}' must be a number"
+    if spec['type'] == 'choice' and text not in spec['options']:
+        return f"input '{name}' must be one of {', '.join(spec['options'])}"
+    return None
+
+
+def validate_inputs(schema: WorkflowInputs, inputs: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Validate trigger inputs against a dispatch schema.
+    
+    Args:
+        schema: Dispatch input schema
+        inputs: Inputs supplied by the caller
+    
+    Returns:
+        Inputs converted to the string values the dispatch API expects
+    
+    Raises:
+        ValidationError: If the workflow can't be dispatched or an input is invalid
+    """
+    if not schema.dispatchable:
+        raise ValidationError("Workflow does not have a workflow_dispatch trigger")
+    
+    inputs = inputs or {}
+    errors = [f"unexpected input '{name}'" for name in inputs if name not in schema.inputs]
+    
+    for name, spec in schema.inputs.items():
+        if name in inputs:
+            error = _input_error(name, spec, inputs[name])
+        elif spec['required'] and spec['default'] is None:
+            error = f"missing required input '{name}'"
+        else:
+            error = None
+        if error:
+            errors.append(error)
+    
+    if errors:
+        raise ValidationError("Invalid workflow inputs: " + '; '.join(errors))
+    
+    return {name: _dispatch_value(value) for name, value in inputs.items()}
+
+
+class WorkflowSchemaCache:
+    """
+    Thread-safe LRU cache of parsed dispatch schemas keyed by blob SHA.
+    
+    A blob SHA identifies the file content, so entries never go stale;
+    they are only evicted when the cache is full.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of cached schemas
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, WorkflowInputs]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.parses = 0
+    
+    def get(self, blob_sha: str) -> Optional[WorkflowInputs]:
+        """
+        Get a parsed schema.
+        
+        Args:
+            blob_sha: Blob SHA of the workflow file
+        
+        Returns:
+            WorkflowInputs, or None if not cached
+        """
+        with self._lock:
+            schema = self._entries.get(blob_sha)
+            if schema is not None:
+                self._entries.move_to_end(blob_sha)
+                self.hits += 1
+            return schema
+    
+    def get_or_parse(self, blob_sha: str, load: Callable[[], str]) -> WorkflowInputs:
+        """
+        Get a parsed schema, parsing the file if its revision is new.
+        
+        Args:
+            blob_sha: Blob SHA of the workflow file
+            load: Callable returning the file content
+        
+        Returns:
+            WorkflowInputs for the file revision
+        """
+        schema = self.get(blob_sha)
+        if schema is not None:
+            return schema
+        
+        schema = parse_dispatch_inputs(load())
+        with self._lock:
+            self.parses += 1
+            self._entries[blob_sha] = schema
+            self._entries.move_to_end(blob_sha)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return schema
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entry count, hits and parses
+        """
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'parses': self.parses}
+
+
+# Global schema cache instance
+_schema_cache: Optional[WorkflowSchemaCache] = None
+
+
+def get_schema_cache() -> WorkflowSchemaCache:
+    """
+    Get global workflow schema cache instance.
+    
+    Returns:
+        WorkflowSchemaCache instance
+    """
+    global _schema_cache
+    
+    if _schema_cache is None:
+        _schema_cache = WorkflowSchemaCache()
+    
+    return _schema_cache
@@ -0,0 +1,122 @@
+"""
+Workflow metadata cache.
+
+Keeps the static description of a provider's workflows (name, file path,
+state and dispatch inputs) so triggering and parameter lookups don't need
+a round trip to the provider just to learn what the pipeline listing
+already returned.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class WorkflowMetadata:
+    """
+    Static description of a workflow.
+    
+    Attributes:
+        id: Workflow identifier
+        name: Workflow name
+        path: Workflow file path in the repository
+        state: Provider-reported state (e.g. active, disabled_manually)
+        inputs: Dispatch inputs, once known
+    """
+    id: str
+    name: str
+    path: str
+    state: Optional[str] = None
+    inputs: Optional[Dict[str, Any]] = None
+
+
+class WorkflowMetadataCache:
+    """
+    Thread-safe per-provider cache of workflow metadata with a TTL.
+    
+    Entries are refreshed as a side effect of listing pipelines and expire
+    ``ttl`` seconds after they were last stored. Known dispatch inputs
+    survive a refresh as long as the workflow file path is unchanged.
+    """
+    
+    def __init__(self, ttl: float = 600, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize cache.
+        
+        Args:
+            ttl: Seconds an entry stays valid after it was stored
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, WorkflowMetadata]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, workflow_id: str) -> Optional[WorkflowMetadata]:
+        """
+        Get metadata of a workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+        
+        Returns:
+            WorkflowMetadata, or None if unknown or expired
+        """
+        with self._lock:
+            cached = self._entries.get(str(workflow_id))
+            if cached is None or self._clock() - cached[0] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return cached[1]
+    
+    def put(self, metadata: WorkflowMetadata) -> WorkflowMetadata:
+        """
+        Store metadata of a workflow.
+        
+        Args:
+            metadata: Workflow metadata
+        
+        Returns:
+            The stored metadata, carrying over known inputs of the same file
+        """
+        with self._lock:
+            previous = self._entries.get(metadata.id)
+            if metadata.inputs is None and previous and previous[1].path == metadata.path:
+                metadata = replace(metadata, inputs=previous[1].inputs)
+            self._entries[metadata.id] = (self._clock(), metadata)
+            return metadata
+    
+    def set_inputs(self, workflow_id: str, inputs: Dict[str, Any]) -> None:
+        """
+        Record the dispatch inputs of a cached workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+            inputs: Dispatch inputs
+        """
+        with self._lock:
+            cached = self._entries.get(str(workflow_id))
+            if cached is not None:
+                self._entries[str(workflow_id)] = (cached[0], replace(cached[1], inputs=inputs))
+    
+    def invalidate(self, workflow_id: Optional[str] = None) -> None:
+        """
+        Drop cached metadata.
+        
+        Args:
+            workflow_id: Workflow to drop, or None to drop everything
+        """
+        with self._lock:
+            if workflow_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(workflow_id), None)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
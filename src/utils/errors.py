@@ -32,3 +32,15 @@ class ConfigurationError(FlowForgeError):
     """Exception raised for configuration errors."""
     pass
 
+
+class RateLimitError(ProviderError):
+    """Exception raised when a request is deferred because of rate limits."""
+    
+    def __init__(self, message: str, provider_name: str = None, retry_after: float = None):
+        super().__init__(message, provider_name)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(ProviderError):
+    """Exception raised when a provider's circuit breaker refuses a call."""
+    pass
@@ -1,45 +1,117 @@
 """
 Pipeline poller for background updates.
 
-Polls providers at configured intervals and updates cache,
+Polls each provider at its own configured interval and updates cache,
 inspired by pipedash's background refresh mechanism.
+
+Polling runs in two stages: a bounded pool of fetch workers talks to the
+providers, and a single writer thread saves their results in short
+batched transactions. The stages are connected by a bounded queue, so a
+slow database pushes back on fetching instead of holding a transaction
+open across network calls.
 """
 
-import time
+import queue
 import threading
 import logging
-from typing import List, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
+from src.config import config
+from src.providers.async_base import AsyncProviderAdapter
 from src.providers.registry import ProviderRegistry
-from src.providers.base import BaseProvider
-from src.database.db import get_db_manager
-from src.database.models import PipelineModel, PipelineRunModel
+from src.providers.base import BaseProvider, Pipeline, PipelineStatus
+from src.providers.github_graphql import GraphQLBatchFetcher
+from src.providers.rate_limit import RequestPriority, get_governor, request_priority
+from src.database.db import DatabaseManager, get_db_manager
+from src.database.pipeline_changes import ChangeDetector, PipelineDiff, get_change_detector
+from src.database.pipeline_upsert import delete_pipelines, upsert_pipelines
+from src.database.run_sync import RunBatch, RunHistorySync, get_run_sync
+from src.utils.errors import CircuitOpenError
+from src.workers.poll_scheduler import PollScheduler
 
 logger = logging.getLogger(__name__)
 
+# Statuses that keep a provider on its shortest poll interval: runs that are
+# queued or in progress. PENDING is left out since it also covers workflows
+# without runs and skipped or timed-out runs, which would never back off.
+ACTIVE_STATUSES = (PipelineStatus.RUNNING,)
+
+# Most fetched provider results saved in one write transaction
+WRITE_BATCH_SIZE = 16
+
+# Fraction of its interval by which a provider's poll is brought forward to share a GraphQL batch
+BATCH_PULL_AHEAD = 0.25
+
+
+@dataclass
+class _PollResult:
+    """A provider's changed pipelines and new runs, waiting to be written."""
+    provider: BaseProvider
+    changes: PipelineDiff
+    runs: List[RunBatch]
+
 
 class PipelinePoller:
     """
     Background worker for polling providers and updating cache.
     
-    Runs in a separate thread and periodically fetches pipeline data
-    from all enabled providers, updating the local cache.
+    Runs in a separate thread and fetches pipeline data from each
+    enabled provider when it is due, updating the local cache. Each
+    provider's effective interval adapts between its min and max
+    refresh interval: it drops to the minimum while pipelines are
+    running, pending or just changed, and backs off exponentially
+    while nothing changes.
     """
     
-    def __init__(self, registry: ProviderRegistry, interval: int = 30):
+    def __init__(
+        self,
+        registry: ProviderRegistry,
+        interval: int = 30,
+        jitter: Optional[float] = None,
+        backoff: float = 2.0,
+        workers: Optional[int] = None,
+        write_queue_size: Optional[int] = None,
+        db: Optional[DatabaseManager] = None,
+        run_sync: Optional[RunHistorySync] = None,
+        changes: Optional[ChangeDetector] = None
+    ):
         """
         Initialize pipeline poller.
         
         Args:
             registry: Provider registry
-            interval: Default polling interval in seconds
+            interval: Polling interval in seconds for providers without one
+            jitter: Fraction of each interval by which polls are randomized
+            backoff: Factor by which an idle provider's interval grows per poll
+            workers: Number of providers fetched at once
+            write_queue_size: Fetched results that may wait for the writer
+            db: Database manager, defaults to the global one
+            run_sync: Run-history sync, defaults to the global one
+            changes: Change detector, defaults to the global one
         """
         self.registry = registry
         self.default_interval = interval
+        self.jitter = config.POLL_JITTER if jitter is None else jitter
+        self.backoff = backoff
+        self.workers = workers or config.POLL_WORKERS
+        self.write_queue_size = write_queue_size or config.POLL_WRITE_QUEUE_SIZE
+        self._intervals: Dict[str, float] = {}
+        self._active: Dict[str, bool] = {}
+        self._signatures: Dict[str, FrozenSet[Tuple]] = {}
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        self.db = get_db_manager()
+        self.writer: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._in_flight_lock = threading.Lock()
+        self._writes: "queue.Queue[Optional[_PollResult]]" = queue.Queue(maxsize=self.write_queue_size)
+        self.scheduler = PollScheduler(jitter=self.jitter)
+        self._stopped = threading.Event()
+        self.db = db or get_db_manager()
+        self.run_sync = run_sync or get_run_sync()
+        self.changes = changes or get_change_detector()
     
     def start(self) -> None:
         """Start the polling loop in background thread."""
@@ -48,107 +120,329 @@ class PipelinePoller:
             return
         
         self.running = True
+        self.scheduler = PollScheduler(jitter=self.jitter)
+        self._stopped.clear()
+        self._in_flight.clear()
+        self._writes = queue.Queue(maxsize=self.write_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='flowforge-poll')
+        self.registry.add_listener(self._on_registry_change)
+        self.writer = threading.Thread(target=self._write_loop, args=(self._writes,), daemon=True)
+        self.writer.start()
         self.thread = threading.Thread(target=self._poll_loop, daemon=True)
         self.thread.start()
-        logger.info("Pipeline poller started")
+        logger.info(f"Pipeline poller started with {self.workers} fetch workers")
     
     def stop(self) -> None:
-        """Stop the polling loop."""
+        """
+        Stop the polling loop, waking it if it is waiting for the next poll.
+        
+        Fetches in progress are abandoned; results already queued are
+        written before the writer exits.
+        """
         self.running = False
+        self.registry.remove_listener(self._on_registry_change)
+        self.scheduler.close()
+        self._stopped.set()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
         if self.thread:
             self.thread.join(timeout=5)
+        if self.writer:
+            self._writes.put(None)
+            self.writer.join(timeout=5)
         logger.info("Pipeline poller stopped")
     
+    def _on_registry_change(self, event: str, name: str) -> None:
+        """Reschedule promptly when providers are added or removed."""
+        self.scheduler.wake()
+    
+    def _base_interval(self, provider: BaseProvider) -> float:
+        """Get the configured refresh interval of a provider in seconds."""
+        return provider.config.refresh_interval or self.default_interval
+    
+    def _interval(self, provider: BaseProvider) -> float:
+        """Get the current effective refresh interval of a provider in seconds."""
+        return self._intervals.get(provider.name) or self._base_interval(provider)
+    
+    def _adapt(self, provider: BaseProvider, pipelines: List[Pipeline]) -> float:
+        """
+        Adjust a provider's effective interval after a successful poll.
+        
+        Args:
+            provider: Polled provider
+            pipelines: Pipelines it returned
+        
+        Returns:
+            New effective interval in seconds
+        """
+        signature = frozenset((p.id, p.status.value, p.started_at) for p in pipelines)
+        previous = self._signatures.get(provider.name)
+        self._signatures[provider.name] = signature
+        
+        active = any(p.status in ACTIVE_STATUSES for p in pipelines)
+        changed = previous is not None and previous != signature
+        self._active[provider.name] = active
+        
+        low = provider.min_refresh_interval
+        high = max(low, provider.max_refresh_interval)
+        if active or changed:
+            interval = low
+        elif previous is None:
+            interval = self._base_interval(provider)
+        else:
+            interval = self._interval(provider) * self.backoff
+        interval = min(max(interval, low), high)
+        
+        if interval != self._intervals.get(provider.name):
+            logger.debug(f"Polling {provider.name} every {interval:.0f}s (active={active}, changed={changed})")
+        self._intervals[provider.name] = interval
+        return interval
+    
+    def _forget(self, name: str) -> None:
+        """Drop the adaptive state of a provider."""
+        self._intervals.pop(name, None)
+        self._active.pop(name, None)
+        self._signatures.pop(name, None)
+    
+    def effective_intervals(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current effective poll interval of every enabled provider.
+        
+        Returns:
+            Dictionary of provider name to its effective, min and max
+            interval, whether it has active pipelines and seconds until
+            its next poll
+        """
+        intervals = {}
+        for provider in self.registry.get_enabled():
+            next_poll = self.scheduler.seconds_until(provider.name)
+            intervals[provider.name] = {
+                'interval': round(self._interval(provider), 1),
+                'min_interval': provider.min_refresh_interval,
+                'max_interval': provider.max_refresh_interval,
+                'active': self._active.get(provider.name, False),
+                'next_poll_in': round(next_poll, 1) if next_poll is not None else None
+            }
+        return intervals
+    
     def _poll_loop(self) -> None:
         """Main polling loop."""
+        # Poller traffic yields to interactive API calls
+        with request_priority(RequestPriority.BACKGROUND):
+            self._run_polls()
+    
+    def _run_polls(self) -> None:
+        """Refresh providers as they fall due until stopped."""
         while self.running:
             try:
-                self._update_cache()
-                
-                # Wait for next poll (use shortest interval among providers)
-                providers = self.registry.get_enabled()
-                if providers:
-                    min_interval = min(
-                        p.config.refresh_interval for p in providers
-                    ) or self.default_interval
-                else:
-                    min_interval = self.default_interval
+                self._sync_schedule()
+                due = self.scheduler.wait_due()
+                if not due or not self.running:
+                    continue
                 
-                time.sleep(min_interval)
+                providers = [p for p in map(self.registry.get, due) if p and p.config.enabled]
+                self._dispatch(providers)
             
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
-                time.sleep(self.default_interval)
+                self._stopped.wait(self.default_interval)
     
-    def _update_cache(self) -> None:
-        """
-        Update cache with latest pipeline data from all providers.
+    def _sync_schedule(self) -> None:
+        """Schedule newly enabled providers and drop removed or disabled ones."""
+        enabled = {p.name: p for p in self.registry.get_enabled()}
+        
+        for name in self.scheduler.names():
+            if name not in enabled:
+                self.scheduler.remove(name)
+                self._forget(name)
         
-        Fetches pipelines from all enabled providers and updates
-        the database cache.
+        with self._in_flight_lock:
+            in_flight = set(self._in_flight)
+        
+        for name, provider in enabled.items():
+            if name not in self.scheduler and name not in in_flight:
+                self.scheduler.schedule_first(name, self._interval(provider))
+    
+    def _reschedule(self, providers: List[BaseProvider]) -> None:
+        """Schedule the next poll of providers, stretching intervals when quota is low."""
+        stretch = get_governor().interval_multiplier()
+        if stretch > 1.0:
+            logger.info(f"Rate-limit quota low, stretching poll interval by {stretch:.1f}x")
+        
+        for provider in providers:
+            if self.registry.get(provider.name) is provider:
+                self.scheduler.schedule_next(provider.name, self._interval(provider) * stretch)
+    
+    def _dispatch(self, providers: List[BaseProvider]) -> None:
         """
-        providers = self.registry.get_enabled()
+        Hand due providers to the fetch workers.
         
+        Async providers are fetched together on the shared event loop,
+        and GitHub providers sharing a host and token together in one
+        GraphQL batch; every other provider gets a job of its own. A
+        provider is only rescheduled once its job finishes, so it is
+        never polled twice at the same time.
+        
+        Args:
+            providers: Providers that are due
+        """
         if not providers:
             return
         
-        logger.debug(f"Updating cache from {len(providers)} providers")
+        providers = providers + self._batch_partners(providers)
+        logger.debug(f"Polling {len(providers)} providers")
         
-        with self.db.get_session() as session:
-            for provider in providers:
-                try:
-                    pipelines = provider.fetch_pipelines()
-                    self._save_pipelines(session, provider, pipelines)
-                except Exception as e:
-                    logger.error(f"Error fetching from {provider.name}: {e}")
-                    continue
+        async_group = [p for p in providers if isinstance(p, AsyncProviderAdapter)]
+        compatible = [p for p in providers if GraphQLBatchFetcher.supports(p)]
+        batches = [group for group in GraphQLBatchFetcher.group(compatible).values() if len(group) > 1]
+        batched = {p.name for group in batches for p in group}
+        
+        jobs = [
+            [p] for p in providers
+            if not isinstance(p, AsyncProviderAdapter) and p.name not in batched
+        ]
+        jobs.extend(batches)
+        if async_group:
+            jobs.append(async_group)
+        
+        with self._in_flight_lock:
+            self._in_flight.update(p.name for p in providers)
+        
+        for job in jobs:
+            try:
+                self._executor.submit(self._poll, job)
+            except RuntimeError:
+                return  # Shut down while dispatching
+    
+    def _batch_partners(self, providers: List[BaseProvider]) -> List[BaseProvider]:
+        """
+        Take GraphQL batch partners of due providers off the schedule.
+        
+        Providers sharing a batch with a due provider are polled along
+        with it when they would fall due shortly anyway, so batches
+        aren't split up by jittered due times.
+        
+        Args:
+            providers: Providers that are due
+        
+        Returns:
+            Additional providers to poll now
+        """
+        keys = {GraphQLBatchFetcher.group_key(p) for p in providers if GraphQLBatchFetcher.supports(p)}
+        if not keys:
+            return []
+        
+        due = {p.name for p in providers}
+        return [
+            provider for provider in self.registry.get_enabled()
+            if provider.name not in due
+            and GraphQLBatchFetcher.supports(provider)
+            and GraphQLBatchFetcher.group_key(provider) in keys
+            and self.scheduler.take(provider.name, BATCH_PULL_AHEAD * self._interval(provider))
+        ]
     
-    def _save_pipelines(self, session, provider: BaseProvider, pipelines: List) -> None:
+    def _poll(self, providers: List[BaseProvider]) -> None:
         """
-        Save pipelines to database cache.
+        Fetch pipelines and new runs of providers and queue them for writing.
+        
+        Runs on a fetch worker; blocks while the write queue is full.
         
         Args:
-            session: Database session
-            provider: Provider instance
-            pipelines: List of Pipeline objects
+            providers: Providers to refresh
         """
-        for pipeline in pipelines:
+        # Poller traffic yields to interactive API calls
+        with request_priority(RequestPriority.BACKGROUND):
             try:
-                # Check if pipeline exists
-                existing = session.query(PipelineModel).filter_by(
-                    id=pipeline.id
-                ).first()
+                batched = {
+                    **self.registry.fetch_async_pipelines(providers),
+                    **self.registry.fetch_graphql_pipelines(providers)
+                }
                 
-                if existing:
-                    # Update existing
-                    existing.status = pipeline.status.value
-                    existing.branch = pipeline.branch
-                    existing.commit = pipeline.commit
-                    existing.commit_message = pipeline.commit_message
-                    existing.author = pipeline.author
-                    existing.started_at = datetime.fromisoformat(pipeline.started_at.replace('Z', '+00:00')) if pipeline.started_at else None
-                    existing.finished_at = datetime.fromisoformat(pipeline.finished_at.replace('Z', '+00:00')) if pipeline.finished_at else None
-                    existing.updated_at = datetime.utcnow()
-                else:
-                    # Create new
-                    pipeline_model = PipelineModel(
-                        id=pipeline.id,
-                        name=pipeline.name,
-                        status=pipeline.status.value,
-                        repository=pipeline.repository,
-                        branch=pipeline.branch,
-                        commit=pipeline.commit,
-                        commit_message=pipeline.commit_message,
-                        author=pipeline.author,
-                        url=pipeline.url,
-                        started_at=datetime.fromisoformat(pipeline.started_at.replace('Z', '+00:00')) if pipeline.started_at else None,
-                        finished_at=datetime.fromisoformat(pipeline.finished_at.replace('Z', '+00:00')) if pipeline.finished_at else None
-                    )
-                    session.add(pipeline_model)
+                for provider in providers:
+                    try:
+                        if provider.name in batched:
+                            pipelines = batched[provider.name]
+                            if isinstance(pipelines, BaseException):
+                                raise pipelines
+                        else:
+                            pipelines = self.registry.fetch_pipelines(provider)
+                        provider.record_pipelines(pipelines)
+                        self._adapt(provider, pipelines)
+                        changes = self.changes.diff(provider.name, pipelines)
+                        runs = self.run_sync.collect(provider, pipelines)
+                        if changes.changed or changes.removed or runs:
+                            self._enqueue(_PollResult(provider=provider, changes=changes, runs=runs))
+                    except CircuitOpenError:
+                        logger.debug(f"Skipping {provider.name}: circuit open")
+                    except Exception as e:
+                        logger.error(f"Error fetching from {provider.name}: {e}")
+            finally:
+                if self.running:
+                    self._reschedule(providers)
+                with self._in_flight_lock:
+                    self._in_flight.difference_update(p.name for p in providers)
+    
+    def _enqueue(self, result: _PollResult) -> None:
+        """Queue a result for the writer, waiting for room unless stopping."""
+        while self.running:
+            try:
+                self._writes.put(result, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+    
+    def _write_loop(self, writes: "queue.Queue[Optional[_PollResult]]") -> None:
+        """Save fetched results in batches until the stop sentinel arrives."""
+        while True:
+            result = writes.get()
+            if result is None:
+                return
             
+            batch = [result]
+            done = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    result = writes.get_nowait()
+                except queue.Empty:
+                    break
+                if result is None:
+                    done = True
+                    break
+                batch.append(result)
+            
+            try:
+                self._write(batch)
             except Exception as e:
-                logger.error(f"Error saving pipeline {pipeline.id}: {e}")
-                continue
+                logger.error(f"Error writing poll results: {e}")
+            if done:
+                return
+    
+    def _write(self, batch: List[_PollResult]) -> None:
+        """
+        Save a batch of fetched results in one short database session.
         
-        session.commit()
-
+        Only pipelines whose fingerprint changed are written. They are
+        upserted with one statement and committed together with their new
+        fingerprints and the deletion of removed pipelines, after which the
+        change events are published; run history is committed per workflow.
+        
+        Args:
+            batch: Fetched provider results
+        """
+        diffs = [result.changes for result in batch]
+        with self.db.get_session() as session:
+            try:
+                upsert_pipelines(session, [pipeline for diff in diffs for pipeline in diff.changed])
+                delete_pipelines(session, [pipeline_id for diff in diffs for pipeline_id in diff.removed])
+                self.changes.save(session, diffs)
+                session.commit()
+            except Exception:
+                # Reload the fingerprints from the database so the changes are seen again
+                for diff in diffs:
+                    self.changes.forget(diff.provider)
+                raise
+            
+            for result in batch:
+                self.run_sync.write(session, result.runs)
+        
+        self.changes.publish(event for diff in diffs for event in diff.events)
@@ -0,0 +1,214 @@
+"""
+Per-provider poll scheduling.
+
+Each provider keeps its own next-due time in a min-heap, so a provider
+polled every few seconds doesn't drag the others along with it. Due
+times are jittered to keep providers with equal intervals from
+synchronizing into bursts, and waiting threads can be woken early when
+providers are added or removed, or when the poller stops.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class PollScheduler:
+    """
+    Thread-safe min-heap of provider due times.
+    
+    Rescheduling or removing a provider leaves its old heap entry in
+    place; entries that no longer match the provider's current due time
+    are discarded when they reach the top of the heap.
+    """
+    
+    def __init__(
+        self,
+        jitter: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+        first_poll_spread: float = 1.0
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            jitter: Fraction of the interval by which due times are randomized
+            clock: Monotonic time source
+            rng: Random generator used for jitter
+            first_poll_spread: Maximum seconds a new provider's first poll is delayed
+        """
+        self.jitter = jitter
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self.first_poll_spread = first_poll_spread
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, float] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._woken = False
+        self.closed = False
+    
+    def __contains__(self, name: str) -> bool:
+        with self._cond:
+            return name in self._due
+    
+    def names(self) -> List[str]:
+        """
+        Get the names of all scheduled providers.
+        
+        Returns:
+            List of provider names
+        """
+        with self._cond:
+            return list(self._due)
+    
+    def schedule(self, name: str, delay: float) -> None:
+        """
+        Set when a provider is next due, replacing any earlier due time.
+        
+        Args:
+            name: Provider name
+            delay: Seconds from now
+        """
+        with self._cond:
+            due = self._clock() + max(0.0, delay)
+            self._due[name] = due
+            heapq.heappush(self._heap, (due, next(self._seq), name))
+            if self._heap[0][2] == name:
+                # New earliest deadline: let the waiter recompute its timeout
+                self._cond.notify_all()
+    
+    def schedule_first(self, name: str, interval: float) -> None:
+        """
+        Schedule a newly added provider to be polled soon.
+        
+        The first poll is spread over a short window so providers added
+        together don't all fire at once; later polls carry the full jitter.
+        
+        Args:
+            name: Provider name
+            interval: Provider refresh interval in seconds
+        """
+        spread = min(self.jitter * interval, self.first_poll_spread)
+        self.schedule(name, self._rng.uniform(0, spread))
+    
+    def schedule_next(self, name: str, interval: float) -> None:
+        """
+        Schedule a provider one jittered interval from now.
+        
+        Args:
+            name: Provider name
+            interval: Provider refresh interval in seconds
+        """
+        spread = self.jitter * interval
+        self.schedule(name, interval + self._rng.uniform(-spread, spread))
+    
+    def remove(self, name: str) -> None:
+        """
+        Stop scheduling a provider.
+        
+        Args:
+            name: Provider name
+        """
+        with self._cond:
+            self._due.pop(name, None)
+    
+    def take(self, name: str, within: float) -> bool:
+        """
+        Take a provider off the schedule if it is due within a time window.
+        
+        Args:
+            name: Provider name
+            within: Seconds from now
+        
+        Returns:
+            True if the provider was due in time and is now unscheduled
+        """
+        with self._cond:
+            due = self._due.get(name)
+            if due is None or due - self._clock() > within:
+                return False
+            del self._due[name]
+            return True
+    
+    def seconds_until(self, name: str) -> Optional[float]:
+        """
+        Get the time left until a provider is due.
+        
+        Args:
+            name: Provider name
+        
+        Returns:
+            Seconds until due (0 if overdue), or None if not scheduled
+        """
+        with self._cond:
+            due = self._due.get(name)
+            return None if due is None else max(0.0, due - self._clock())
+    
+    def _discard_stale(self) -> None:
+        """Drop heap entries of removed or rescheduled providers."""
+        while self._heap:
+            due, _, name = self._heap[0]
+            if self._due.get(name) == due:
+                return
+            heapq.heappop(self._heap)
+    
+    def wait_due(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Block until providers are due and take them off the schedule.
+        
+        Due providers are unscheduled; the caller reschedules them once
+        they have been polled. Returns early with an empty list when
+        woken, closed or when the timeout passes.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+        
+        Returns:
+            Names of due providers, earliest first
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        
+        with self._cond:
+            while True:
+                if self.closed:
+                    return []
+                
+                self._discard_stale()
+                now = self._clock()
+                due: List[str] = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, name = heapq.heappop(self._heap)
+                    del self._due[name]
+                    due.append(name)
+                    self._discard_stale()
+                if due:
+                    return due
+                
+                if self._woken:
+                    self._woken = False
+                    return []
+                
+                wait = None if not self._heap else self._heap[0][0] - now
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return []
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+    
+    def wake(self) -> None:
+        """Make a pending or the next wait_due() call return early."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+    
+    def close(self) -> None:
+        """Release all waiters for good."""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
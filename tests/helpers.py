@@ -0,0 +1,119 @@
+"""
+Shared fakes for the test suite.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+from src.providers.base import BaseProvider, Pipeline, PipelineRun, PipelineStatus, ProviderConfig
+from src.providers.github import GitHubProvider
+
+
+def make_response(status_code=200, data=None, next_url=None):
+    """Build a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data or {}
+    response.headers = {}
+    response.links = {'next': {'url': next_url}} if next_url else {}
+    return response
+
+
+def make_run(run_id, workflow_id, status='completed', conclusion='success'):
+    """Build a fake workflow run payload."""
+    return {
+        'id': run_id,
+        'workflow_id': workflow_id,
+        'status': status,
+        'conclusion': conclusion,
+        'head_branch': 'main',
+        'head_sha': f'sha{run_id}',
+        'head_commit': {'message': 'msg', 'author': {'name': 'dev'}},
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:05:00Z'
+    }
+
+
+class FakeSession:
+    """Minimal session routing URLs to canned responses."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.headers = {}
+        self.calls = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, params))
+        for suffix, response in self.routes.items():
+            if url.endswith(suffix):
+                return response
+        return make_response(404)
+
+
+def make_provider(name='gh', repo='repo', **extra):
+    """Create a GitHub provider for tests."""
+    config = ProviderConfig(
+        name=name,
+        provider_type='github',
+        config={'token': 't', 'owner': 'org', 'repo': repo, **extra}
+    )
+    return GitHubProvider(config)
+
+
+class SlowProvider(BaseProvider):
+    """Provider answering after a delay, or failing."""
+    
+    def __init__(self, name, delay=0.0, error=None, release=None):
+        super().__init__(ProviderConfig(name=name, provider_type='test', config={}))
+        self.delay = delay
+        self.error = error
+        self.release = release
+        self.calls = 0
+    
+    def validate_credentials(self):
+        return True
+    
+    def fetch_pipelines(self):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [Pipeline(
+            id=f'{self.name}-1',
+            name='CI',
+            status=PipelineStatus.SUCCESS,
+            repository=self.name,
+            branch='main',
+            commit='sha',
+            provider=self.name
+        )]
+    
+    def fetch_pipeline_runs(self, pipeline_id, limit=10):
+        return []
+    
+    def trigger_pipeline(self, pipeline_id, parameters=None):
+        return PipelineRun(id='1', pipeline_id=pipeline_id, status=PipelineStatus.PENDING)
+    
+    def re_run_pipeline(self, run_id):
+        return PipelineRun(id=run_id, pipeline_id='1', status=PipelineStatus.PENDING)
+    
+    def cancel_pipeline(self, run_id):
+        return True
+    
+    def get_pipeline_status(self, pipeline_id):
+        return PipelineStatus.SUCCESS
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
@@ -0,0 +1,124 @@
+"""
+Tests for the per-provider circuit breaker.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.providers.circuit_breaker import CircuitBreaker, CircuitState
+from src.providers.registry import ProviderRegistry
+from src.utils.errors import CircuitOpenError
+from tests.helpers import FakeClock, FakeSession, SlowProvider, make_provider, make_response
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Test cases for CircuitBreaker state transitions.
+    """
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(min_calls=4, slow_call_seconds=5, open_seconds=30, clock=self.clock)
+    
+    def test_error_rate_and_latency_open_the_circuit(self):
+        """Test that failures and slow calls trip the breaker."""
+        self.breaker.record_success(0.1)
+        self.breaker.record_success(0.1)
+        self.breaker.record_failure('boom')
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+        
+        self.breaker.record_success(9.0)  # slow
+        
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.snapshot()['retry_in'], 30)
+    
+    def test_half_open_probe(self):
+        """Test that one probe is let through and its outcome decides the state."""
+        for _ in range(4):
+            self.breaker.record_failure('down')
+        self.clock.now = 31
+        
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.breaker.record_failure('still down')
+        self.assertEqual(self.breaker.snapshot()['retry_in'], 60)
+        
+        self.clock.now = 92
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success(0.2)
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+
+class TestRegistryCircuit(unittest.TestCase):
+    """
+    Test cases for circuit breaking in ProviderRegistry.
+    """
+    
+    def test_open_provider_served_stale_from_cache(self):
+        """Test that an open provider is skipped and its last data marked stale."""
+        registry = ProviderRegistry(deadline=5)
+        provider = SlowProvider('ghe')
+        registry.register(provider)
+        registry.fetch_all_pipelines_detailed()
+        
+        provider.error = RuntimeError('unreachable')
+        for _ in range(5):
+            registry.fetch_all_pipelines_detailed()
+        calls = provider.calls
+        
+        result = registry.fetch_all_pipelines_detailed()
+        
+        self.assertEqual(provider.calls, calls)
+        self.assertEqual(result.circuit_open, ['ghe'])
+        self.assertEqual(len(result.pipelines), 1)
+        self.assertEqual(registry.breaker('ghe').snapshot()['state'], 'open')
+    
+    def test_github_error_replies_open_circuit(self):
+        """Test that a GitHub provider answering 503 trips its breaker."""
+        registry = ProviderRegistry(deadline=5)
+        provider = make_provider('gh')
+        provider.session = FakeSession({'/actions/workflows': make_response(503)})
+        registry.register(provider)
+        
+        for _ in range(5):
+            registry.fetch_all_pipelines_detailed()
+        result = registry.fetch_all_pipelines_detailed()
+        
+        self.assertEqual(registry.breaker('gh').snapshot()['state'], 'open')
+        self.assertEqual(result.circuit_open, ['gh'])
+    
+    def test_graphql_batch_members_pass_their_breakers(self):
+        """Test that batch members are admitted and recorded one by one, and open ones skipped."""
+        registry = ProviderRegistry(deadline=5)
+        providers = [make_provider(name='a', repo='a'), make_provider(name='b', repo='b')]
+        for provider in providers:
+            registry.register(provider)
+        providers[0].fetch_pipelines = MagicMock(side_effect=RuntimeError('down'))
+        providers[1].fetch_pipelines = MagicMock(return_value=[])
+        
+        outcome = registry._fetch_batch(providers)
+        
+        self.assertIsInstance(outcome['a'], RuntimeError)
+        self.assertEqual(outcome['b'], [])
+        self.assertEqual(registry.breaker('a').snapshot()['failure_rate'], 1.0)
+        
+        registry._graphql.fetch(providers[:1], load=lambda provider: [])
+        for _ in range(5):
+            registry.breaker('b').record_failure('down')
+        session = MagicMock()
+        session.post.return_value = make_response(data={'data': {'r0': None}})
+        providers[0].session = session
+        providers[0].fetch_pipelines = MagicMock(return_value=[])
+        providers[1].fetch_pipelines.reset_mock()
+        
+        outcome = registry._fetch_batch(providers)
+        
+        self.assertEqual(outcome['a'], [])
+        self.assertIsInstance(outcome['b'], CircuitOpenError)
+        providers[1].fetch_pipelines.assert_not_called()
+        self.assertEqual(registry.breaker('a').snapshot()['calls'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,543 @@
+"""
+Tests for the GitHub Actions provider.
+"""
+
+import unittest
+from itertools import islice
+from unittest.mock import MagicMock
+
+import httpx
+
+from src.providers.base import Pipeline, ProviderConfig, PipelineStatus
+from src.providers.github_graphql import GraphQLBatchFetcher, graphql_url
+from src.providers.github_org import GitHubOrgProvider
+from src.providers import github_async
+from src.providers.async_base import AsyncProviderAdapter
+from src.providers.rate_limit import RequestPriority, current_priority, request_priority
+from src.providers.registry import ProviderRegistry
+from src.providers.workflow_metadata import WorkflowMetadata, WorkflowMetadataCache
+from src.utils.errors import ProviderError
+from tests.helpers import FakeClock, FakeSession, make_provider, make_response, make_run
+
+
+class TestGitHubProviderBatching(unittest.TestCase):
+    """
+    Test cases for batched latest-run lookups.
+    """
+
+    def setUp(self):
+        workflows = [
+            {'id': wid, 'name': f'wf{wid}', 'html_url': f'https://x/{wid}'}
+            for wid in (1, 2, 3)
+        ]
+        self.routes = {
+            '/actions/workflows': make_response(data={'workflows': workflows}),
+            '/actions/runs': make_response(data={'workflow_runs': [
+                make_run(12, 1, status='in_progress', conclusion=None),
+                make_run(11, 1),
+                make_run(20, 2, conclusion='failure'),
+            ]}),
+            '/workflows/3/runs': make_response(data={'workflow_runs': []}),
+        }
+
+    def test_batched_fetch_uses_repo_runs(self):
+        """
+        Latest runs come from the repository listing, with fallback only for misses.
+        """
+        provider = make_provider()
+        provider.session = FakeSession(self.routes)
+
+        pipelines = {p.id: p for p in provider.fetch_pipelines()}
+
+        self.assertEqual(pipelines['1'].status, PipelineStatus.RUNNING)
+        self.assertEqual(pipelines['1'].commit, 'sha12')
+        self.assertEqual(pipelines['2'].status, PipelineStatus.FAILURE)
+        self.assertEqual(pipelines['3'].status, PipelineStatus.PENDING)
+        urls = [url for url, _ in provider.session.calls]
+        self.assertFalse(any(url.endswith('/workflows/1/runs') for url in urls))
+        self.assertTrue(any(url.endswith('/workflows/3/runs') for url in urls))
+        self.assertEqual(provider.last_refresh_requests, 3)
+
+    def test_unbatched_fetch_looks_up_each_workflow(self):
+        """
+        Disabling batching falls back to one lookup per workflow.
+        """
+        provider = make_provider(batch_runs=False)
+        provider.session = FakeSession(self.routes)
+
+        provider.fetch_pipelines()
+
+        self.assertEqual(provider.last_refresh_requests, 4)
+
+
+class TestGitHubProviderPagination(unittest.TestCase):
+    """
+    Test cases for paginated iterators.
+    """
+    
+    def setUp(self):
+        self.routes = {
+            '/workflows/7/runs': make_response(
+                data={'workflow_runs': [make_run(2, 7), make_run(1, 7)]},
+                next_url='https://api.github.com/page2'
+            ),
+            '/page2': make_response(data={'workflow_runs': [make_run(0, 7)]}),
+        }
+    
+    def test_iter_runs_follows_next_links(self):
+        """
+        Iteration follows Link: rel="next" until the listing ends.
+        """
+        provider = make_provider()
+        provider.session = FakeSession(self.routes)
+        
+        runs = list(provider.iter_runs('7', since='2024-01-01T00:00:00Z'))
+        
+        self.assertEqual([run.id for run in runs], ['2', '1', '0'])
+        first_url, first_params = provider.session.calls[0]
+        self.assertEqual(first_params['created'], '>=2024-01-01T00:00:00Z')
+    
+    def test_early_stop_fetches_no_extra_pages(self):
+        """
+        Stopping after the first page never requests the next one.
+        """
+        provider = make_provider()
+        provider.session = FakeSession(self.routes)
+        
+        runs = provider.fetch_pipeline_runs('7', limit=2)
+        
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(len(provider.session.calls), 1)
+        self.assertEqual(len(list(islice(provider.iter_runs('7'), 1))), 1)
+        self.assertEqual(len(provider.session.calls), 2)
+
+
+class TestGitHubProviderErrors(unittest.TestCase):
+    """
+    Test cases for GitHub error replies.
+    """
+    
+    def test_error_reply_keeps_last_listing(self):
+        """
+        An error reply is raised, reported by the registry and leaves the cached listing alone.
+        """
+        provider = make_provider()
+        provider.session = FakeSession({
+            '/actions/workflows': make_response(data={'workflows': [{'id': 1, 'name': 'ci'}]}),
+            '/actions/runs': make_response(data={'workflow_runs': [make_run(5, 1)]}),
+        })
+        registry = ProviderRegistry(deadline=5)
+        registry.register(provider)
+        registry.fetch_all_pipelines_detailed()
+        
+        provider.session.routes['/actions/workflows'] = make_response(503)
+        with self.assertRaises(ProviderError):
+            provider.fetch_pipelines()
+        result = registry.fetch_all_pipelines_detailed()
+        
+        self.assertIn('503', result.errors['gh'])
+        cached, _ = registry.read_cache.peek(registry._pipelines_key(provider), float('inf'))
+        self.assertEqual([p.id for p in cached], ['1'])
+
+
+class TestGraphQLBatchFetcher(unittest.TestCase):
+    """
+    Test cases for the GraphQL batch backend.
+    """
+    
+    def make_repository(self, name, workflow_id, status, conclusion):
+        suite = {
+            'status': status,
+            'conclusion': conclusion,
+            'branch': {'name': 'main'},
+            'workflowRun': {
+                'databaseId': 1,
+                'createdAt': '2024-01-01T00:00:00Z',
+                'updatedAt': '2024-01-01T00:05:00Z',
+                'workflow': {'databaseId': workflow_id, 'name': 'ci', 'url': 'https://x'}
+            }
+        }
+        commit = {'oid': 'abc', 'message': 'msg', 'author': {'name': 'dev'}, 'checkSuites': {'nodes': [suite]}}
+        return {
+            'nameWithOwner': f'org/{name}',
+            'defaultBranchRef': {'target': {'history': {'nodes': [commit]}}}
+        }
+    
+    def test_graphql_url(self):
+        """
+        GraphQL endpoints are derived for github.com and Enterprise.
+        """
+        self.assertEqual(graphql_url('https://api.github.com'), 'https://api.github.com/graphql')
+        self.assertEqual(graphql_url('https://ghe.local/api/v3'), 'https://ghe.local/api/graphql')
+    
+    def test_batch_merges_onto_snapshot(self):
+        """
+        One query serves every repository and merges onto the REST snapshot.
+        """
+        providers = [make_provider(name='a', repo='a'), make_provider(name='b', repo='b')]
+        fetcher = GraphQLBatchFetcher()
+        for provider in providers:
+            provider.fetch_pipelines = MagicMock(return_value=[])
+        fetcher.fetch(providers)
+        
+        response = make_response(data={'data': {
+            'r0': self.make_repository('a', 10, 'COMPLETED', 'FAILURE'),
+            'r1': self.make_repository('b', 20, 'IN_PROGRESS', None),
+            'rateLimit': {'cost': 2, 'remaining': 4990}
+        }})
+        session = MagicMock()
+        session.post.return_value = response
+        for provider in providers:
+            provider.session = session
+        
+        results = fetcher.fetch(providers)
+        
+        self.assertEqual(session.post.call_count, 1)
+        self.assertEqual(results['a'][0].status, PipelineStatus.FAILURE)
+        self.assertEqual(results['b'][0].status, PipelineStatus.RUNNING)
+        self.assertEqual(results['b'][0].repository, 'org/b')
+    
+    def test_snapshot_reseeded_periodically(self):
+        """
+        The REST snapshot is reloaded after the reseed interval, dropping deleted workflows.
+        """
+        def listing(*ids):
+            return [
+                Pipeline(id=str(wid), name='ci', status=PipelineStatus.SUCCESS, repository='org/a', branch='main', commit='abc')
+                for wid in ids
+            ]
+        
+        clock = FakeClock()
+        providers = [make_provider(name='a', repo='a'), make_provider(name='b', repo='b')]
+        fetcher = GraphQLBatchFetcher(reseed_interval=60, clock=clock)
+        providers[0].fetch_pipelines = MagicMock(side_effect=[listing(10, 11), listing(10)])
+        providers[1].fetch_pipelines = MagicMock(side_effect=[[], []])
+        fetcher.fetch(providers)
+        
+        session = MagicMock()
+        session.post.return_value = make_response(data={'data': {
+            'r0': self.make_repository('a', 10, 'COMPLETED', 'SUCCESS'),
+            'r1': self.make_repository('b', 20, 'COMPLETED', 'SUCCESS')
+        }})
+        for provider in providers:
+            provider.session = session
+        
+        clock.now = 30
+        self.assertEqual({p.id for p in fetcher.fetch(providers)['a']}, {'10', '11'})
+        self.assertEqual(session.post.call_count, 1)
+        
+        clock.now = 61
+        self.assertEqual({p.id for p in fetcher.fetch(providers)['a']}, {'10'})
+        self.assertEqual(session.post.call_count, 1)
+        self.assertEqual(providers[0].fetch_pipelines.call_count, 2)
+    
+    def test_newer_run_on_other_branch_kept(self):
+        """
+        A default-branch run only replaces a snapshot entry created before it.
+        """
+        feature = Pipeline(
+            id='10', name='ci', status=PipelineStatus.RUNNING, repository='org/a', branch='feature',
+            commit='def', started_at='2024-01-02T00:00:00Z', run_id='2'
+        )
+        providers = [make_provider(name='a', repo='a'), make_provider(name='b', repo='b')]
+        providers[0].fetch_pipelines = MagicMock(return_value=[feature])
+        providers[1].fetch_pipelines = MagicMock(return_value=[])
+        fetcher = GraphQLBatchFetcher()
+        fetcher.fetch(providers)
+        
+        session = MagicMock()
+        session.post.return_value = make_response(data={'data': {
+            'r0': self.make_repository('a', 10, 'COMPLETED', 'SUCCESS'),
+            'r1': self.make_repository('b', 20, 'COMPLETED', 'SUCCESS')
+        }})
+        for provider in providers:
+            provider.session = session
+        
+        self.assertEqual(fetcher.fetch(providers)['a'], [feature])
+        self.assertEqual(fetcher.fetch(providers)['b'][0].run_id, '1')
+
+
+class TestGitHubOrgProvider(unittest.TestCase):
+    """
+    Test cases for the organization-wide provider.
+    """
+    
+    def setUp(self):
+        repos = [
+            {'name': 'api', 'archived': False, 'pushed_at': '2999-01-01T00:00:00Z'},
+            {'name': 'legacy', 'archived': False, 'pushed_at': '2000-01-01T00:00:00Z'},
+            {'name': 'web-old', 'archived': True, 'pushed_at': '2999-01-01T00:00:00Z'},
+            {'name': 'tmp-scratch', 'archived': False, 'pushed_at': '2999-01-01T00:00:00Z'},
+        ]
+        self.session = FakeSession({
+            '/orgs/acme/repos': make_response(data=repos),
+            '/repos/acme/api/actions/workflows': make_response(data={'workflows': [{'id': 1, 'name': 'ci'}]}),
+            '/repos/acme/legacy/actions/workflows': make_response(data={'workflows': [{'id': 2, 'name': 'ci'}]}),
+            '/actions/runs': make_response(data={'workflow_runs': []}),
+        })
+        self.options = {'token': 't', 'org': 'acme', 'exclude': ['tmp-*'], 'max_concurrency': 2}
+        config = ProviderConfig(name='acme', provider_type='github_org', config=self.options)
+        self.provider = GitHubOrgProvider(config)
+        self.provider.session = self.session
+    
+    def fetched_repos(self):
+        return {url.split('/')[5] for url, _ in self.session.calls if '/repos/acme/' in url}
+    
+    def test_discovery_filters_repositories(self):
+        """
+        Archived and excluded repositories are not watched.
+        """
+        self.assertEqual(sorted(self.provider.discover_repositories()), ['api', 'legacy'])
+    
+    def test_idle_repositories_are_rechecked_occasionally(self):
+        """
+        Idle repositories are served from the previous refresh until due.
+        """
+        pipelines = self.provider.fetch_pipelines()
+        self.assertEqual({p.repository for p in pipelines}, {'acme/api', 'acme/legacy'})
+        self.assertEqual(self.fetched_repos(), {'api', 'legacy'})
+        
+        self.session.calls.clear()
+        pipelines = self.provider.fetch_pipelines()
+        self.assertEqual(len(pipelines), 2)
+        self.assertEqual(self.fetched_repos(), {'api'})
+    
+    def test_repository_fetches_keep_caller_priority(self):
+        """
+        Repositories are refreshed with the priority of the caller.
+        """
+        seen = []
+        refresh = self.provider._refresh_repository
+        
+        def recording_refresh(name):
+            seen.append(current_priority())
+            return refresh(name)
+        
+        self.provider._refresh_repository = recording_refresh
+        with request_priority(RequestPriority.BACKGROUND):
+            self.provider.fetch_pipelines()
+        
+        self.assertEqual(seen, [RequestPriority.BACKGROUND] * 2)
+    
+    def test_runs_resolved_from_listings_without_requests(self):
+        """
+        Runs seen in a listing resolve to their repository; unknown runs fail fast.
+        """
+        self.session.routes = {
+            '/repos/acme/legacy/actions/runs': make_response(data={'workflow_runs': [make_run(42, 2)]}),
+            **self.session.routes
+        }
+        self.provider.fetch_pipelines()
+        self.session.calls.clear()
+        
+        self.assertEqual(self.provider._repo_for_run('42'), 'legacy')
+        with self.assertRaises(ValueError):
+            self.provider._repo_for_run('43')
+        self.assertEqual(self.session.calls, [])
+        self.assertNotIn('owner', self.options)
+    
+    def test_failure_reported_when_every_repository_fails(self):
+        """
+        A refresh in which every due repository fails raises, so the breaker can trip.
+        """
+        for name in ('api', 'legacy'):
+            self.session.routes[f'/repos/acme/{name}/actions/workflows'] = make_response(503)
+        
+        with self.assertRaises(ProviderError):
+            self.provider.fetch_pipelines()
+        
+        self.session.routes['/repos/acme/api/actions/workflows'] = make_response(data={'workflows': [{'id': 1, 'name': 'ci'}]})
+        self.assertEqual([p.repository for p in self.provider.fetch_pipelines()], ['acme/api'])
+
+
+class TestAsyncGitHubProvider(unittest.TestCase):
+    """
+    Test cases for the async GitHub provider and its sync adapter.
+    """
+    
+    base_url = 'https://async.example'
+    
+    def setUp(self):
+        def handler(request):
+            path = request.url.path
+            if '/repos/org/down/' in path:
+                return httpx.Response(503)
+            if path.endswith('/actions/workflows'):
+                return httpx.Response(200, json={'workflows': [{'id': 1, 'name': 'ci'}]})
+            if path.endswith('/actions/runs'):
+                return httpx.Response(200, json={'workflow_runs': [make_run(5, 1, conclusion='failure')]})
+            if path.endswith('/actions/workflows/2'):
+                return httpx.Response(200, json={'id': 2, 'name': 'deploy'})
+            return httpx.Response(404)
+        
+        github_async._clients[self.base_url] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    def tearDown(self):
+        github_async._clients.pop(self.base_url, None)
+    
+    def make_adapter(self, name):
+        config = ProviderConfig(
+            name=name,
+            provider_type='github_async',
+            config={'token': 't', 'owner': 'org', 'repo': name, 'base_url': self.base_url}
+        )
+        return AsyncProviderAdapter(github_async.AsyncGitHubProvider(config))
+    
+    def test_sync_adapter(self):
+        """
+        The adapter exposes async providers through the sync interface.
+        """
+        pipelines = self.make_adapter('a').fetch_pipelines()
+        
+        self.assertEqual(len(pipelines), 1)
+        self.assertEqual(pipelines[0].status, PipelineStatus.FAILURE)
+    
+    def test_registry_gathers_async_providers(self):
+        """
+        The registry gathers every async provider on the shared event loop.
+        """
+        registry = ProviderRegistry()
+        for name in ('a', 'b', 'c'):
+            registry.register(self.make_adapter(name))
+        
+        pipelines = registry.fetch_all_pipelines()
+        
+        self.assertEqual(sorted(p.repository for p in pipelines), ['org/a', 'org/b', 'org/c'])
+    
+    def test_error_replies_are_reported(self):
+        """
+        A failing async provider is reported as an error instead of an empty listing.
+        """
+        registry = ProviderRegistry()
+        for name in ('a', 'down'):
+            registry.register(self.make_adapter(name))
+        
+        result = registry.fetch_all_pipelines_detailed()
+        
+        self.assertEqual([p.repository for p in result.pipelines], ['org/a'])
+        self.assertIn('503', result.errors['down'])
+    
+    def test_status_and_triggers_match_sync_provider(self):
+        """
+        Never-run workflows are pending, and triggers go through GitHubProvider.
+        """
+        adapter = self.make_adapter('a')
+        sync = adapter.async_provider._sync_provider()
+        sync._actor_login = 'octocat'
+        sync.validate_inputs = False
+        sync.session = FakeSession({})
+        sync.session.post = MagicMock(return_value=make_response(204))
+        
+        self.assertEqual(adapter.get_pipeline_status('2'), PipelineStatus.PENDING)
+        self.assertEqual(adapter.get_pipeline_status('3'), PipelineStatus.ERROR)
+        run = adapter.trigger_pipeline('2', {'ref': 'main'})
+        
+        self.assertIsNotNone(run.tracking_id)
+        self.assertTrue(sync.session.post.call_args.args[0].endswith('/actions/workflows/2/dispatches'))
+
+
+class TestWorkflowMetadataCache(unittest.TestCase):
+    """
+    Test cases for the workflow metadata cache.
+    """
+    
+    def test_listing_fills_cache(self):
+        """
+        Parameter lookups and triggers after a listing need no workflow lookup.
+        """
+        provider = make_provider()
+        provider._actor_login = 'octocat'
+        provider.session = FakeSession({
+            '/actions/workflows': make_response(data={'workflows': [
+                {'id': 1, 'name': 'ci', 'path': '.github/workflows/ci.yml', 'state': 'active'}
+            ]}),
+            '/actions/runs': make_response(data={'workflow_runs': [make_run(5, 1)]}),
+        })
+        provider.session.post = MagicMock(return_value=make_response(204))
+        provider._forget_run = MagicMock()
+        
+        provider.fetch_pipelines()
+        provider.session.calls.clear()
+        
+        self.assertEqual(provider.get_workflow('1').path, '.github/workflows/ci.yml')
+        provider.get_available_parameters('1')
+        provider.trigger_pipeline('1', {'ref': 'main'})
+        dispatch_url = provider.session.post.call_args.args[0]
+        
+        self.assertFalse(any(url.endswith('/actions/workflows/1') for url, _ in provider.session.calls))
+        self.assertTrue(dispatch_url.endswith('/actions/workflows/1/dispatches'))
+        provider.session.post.return_value = make_response(201)
+        self.assertEqual(provider.re_run_pipeline('5').pipeline_id, '1')
+    
+    def test_ttl_and_invalidation(self):
+        """
+        Entries expire after the TTL and can be dropped explicitly.
+        """
+        now = [0.0]
+        cache = WorkflowMetadataCache(ttl=10, clock=lambda: now[0])
+        cache.put(WorkflowMetadata(id='1', name='ci', path='ci.yml'))
+        cache.put(WorkflowMetadata(id='2', name='cd', path='cd.yml'))
+        
+        cache.invalidate('2')
+        self.assertIsNotNone(cache.get('1'))
+        self.assertIsNone(cache.get('2'))
+        
+        now[0] = 11
+        self.assertIsNone(cache.get('1'))
+    
+    def test_inputs_survive_refresh_of_same_file(self):
+        """
+        Known inputs are kept when a listing refreshes an unchanged workflow.
+        """
+        cache = WorkflowMetadataCache()
+        cache.put(WorkflowMetadata(id='1', name='ci', path='ci.yml'))
+        cache.set_inputs('1', {'env': {'type': 'string'}})
+        
+        cache.put(WorkflowMetadata(id='1', name='ci', path='ci.yml'))
+        self.assertEqual(cache.get('1').inputs, {'env': {'type': 'string'}})
+        
+        cache.put(WorkflowMetadata(id='1', name='ci', path='other.yml'))
+        self.assertIsNone(cache.get('1').inputs)
+
+
+class TestPipelineStatusIndex(unittest.TestCase):
+    """
+    Test cases for indexed pipeline status lookups.
+    """
+    
+    def setUp(self):
+        self.pipeline = Pipeline(
+            id='1', name='ci', status=PipelineStatus.SUCCESS,
+            repository='org/repo', branch='main', commit='sha1'
+        )
+    
+    def test_fresh_index_costs_no_request(self):
+        """
+        A status recorded by the poller is served without any request.
+        """
+        provider = make_provider()
+        provider.session = FakeSession({})
+        provider.record_pipelines([self.pipeline])
+        
+        self.assertEqual(provider.get_pipeline_status('1'), PipelineStatus.SUCCESS)
+        self.assertEqual(provider.session.calls, [])
+    
+    def test_stale_index_fetches_single_workflow(self):
+        """
+        Past the freshness bound only the workflow's latest run is fetched.
+        """
+        provider = make_provider(status_max_age=-1)
+        provider.session = FakeSession({
+            '/workflows/1/runs': make_response(data={'workflow_runs': [
+                make_run(9, 1, status='in_progress', conclusion=None)
+            ]}),
+        })
+        provider.record_pipelines([self.pipeline])
+        
+        self.assertEqual(provider.get_pipeline_status('1'), PipelineStatus.RUNNING)
+        self.assertEqual([url.rsplit('/', 3)[-3:] for url, _ in provider.session.calls], [['workflows', '1', 'runs']])
+        self.assertEqual(provider.pipeline_index.get('1').commit, 'sha9')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the conditional-request response cache.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.providers.http_cache import ResponseCache
+
+
+def make_response(status_code, data=None, etag=None):
+    """Build a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    response.headers = {'ETag': etag} if etag else {}
+    response.links = {}
+    response.content = b'x' * 10
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test cases for ResponseCache.
+    """
+    
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.headers = {'Authorization': 'token a'}
+    
+    def test_not_modified_returns_cached_body(self):
+        """
+        A 304 reply is answered with the cached parsed body.
+        """
+        cache = ResponseCache()
+        self.session.get.return_value = make_response(200, {'n': 1}, etag='"v1"')
+        cache.get(self.session, 'https://x/a')
+        
+        self.session.get.return_value = make_response(304)
+        response = cache.get(self.session, 'https://x/a')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'n': 1})
+        self.assertTrue(response.from_cache)
+        headers = self.session.get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+    
+    def test_lru_eviction(self):
+        """
+        The least recently used entry is evicted past max_entries.
+        """
+        cache = ResponseCache(max_entries=2)
+        for url in ('https://x/a', 'https://x/b', 'https://x/c'):
+            self.session.get.return_value = make_response(200, {}, etag='"e"')
+            cache.get(self.session, url)
+        
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.session.get.return_value = make_response(200, {}, etag='"e"')
+        cache.get(self.session, 'https://x/a')
+        self.assertNotIn('If-None-Match', self.session.get.call_args.kwargs['headers'])
+        self.assertEqual(cache.stats()['hits'], 0)
+    
+    def test_entries_are_scoped_by_token(self):
+        """
+        Entries stored for one token are not reused for another.
+        """
+        cache = ResponseCache()
+        self.session.get.return_value = make_response(200, {}, etag='"e"')
+        cache.get(self.session, 'https://x/a')
+        
+        self.session.headers = {'Authorization': 'token b'}
+        cache.get(self.session, 'https://x/a')
+        
+        self.assertEqual(cache.stats()['misses'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for run job fetching and the database-backed job cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.database.db import DatabaseManager
+from src.database.job_cache import RunJobCache
+from src.providers.base import PipelineRun, PipelineStatus
+from tests.helpers import FakeSession, make_provider, make_response, make_run
+
+
+def make_job(job_id, status='completed', conclusion='success'):
+    """Build a fake workflow job payload."""
+    return {
+        'id': job_id,
+        'name': f'job{job_id}',
+        'status': status,
+        'conclusion': conclusion,
+        'started_at': '2024-01-01T00:00:00Z',
+        'completed_at': '2024-01-01T00:01:30Z' if status == 'completed' else None,
+        'html_url': f'https://x/job/{job_id}',
+        'runner_name': 'runner-1',
+        'steps': [
+            {'number': 1, 'name': 'checkout', 'status': 'completed', 'conclusion': 'success',
+             'started_at': '2024-01-01T00:00:00Z', 'completed_at': '2024-01-01T00:00:05Z'},
+            {'number': 2, 'name': 'test', 'status': status, 'conclusion': conclusion,
+             'started_at': '2024-01-01T00:00:05Z', 'completed_at': None},
+        ]
+    }
+
+
+def make_pipeline_run(attempt=1, finished=True):
+    """Build the current state of run 5 for tests."""
+    return PipelineRun(
+        id='5',
+        pipeline_id='1',
+        status=PipelineStatus.SUCCESS if finished else PipelineStatus.RUNNING,
+        finished_at='2024-01-01T00:05:00Z' if finished else None,
+        attempt=attempt
+    )
+
+
+class TestRunJobCache(unittest.TestCase):
+    """
+    Test cases for fetch_run_jobs and RunJobCache.
+    """
+    
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseManager(self.db_path)
+        self.db.init_db()
+        self.cache = RunJobCache(self.db)
+        
+        self.provider = make_provider()
+        self.provider.session = FakeSession({
+            '/runs/5/jobs': make_response(data={'jobs': [make_job(1), make_job(2, 'in_progress', None)]}),
+        })
+    
+    def tearDown(self):
+        self.db.close()
+        os.remove(self.db_path)
+    
+    def test_github_jobs_have_steps_and_timings(self):
+        """Test mapping of GitHub jobs and steps."""
+        jobs = self.provider.fetch_run_jobs('5')
+        
+        self.assertEqual([job.id for job in jobs], ['1', '2'])
+        self.assertTrue(jobs[0].completed)
+        self.assertEqual(jobs[0].duration, 90.0)
+        self.assertEqual(jobs[0].steps[0].duration, 5.0)
+        self.assertEqual(jobs[1].status, PipelineStatus.RUNNING)
+        self.assertIsNone(jobs[1].steps[1].finished_at)
+    
+    def job_provider(self, *listings):
+        """Mock provider returning the given job listings in turn."""
+        provider = MagicMock()
+        provider.name = 'gh'
+        provider.fetch_run_jobs.side_effect = [
+            [self.provider._build_job(make_job(job_id, *state), '5') for job_id, *state in listing]
+            for listing in listings
+        ]
+        return provider
+    
+    def test_in_progress_run_is_refreshed(self):
+        """Test that jobs of unfinished runs are fetched again."""
+        self.provider.session.routes['/actions/runs/5'] = make_response(data=make_run(5, 1, status='in_progress'))
+        self.cache.get_jobs(self.provider, '5')
+        self.cache.get_jobs(self.provider, '5')
+        
+        jobs_calls = [url for url, _ in self.provider.session.calls if url.endswith('/jobs')]
+        self.assertEqual(len(jobs_calls), 2)
+    
+    def test_finished_run_is_served_from_database(self):
+        """Test that jobs of a finished run attempt are fetched only once."""
+        provider = self.job_provider([(1,)])
+        provider.fetch_run.return_value = make_pipeline_run(attempt=1)
+        
+        first = self.cache.get_jobs(provider, '5')
+        second = self.cache.get_jobs(provider, '5')
+        
+        self.assertEqual(provider.fetch_run_jobs.call_count, 1)
+        self.assertEqual(second[0].name, first[0].name)
+        self.assertEqual(second[0].started_at, '2024-01-01T00:00:00Z')
+        self.assertEqual([step.name for step in second[0].steps], ['checkout', 'test'])
+        
+        other = self.job_provider([(9,)])
+        other.name = 'other'
+        other.fetch_run.return_value = make_pipeline_run(attempt=1)
+        self.assertEqual([job.id for job in self.cache.get_jobs(other, '5')], ['9'])
+    
+    def test_completed_jobs_of_running_run_are_not_final(self):
+        """Test that jobs listed later, such as matrix jobs, are fetched while the run is in progress."""
+        provider = self.job_provider([(1,)], [(1,), (3, 'in_progress', None)])
+        provider.fetch_run.return_value = make_pipeline_run(finished=False)
+        
+        self.cache.get_jobs(provider, '5')
+        jobs = self.cache.get_jobs(provider, '5')
+        
+        self.assertEqual([job.id for job in jobs], ['1', '3'])
+    
+    def test_new_attempt_replaces_cached_jobs(self):
+        """Test that a re-run's attempt is fetched even though the previous attempt was final."""
+        provider = self.job_provider([(1,)], [(4, 'in_progress', None)])
+        provider.fetch_run.return_value = make_pipeline_run(attempt=1)
+        self.cache.get_jobs(provider, '5')
+        
+        provider.fetch_run.return_value = make_pipeline_run(attempt=2, finished=False)
+        jobs = self.cache.get_jobs(provider, '5')
+        
+        self.assertEqual([job.id for job in jobs], ['4'])
+    
+    def test_rerun_invalidates_cached_jobs_and_logs(self):
+        """Test that re-running a run drops its cached jobs and log archive."""
+        self.cache.get_jobs(self.provider, '5', run=make_pipeline_run())
+        self.provider._post = MagicMock(return_value=make_response(201))
+        log_cache = MagicMock()
+        
+        with patch('src.providers.github.get_job_cache', return_value=self.cache), \
+                patch('src.providers.github.get_log_cache', return_value=log_cache):
+            self.provider.re_run_pipeline('5')
+        self.cache.get_jobs(self.provider, '5', run=make_pipeline_run())
+        
+        log_cache.invalidate.assert_called_once_with('gh', '5')
+        self.assertEqual(len([url for url, _ in self.provider.session.calls if url.endswith('/jobs')]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for streamed run logs and the on-disk log archive cache.
+"""
+
+import io
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock
+
+from src.providers.log_archive import LogArchiveCache, iter_logs
+from tests.helpers import make_provider
+
+
+def make_archive():
+    """Build a GitHub-style log archive with full job logs and step logs."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('0_build.txt', ''.join(f'build line {i}\n' for i in range(1000)))
+        archive.writestr('1_test.txt', 'test line 1\ntest line 2\n')
+        archive.writestr('build/1_Set up job.txt', 'setup\n')
+    return buffer.getvalue()
+
+
+def chunked(data, size=100):
+    """Split bytes into fixed-size chunks."""
+    return iter([data[i:i + size] for i in range(0, len(data), size)])
+
+
+class TestLogArchiveCache(unittest.TestCase):
+    """
+    Test cases for LogArchiveCache and log extraction.
+    """
+    
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = LogArchiveCache(self.directory, max_bytes=10 ** 6)
+        self.archive = make_archive()
+        self.provider = MagicMock()
+        self.provider.name = 'gh'
+        self.provider.stream_run_logs.side_effect = lambda run_id: chunked(self.archive)
+    
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    
+    def test_finished_run_archive_is_reused(self):
+        """Test that a kept archive is downloaded once and then served from disk."""
+        first, temporary = self.cache.fetch(self.provider, '7', keep=True)
+        second, _ = self.cache.fetch(self.provider, '7', keep=True)
+        
+        self.assertFalse(temporary)
+        self.assertEqual(first, second)
+        self.assertEqual(first.read_bytes(), self.archive)
+        self.assertEqual(self.provider.stream_run_logs.call_count, 1)
+    
+    def test_archives_kept_per_attempt(self):
+        """Test that a re-run's attempt is downloaded again and invalidation drops every attempt."""
+        first, _ = self.cache.fetch(self.provider, '7', keep=True, attempt=1)
+        second, _ = self.cache.fetch(self.provider, '7', keep=True, attempt=2)
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.provider.stream_run_logs.call_count, 2)
+        self.assertIsNone(self.cache.get('other', '7', 1))
+        
+        self.cache.invalidate('gh', '7')
+        self.assertIsNone(self.cache.get('gh', '7', 1))
+        self.assertIsNone(self.cache.get('gh', '7', 2))
+    
+    def test_tail_of_one_job(self):
+        """Test per-job extraction keeping only the last lines."""
+        path, temporary = self.cache.fetch(self.provider, '7', keep=False)
+        
+        text = b''.join(iter_logs(path, job='BUILD', tail=2, remove=temporary)).decode()
+        
+        self.assertEqual(text, '==> 0_build.txt <==\nbuild line 998\nbuild line 999\n\n')
+        self.assertFalse(path.exists())
+    
+    def test_eviction_keeps_cache_bounded(self):
+        """Test that least recently used archives are evicted."""
+        self.cache.max_bytes = len(self.archive) * 2
+        for run_id in ('1', '2', '3'):
+            self.cache.fetch(self.provider, run_id, keep=True)
+        
+        self.assertIsNone(self.cache.get('gh', '1'))
+        self.assertIsNotNone(self.cache.get('gh', '3'))
+    
+    def test_github_streams_without_buffering(self):
+        """Test that the GitHub provider streams the archive in chunks."""
+        response = MagicMock(status_code=200, headers={})
+        response.iter_content.return_value = chunked(self.archive)
+        provider = make_provider()
+        provider.session = MagicMock()
+        provider.session.get.return_value = response
+        
+        data = b''.join(provider.stream_run_logs('7'))
+        
+        self.assertEqual(data, self.archive)
+        self.assertTrue(provider.session.get.call_args.kwargs['stream'])
+        response.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for fingerprint-based pipeline change detection.
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.database.db import DatabaseManager
+from src.database.pipeline_changes import ChangeDetector, ChangeType
+from src.providers.base import Pipeline, PipelineStatus
+
+
+def make_pipeline(status=PipelineStatus.SUCCESS, run_id='100', commit='aaa', pipeline_id='1'):
+    """Build a pipeline for tests."""
+    return Pipeline(
+        id=pipeline_id,
+        name='CI',
+        status=status,
+        repository='org/repo',
+        branch='main',
+        commit=commit,
+        started_at='2024-01-01T00:00:00Z',
+        run_id=run_id
+    )
+
+
+class TestChangeDetector(unittest.TestCase):
+    """
+    Test cases for ChangeDetector.
+    """
+    
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseManager(self.db_path)
+        self.db.init_db()
+        self.detector = ChangeDetector(self.db)
+    
+    def tearDown(self):
+        self.db.close()
+        os.remove(self.db_path)
+    
+    def _types(self, diff):
+        return [(event.type, event.previous, event.current) for event in diff.events]
+    
+    def test_only_changed_pipelines_reported(self):
+        """Test that unchanged pipelines are skipped and changes are typed."""
+        first = self.detector.diff('gh', [make_pipeline(), make_pipeline(pipeline_id='2')])
+        same = self.detector.diff('gh', [make_pipeline(), make_pipeline(pipeline_id='2')])
+        changed = self.detector.diff('gh', [
+            make_pipeline(PipelineStatus.RUNNING, run_id='101', commit='bbb'),
+            make_pipeline(pipeline_id='2')
+        ])
+        
+        self.assertEqual(len(first.changed), 2)
+        self.assertEqual({event.type for event in first.events}, {ChangeType.ADDED})
+        self.assertEqual(same.changed, [])
+        self.assertEqual([p.id for p in changed.changed], ['1'])
+        self.assertEqual(self._types(changed), [
+            (ChangeType.STATUS_CHANGED, 'success', 'running'),
+            (ChangeType.NEW_RUN, '100', '101'),
+            (ChangeType.NEW_COMMIT, 'aaa', 'bbb')
+        ])
+    
+    def test_fingerprints_survive_restart(self):
+        """Test that stored fingerprints suppress rewrites in a new detector."""
+        diff = self.detector.diff('gh', [make_pipeline()])
+        with self.db.get_session() as session:
+            self.assertEqual(ChangeDetector.save(session, [diff]), 1)
+            session.commit()
+        
+        restarted = ChangeDetector(self.db)
+        events = []
+        restarted.add_listener(events.append)
+        
+        self.assertEqual(restarted.diff('gh', [make_pipeline()]).changed, [])
+        later = restarted.diff('gh', [make_pipeline(PipelineStatus.FAILURE)])
+        restarted.publish(later.events)
+        
+        self.assertEqual(self._types(later), [(ChangeType.STATUS_CHANGED, 'success', 'failure')])
+        self.assertEqual(events, later.events)
+    
+    def test_missing_pipelines_reported_removed(self):
+        """Test that a pipeline missing from a listing is removed and its fingerprint deleted."""
+        first = self.detector.diff('gh', [make_pipeline(), make_pipeline(pipeline_id='2')])
+        with self.db.get_session() as session:
+            ChangeDetector.save(session, [first])
+            session.commit()
+        
+        removed = self.detector.diff('gh', [make_pipeline()])
+        with self.db.get_session() as session:
+            ChangeDetector.save(session, [removed])
+            session.commit()
+        
+        self.assertEqual(removed.changed, [])
+        self.assertEqual(removed.removed, ['2'])
+        self.assertEqual(self._types(removed), [(ChangeType.REMOVED, 'success', None)])
+        self.assertEqual(removed.events[0].pipeline.id, '2')
+        self.assertEqual(self.detector.diff('gh', [make_pipeline()]).events, [])
+        self.assertEqual(ChangeDetector(self.db).diff('gh', [make_pipeline()]).events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
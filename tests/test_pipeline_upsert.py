@@ -0,0 +1,84 @@
+"""
+Tests for set-based pipeline cache writes.
+"""
+
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import event
+
+from src.database.db import DatabaseManager
+from src.database.models import PipelineModel
+from src.database.pipeline_upsert import upsert_pipelines
+from src.providers.base import Pipeline, PipelineStatus
+
+
+def make_pipeline(pipeline_id, status=PipelineStatus.SUCCESS, name='CI', started_at='2024-01-01T00:00:00Z'):
+    """Build a pipeline for tests."""
+    return Pipeline(
+        id=pipeline_id,
+        name=name,
+        status=status,
+        repository='org/repo',
+        branch='main',
+        commit='sha',
+        started_at=started_at
+    )
+
+
+class TestUpsertPipelines(unittest.TestCase):
+    """
+    Test cases for upsert_pipelines.
+    """
+    
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseManager(self.db_path)
+        self.db.init_db()
+        self.statements = []
+        event.listen(self.db.engine, 'before_cursor_execute', self._count)
+    
+    def tearDown(self):
+        self.db.close()
+        os.remove(self.db_path)
+    
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            self.statements.append(executemany)
+    
+    def test_insert_then_update_in_one_statement(self):
+        """Test that rows are inserted, then updated in place with one executemany."""
+        with self.db.get_session() as session:
+            upsert_pipelines(session, [make_pipeline('1'), make_pipeline('2')])
+            session.commit()
+        
+        with self.db.get_session() as session:
+            written = upsert_pipelines(session, [
+                make_pipeline('1', PipelineStatus.RUNNING, name='Renamed'),
+                make_pipeline('3')
+            ])
+            session.commit()
+        
+        with self.db.get_session() as session:
+            rows = {row.id: row for row in session.query(PipelineModel)}
+        
+        self.assertEqual(written, 2)
+        self.assertEqual(self.statements, [True, True])
+        self.assertEqual(sorted(rows), ['1', '2', '3'])
+        self.assertEqual(rows['1'].status, 'running')
+        self.assertEqual(rows['1'].name, 'CI')
+    
+    def test_unparseable_pipeline_skipped(self):
+        """Test that a pipeline with a bad timestamp doesn't block the others."""
+        with self.db.get_session() as session:
+            written = upsert_pipelines(session, [make_pipeline('1', started_at='yesterday'), make_pipeline('2')])
+            session.commit()
+            
+            self.assertEqual(written, 1)
+            self.assertEqual([row.id for row in session.query(PipelineModel)], ['2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for provider type plugins.
+"""
+
+import sys
+import types
+import unittest
+
+from src.providers.base import ProviderConfig
+from src.providers.github import GitHubProvider
+from src.providers.plugins import ProviderTypeRegistry, build_provider
+from src.utils.errors import ConfigurationError
+from tests.helpers import SlowProvider
+
+PLUGIN_MODULE = 'tests._flowforge_fake_plugin'
+
+
+def make_plugin_module():
+    """Create a plugin module that records when it is imported."""
+    module = types.ModuleType(PLUGIN_MODULE)
+    module.imported = True
+    module.create = lambda config: SlowProvider(config.name)
+    return module
+
+
+class TestProviderTypeRegistry(unittest.TestCase):
+    """
+    Test cases for ProviderTypeRegistry.
+    """
+    
+    def tearDown(self):
+        sys.modules.pop(PLUGIN_MODULE, None)
+    
+    def test_plugin_imported_on_first_use(self):
+        """Test that listing types does not import plugins but creating does."""
+        registry = ProviderTypeRegistry(group='flowforge.test', builtins={'fake': f'{PLUGIN_MODULE}:create'})
+        
+        self.assertIn('fake', registry.types())
+        self.assertNotIn(PLUGIN_MODULE, sys.modules)
+        
+        sys.modules[PLUGIN_MODULE] = make_plugin_module()
+        provider = registry.create(ProviderConfig(name='fake-1', provider_type='fake'))
+        
+        self.assertIsInstance(provider, SlowProvider)
+        self.assertEqual(provider.name, 'fake-1')
+    
+    def test_unknown_type_raises(self):
+        """Test that unknown or broken provider types raise ConfigurationError."""
+        registry = ProviderTypeRegistry(group='flowforge.test', builtins={'broken': 'tests._missing_plugin:create'})
+        
+        with self.assertRaises(ConfigurationError):
+            registry.create(ProviderConfig(name='x', provider_type='gitlab'))
+        with self.assertRaises(ConfigurationError):
+            registry.create(ProviderConfig(name='x', provider_type='broken'))
+    
+    def test_builtin_github_provider(self):
+        """Test that the built-in GitHub type creates a GitHubProvider."""
+        registry = ProviderTypeRegistry(group='flowforge.test')
+        config = ProviderConfig(name='gh', provider_type='github', config={'token': 't', 'owner': 'org', 'repo': 'repo'})
+        
+        self.assertIsInstance(registry.create(config), GitHubProvider)
+        self.assertEqual(registry.types(), ['github', 'github_async', 'github_org'])
+    
+    def test_build_provider_from_settings(self):
+        """Test that request settings are turned into a provider config."""
+        provider = build_provider('gh', 'github', {'owner': 'org', 'repo': 'repo', 'refresh_interval': 60,
+                                                   'max_concurrency': 2, 'unknown': 'x'}, token='t')
+        
+        self.assertIsInstance(provider, GitHubProvider)
+        self.assertEqual(provider.config.refresh_interval, 60)
+        self.assertEqual(provider.config.config['max_concurrency'], 2)
+        self.assertEqual(provider.config.config['token'], 't')
+        self.assertNotIn('unknown', provider.config.config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Tests for per-provider poll scheduling.
+"""
+
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from src.database.db import DatabaseManager
+from src.database.models import PipelineModel
+from src.database.pipeline_changes import ChangeDetector
+from src.database.run_sync import RunHistorySync
+from src.providers.base import Pipeline, PipelineStatus
+from src.providers.registry import ProviderRegistry
+from src.workers.pipeline_poller import PipelinePoller
+from src.workers.poll_scheduler import PollScheduler
+from tests.helpers import FakeClock, SlowProvider, make_provider
+
+
+class TestPollScheduler(unittest.TestCase):
+    """
+    Test cases for PollScheduler.
+    """
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = PollScheduler(jitter=0.1, clock=self.clock, rng=random.Random(1))
+    
+    def test_only_due_providers_returned(self):
+        """Test that each provider runs on its own interval."""
+        self.scheduler.schedule('fast', 5)
+        self.scheduler.schedule('slow', 300)
+        
+        self.clock.now = 6
+        self.assertEqual(self.scheduler.wait_due(timeout=0), ['fast'])
+        self.assertEqual(self.scheduler.wait_due(timeout=0), [])
+        
+        self.scheduler.schedule_next('fast', 5)
+        self.assertTrue(4.5 <= self.scheduler.seconds_until('fast') <= 5.5)
+        self.assertEqual(self.scheduler.seconds_until('slow'), 294)
+        
+        self.scheduler.remove('slow')
+        self.clock.now = 400
+        self.assertEqual(self.scheduler.wait_due(timeout=0), ['fast'])
+    
+    def test_jitter_spreads_equal_intervals(self):
+        """Test that providers with the same interval are not due together."""
+        for name in ('a', 'b', 'c'):
+            self.scheduler.schedule_next(name, 100)
+        
+        due = {self.scheduler.seconds_until(name) for name in ('a', 'b', 'c')}
+        
+        self.assertEqual(len(due), 3)
+        self.assertTrue(all(90 <= seconds <= 110 for seconds in due))
+    
+    def test_wake_and_close_release_waiter(self):
+        """Test that a waiting thread returns promptly when woken or closed."""
+        scheduler = PollScheduler()
+        scheduler.schedule('later', 3600)
+        results = []
+        
+        waiter = threading.Thread(target=lambda: results.append(scheduler.wait_due()))
+        waiter.start()
+        scheduler.wake()
+        waiter.join(2)
+        
+        waiter = threading.Thread(target=lambda: results.append(scheduler.wait_due()))
+        waiter.start()
+        scheduler.close()
+        waiter.join(2)
+        
+        self.assertEqual(results, [[], []])
+
+
+class TestPipelinePollerScheduling(unittest.TestCase):
+    """
+    Test cases for PipelinePoller scheduling.
+    """
+    
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseManager(self.db_path)
+        self.db.init_db()
+        self.registry = ProviderRegistry(deadline=5)
+        self.poller = PipelinePoller(self.registry, interval=3600, workers=4, db=self.db,
+                                     run_sync=RunHistorySync(self.db), changes=ChangeDetector(self.db))
+    
+    def tearDown(self):
+        self.poller.stop()
+        self.db.close()
+        os.remove(self.db_path)
+    
+    def test_added_provider_polled_and_stop_is_prompt(self):
+        """Test that a new provider is polled at once and stop() doesn't wait out the interval."""
+        self.poller.start()
+        provider = SlowProvider('gh')
+        provider.config.refresh_interval = 3600
+        self.registry.register(provider)
+        
+        for _ in range(200):
+            if provider.calls:
+                break
+            time.sleep(0.02)
+        
+        started = time.monotonic()
+        self.poller.stop()
+        
+        self.assertEqual(provider.calls, 1)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertFalse(self.poller.thread.is_alive())
+    
+    def test_providers_fetched_concurrently_and_written(self):
+        """Test that slow providers are fetched in parallel and saved by the writer."""
+        providers = [SlowProvider(f'gh{i}', delay=0.5) for i in range(4)]
+        for provider in providers:
+            provider.config.refresh_interval = 3600
+            self.registry.register(provider)
+        
+        started = time.monotonic()
+        self.poller.start()
+        for _ in range(200):
+            with self.db.get_session() as session:
+                if session.query(PipelineModel).count() == 4:
+                    break
+            time.sleep(0.02)
+        elapsed = time.monotonic() - started
+        
+        self.assertEqual([p.calls for p in providers], [1, 1, 1, 1])
+        self.assertLess(elapsed, 1.9)
+    
+    def test_interval_adapts_to_activity(self):
+        """Test that intervals tighten on activity and back off while idle."""
+        provider = SlowProvider('gh')
+        provider.config.refresh_interval = 40
+        provider.config.config.update({'min_refresh_interval': 10, 'max_refresh_interval': 200})
+        self.registry.register(provider)
+        
+        def listing(status, started_at='2024-01-01T00:00:00Z'):
+            return [Pipeline(id='1', name='CI', status=status, repository='org/repo',
+                             branch='main', commit='sha', started_at=started_at)]
+        
+        idle = listing(PipelineStatus.SUCCESS)
+        intervals = [
+            self.poller._adapt(provider, listing(PipelineStatus.PENDING)),
+            self.poller._adapt(provider, idle),
+            self.poller._adapt(provider, idle),
+            self.poller._adapt(provider, idle),
+            self.poller._adapt(provider, idle),
+            self.poller._adapt(provider, listing(PipelineStatus.RUNNING, '2024-01-02T00:00:00Z')),
+            self.poller._adapt(provider, listing(PipelineStatus.SUCCESS, '2024-01-02T00:00:00Z')),
+            self.poller._adapt(provider, listing(PipelineStatus.SUCCESS, '2024-01-02T00:00:00Z'))
+        ]
+        
+        self.assertEqual(intervals, [40, 10, 20, 40, 80, 10, 10, 20])
+        self.assertEqual(self.poller.effective_intervals()['gh']['interval'], 20)
+    
+    def test_github_providers_polled_in_one_graphql_batch(self):
+        """Test that a due GitHub provider takes its batch partner along when it is due soon."""
+        providers = [make_provider(name='a', repo='a'), make_provider(name='b', repo='b')]
+        for provider in providers:
+            provider.config.refresh_interval = 3600
+            provider.fetch_pipelines = MagicMock(return_value=[])
+            self.registry.register(provider)
+        self.registry._graphql.fetch = MagicMock(return_value={'a': [], 'b': []})
+        self.poller.scheduler.schedule('b', 100)
+        
+        self.poller._executor = ThreadPoolExecutor(max_workers=2)
+        self.poller._dispatch([providers[0]])
+        self.poller._executor.shutdown(wait=True)
+        
+        self.registry._graphql.fetch.assert_called_once()
+        self.assertEqual({p.name for p in self.registry._graphql.fetch.call_args[0][0]}, {'a', 'b'})
+        self.assertNotIn('b', self.poller.scheduler)
+        self.assertFalse(any(p.fetch_pipelines.called for p in providers))
+
+
+if __name__ == '__main__':
+    unittest.main()
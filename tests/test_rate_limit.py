@@ -0,0 +1,141 @@
+"""
+Tests for the rate-limit request governor.
+"""
+
+import threading
+import unittest
+
+from src.providers.rate_limit import RateLimitGovernor, RequestPriority, current_priority, request_priority
+from src.providers.registry import ProviderRegistry
+from src.providers.swr_cache import StaleWhileRevalidateCache
+from src.utils.errors import RateLimitError
+from tests.helpers import SlowProvider
+
+
+class FakeClock:
+    """Manually advanced clock that records sleeps."""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+    
+    def time(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimitGovernor(unittest.TestCase):
+    """
+    Test cases for RateLimitGovernor.
+    """
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.governor = RateLimitGovernor(clock=self.clock.time, sleep=self.clock.sleep, max_wait=30)
+        self.key = RateLimitGovernor.bucket_key('https://api.github.com', 'token')
+    
+    def report(self, remaining, reset_in=3600, limit=5000, status_code=200, **extra):
+        headers = {
+            'X-RateLimit-Limit': str(limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset': str(self.clock.now + reset_in),
+            **extra
+        }
+        self.governor.update(self.key, headers, status_code)
+    
+    def test_plentiful_quota_is_not_paced(self):
+        """
+        Requests go out immediately while quota is plentiful.
+        """
+        self.report(remaining=4000)
+        for _ in range(5):
+            self.governor.acquire(self.key, RequestPriority.BACKGROUND)
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.governor.interval_multiplier(), 1.0)
+    
+    def test_background_is_paced_when_quota_is_low(self):
+        """
+        Background requests are spread out once quota runs low.
+        """
+        self.report(remaining=1000, reset_in=600)
+        self.governor.acquire(self.key, RequestPriority.BACKGROUND)
+        self.governor.acquire(self.key, RequestPriority.BACKGROUND)
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertGreater(self.governor.interval_multiplier(), 1.0)
+    
+    def test_interactive_skips_ahead_of_reserve(self):
+        """
+        Interactive calls may use the reserve that background calls can't.
+        """
+        self.report(remaining=100, reset_in=600)
+        self.governor.acquire(self.key, RequestPriority.INTERACTIVE)
+        with self.assertRaises(RateLimitError):
+            self.governor.acquire(self.key, RequestPriority.BACKGROUND)
+    
+    def test_retry_after_blocks_all_traffic(self):
+        """
+        Retry-After holds back every request until it expires.
+        """
+        self.report(remaining=10, status_code=429, **{'Retry-After': '5'})
+        self.governor.acquire(self.key, RequestPriority.INTERACTIVE)
+        self.assertEqual(self.clock.sleeps, [5.0])
+
+
+class PriorityProvider(SlowProvider):
+    """Provider recording the request priority it is called with."""
+    
+    def __init__(self, name):
+        super().__init__(name)
+        self.priorities = []
+    
+    def fetch_pipelines(self):
+        self.priorities.append(current_priority())
+        return super().fetch_pipelines()
+
+
+class TestPriorityPropagation(unittest.TestCase):
+    """
+    Test cases for request priority across worker threads.
+    """
+    
+    def test_registry_workers_keep_caller_priority(self):
+        """
+        Providers fetched on the registry executor see the caller's priority.
+        """
+        registry = ProviderRegistry(deadline=5)
+        provider = PriorityProvider('gh')
+        registry.register(provider)
+        
+        with request_priority(RequestPriority.BACKGROUND):
+            registry.fetch_all_pipelines_detailed()
+        
+        self.assertEqual(provider.priorities, [RequestPriority.BACKGROUND])
+    
+    def test_background_refresh_keeps_caller_priority(self):
+        """
+        Stale-while-revalidate refreshes run with the priority of the read that started them.
+        """
+        clock = FakeClock(now=0.0)
+        cache = StaleWhileRevalidateCache(clock=clock.time)
+        cache.put('key', 'old')
+        clock.now = 20
+        seen = []
+        refreshed = threading.Event()
+        
+        def reload():
+            seen.append(current_priority())
+            refreshed.set()
+            return 'new'
+        
+        with request_priority(RequestPriority.BACKGROUND):
+            cache.get('key', reload, ttl=10, max_staleness=100)
+        refreshed.wait(5)
+        
+        self.assertEqual(seen, [RequestPriority.BACKGROUND])
+
+
+if __name__ == '__main__':
+    unittest.main()
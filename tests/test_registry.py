@@ -0,0 +1,114 @@
+"""
+Tests for concurrent pipeline fetching in the provider registry.
+"""
+
+import threading
+import time
+import unittest
+
+from src.providers.registry import ProviderRegistry
+from src.providers.single_flight import SingleFlight
+from tests.helpers import SlowProvider
+
+
+class TestFetchAllPipelines(unittest.TestCase):
+    """
+    Test cases for ProviderRegistry.fetch_all_pipelines_detailed.
+    """
+    
+    def test_latency_is_slowest_provider(self):
+        """Test that providers are fetched concurrently."""
+        registry = ProviderRegistry(max_concurrency=8, deadline=5)
+        for index in range(8):
+            registry.register(SlowProvider(f'p{index}', delay=0.2))
+        
+        started = time.monotonic()
+        result = registry.fetch_all_pipelines_detailed()
+        
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(len(result.pipelines), 8)
+        self.assertFalse(result.partial)
+    
+    def test_errors_and_timeouts_are_reported(self):
+        """Test partial results with per-provider errors and timeouts."""
+        release = threading.Event()
+        registry = ProviderRegistry(max_concurrency=4, deadline=0.3)
+        registry.register(SlowProvider('ok'))
+        registry.register(SlowProvider('broken', error=RuntimeError('boom')))
+        registry.register(SlowProvider('stuck', release=release))
+        
+        try:
+            result = registry.fetch_all_pipelines_detailed()
+        finally:
+            release.set()
+        
+        self.assertEqual([p.provider for p in result.pipelines], ['ok'])
+        self.assertEqual(result.errors, {'broken': 'boom'})
+        self.assertEqual(result.timed_out, ['stuck'])
+        self.assertTrue(result.partial)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Test cases for single-flight request coalescing.
+    """
+    
+    def test_concurrent_callers_share_one_call(self):
+        """Test that callers arriving during a call get its result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return 'pipelines'
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do(('gh', 'fetch_pipelines', ()), fetch)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while flight.stats()['coalesced'] < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, ['pipelines'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats()['coalesced_by_operation'], {'fetch_pipelines': 4})
+    
+    def test_errors_are_shared_and_not_cached(self):
+        """Test that waiters see the leader's error and later calls run again."""
+        flight = SingleFlight()
+        
+        with self.assertRaises(RuntimeError):
+            flight.do('key', lambda: (_ for _ in ()).throw(RuntimeError('boom')))
+        
+        self.assertEqual(flight.do('key', lambda: 'ok'), 'ok')
+        self.assertEqual(flight.stats()['executed'], 2)
+    
+    def test_registry_coalesces_dashboard_refreshes(self):
+        """Test that simultaneous listings make one upstream fetch per provider."""
+        release = threading.Event()
+        provider = SlowProvider('gh', release=release)
+        registry = ProviderRegistry(deadline=5)
+        registry.register(provider)
+        
+        threads = [threading.Thread(target=registry.fetch_all_pipelines) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while registry.single_flight.stats()['coalesced'] < 3:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(provider.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for triggered-run correlation.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from src.providers.base import PipelineRun, PipelineStatus
+from src.providers.run_correlation import RunCorrelator, TriggerHandle
+from tests.helpers import FakeSession, make_provider, make_response, make_run
+
+
+def make_handle(kind='dispatch', **extra):
+    """Create a trigger handle for tests."""
+    return TriggerHandle(
+        id=TriggerHandle.new_id(),
+        provider='gh',
+        pipeline_id='1',
+        kind=kind,
+        dispatched_at=datetime.now(timezone.utc),
+        **extra
+    )
+
+
+def make_pipeline_run(run_id):
+    """Create a pipeline run for tests."""
+    return PipelineRun(id=str(run_id), pipeline_id='1', status=PipelineStatus.PENDING)
+
+
+class TestRunCorrelator(unittest.TestCase):
+    """
+    Test cases for RunCorrelator.
+    """
+    
+    def test_resolves_in_background(self):
+        """Test that a handle resolves once the resolver finds a run."""
+        correlator = RunCorrelator(initial_delay=0.01, max_delay=0.02)
+        answers = iter([[], [make_pipeline_run(7)]])
+        handle = correlator.track(make_handle(), lambda h: next(answers, []))
+        
+        run = handle.wait(2)
+        correlator.stop()
+        
+        self.assertEqual(run.id, '7')
+        self.assertEqual(handle.state, 'resolved')
+        self.assertEqual(handle.attempts, 2)
+    
+    def test_concurrent_dispatches_claim_distinct_runs(self):
+        """Test that two dispatches never resolve to the same run."""
+        correlator = RunCorrelator(initial_delay=60)
+        candidates = [make_pipeline_run(1), make_pipeline_run(2)]
+        first = correlator.track(make_handle(), lambda h: candidates)
+        second = correlator.track(make_handle(), lambda h: candidates)
+        
+        with self.assertLogs('src.providers.run_correlation', 'WARNING') as logs:
+            correlator.poll(first.id)
+        correlator.poll(second.id)
+        correlator.stop()
+        
+        self.assertEqual(first.run.id, '1')
+        self.assertEqual(second.run.id, '2')
+        self.assertIn('no correlation marker', logs.output[0])
+    
+    def test_gives_up_after_timeout(self):
+        """Test that unresolved handles time out."""
+        correlator = RunCorrelator(initial_delay=60, timeout=0)
+        handle = correlator.track(make_handle(), lambda h: [])
+        
+        correlator.poll(handle.id)
+        correlator.stop()
+        
+        self.assertTrue(handle.done())
+        self.assertEqual(handle.state, 'timeout')
+        self.assertIsNone(handle.run)
+
+
+class TestGitHubTriggerCorrelation(unittest.TestCase):
+    """
+    Test cases for non-blocking GitHub triggers.
+    """
+    
+    def test_trigger_returns_tracking_handle(self):
+        """Test that triggering returns at once and passes the marker input."""
+        provider = make_provider(correlation_input='flowforge_id')
+        provider.session = FakeSession({
+            '/actions/workflows/1': make_response(data={'id': 1, 'path': '.github/workflows/ci.yml'}),
+            '/user': make_response(data={'login': 'octocat'}),
+        })
+        provider.session.post = MagicMock(return_value=make_response(204))
+        
+        run = provider.trigger_pipeline('1', {'ref': 'main', 'inputs': {'env': 'prod'}})
+        
+        self.assertEqual(run.status, PipelineStatus.PENDING)
+        self.assertIsNotNone(run.tracking_id)
+        payload = provider.session.post.call_args.kwargs['json']
+        self.assertEqual(payload['inputs'], {'env': 'prod', 'flowforge_id': run.tracking_id})
+    
+    def test_dispatch_resolver_matches_marker(self):
+        """Test that the resolver filters candidates by actor, ref and marker."""
+        provider = make_provider(correlation_input='flowforge_id')
+        handle = make_handle(ref='main', actor='octocat', marker='abc')
+        ours = make_run(31, 1)
+        ours['display_title'] = 'Deploy abc'
+        other = make_run(30, 1)
+        other['display_title'] = 'Deploy xyz'
+        provider.session = FakeSession({
+            '/workflows/1/runs': make_response(data={'workflow_runs': [ours, other]}),
+        })
+        
+        runs = provider._resolve_dispatch(handle)
+        
+        self.assertEqual([run.id for run in runs], ['31'])
+        params = provider.session.calls[0][1]
+        self.assertEqual(params['event'], 'workflow_dispatch')
+        self.assertEqual(params['actor'], 'octocat')
+        self.assertEqual(params['branch'], 'main')
+    
+    def test_rerun_resolves_only_on_new_attempt(self):
+        """Test that a re-run isn't resolved to the attempt it replaced."""
+        provider = make_provider()
+        old = make_run(5, 1, status='completed', conclusion='failure')
+        old['run_attempt'] = 1
+        old['run_started_at'] = datetime.now(timezone.utc).isoformat()
+        provider.session = FakeSession({'/actions/runs/5': make_response(data=old)})
+        provider.session.post = MagicMock(return_value=make_response(201))
+        provider._forget_run = MagicMock()
+        
+        with patch('src.providers.github.get_correlator') as get_correlator:
+            provider.re_run_pipeline('5')
+        handle = get_correlator.return_value.track.call_args.args[0]
+        
+        self.assertEqual(handle.source_attempt, 1)
+        self.assertEqual(handle.pipeline_id, '1')
+        self.assertEqual(provider._resolve_rerun(handle), [])
+        
+        old.update(run_attempt=2, status='queued', conclusion=None)
+        self.assertEqual([run.id for run in provider._resolve_rerun(handle)], ['5'])
+
+
+if __name__ == '__main__':
+    unittest.main()
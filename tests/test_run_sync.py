@@ -0,0 +1,129 @@
+"""
+Tests for incremental run-history sync.
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.database.db import DatabaseManager
+from src.database.models import PipelineRunModel, SyncCursorModel
+from src.database.run_sync import RunHistorySync
+from src.providers.base import Pipeline, PipelineStatus
+from tests.helpers import FakeSession, make_provider, make_response, make_run
+
+
+def make_pipeline(started_at, **extra):
+    """Build a workflow whose latest run was created at started_at."""
+    fields = dict(
+        id='1',
+        name='CI',
+        status=PipelineStatus.SUCCESS,
+        repository='org/repo',
+        branch='main',
+        commit='sha',
+        started_at=started_at
+    )
+    fields.update(extra)
+    return Pipeline(**fields)
+
+
+class TestRunHistorySync(unittest.TestCase):
+    """
+    Test cases for RunHistorySync.
+    """
+    
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseManager(self.db_path)
+        self.db.init_db()
+        self.sync = RunHistorySync(self.db)
+        
+        self.done = make_run(10, 1)
+        self.running = make_run(11, 1, status='in_progress', conclusion=None)
+        self.running['created_at'] = '2024-01-01T01:00:00Z'
+        self.provider = make_provider()
+        self.provider.session = FakeSession({
+            '/workflows/1/runs': make_response(data={'workflow_runs': [self.running, self.done]}),
+        })
+    
+    def tearDown(self):
+        self.db.close()
+        os.remove(self.db_path)
+    
+    def _cursor(self):
+        with self.db.get_session() as session:
+            return session.get(SyncCursorModel, ('gh', '1'))
+    
+    def test_cursor_held_at_oldest_unfinished_run(self):
+        """Test that runs are upserted and the cursor waits for running runs."""
+        written = self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        
+        self.assertEqual(written, {'1': 2})
+        self.assertEqual(self._cursor().since.isoformat(), '2024-01-01T01:00:00')
+        with self.db.get_session() as session:
+            self.assertEqual(session.get(PipelineRunModel, '11').status, 'running')
+        
+        self.running.update(status='completed', conclusion='success')
+        written = self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        
+        _, params = self.provider.session.calls[-1]
+        self.assertEqual(params['created'], '>=2024-01-01T01:00:00Z')
+        self.assertEqual(written, {'1': 1})
+        with self.db.get_session() as session:
+            self.assertEqual(session.get(PipelineRunModel, '11').status, 'success')
+    
+    def test_idle_workflow_is_skipped(self):
+        """Test that a workflow without new or running runs costs no request."""
+        self.running.update(status='completed', conclusion='success')
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        calls = len(self.provider.session.calls)
+        
+        self.assertEqual(self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')]), {})
+        self.assertEqual(len(self.provider.session.calls), calls)
+        
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T02:00:00Z')])
+        self.assertEqual(len(self.provider.session.calls), calls + 1)
+    
+    def test_completed_skipped_run_releases_cursor(self):
+        """Test that completed runs mapped to pending don't hold the cursor."""
+        self.running.update(status='completed', conclusion='skipped')
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        calls = len(self.provider.session.calls)
+        
+        with self.db.get_session() as session:
+            self.assertEqual(session.get(PipelineRunModel, '11').status, 'pending')
+        self.assertFalse(self._cursor().in_progress)
+        self.assertEqual(self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')]), {})
+        self.assertEqual(len(self.provider.session.calls), calls)
+    
+    def test_changed_old_runs_are_refetched(self):
+        """Test that re-runs before the cursor are fetched by id and upserted."""
+        self.running.update(status='completed', conclusion='success')
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        
+        self.provider.session.routes['/workflows/1/runs'] = make_response(data={'workflow_runs': [self.running]})
+        rerun = dict(self.done, status='in_progress', conclusion=None)
+        self.provider.session.routes['/actions/runs/10'] = make_response(data=rerun)
+        listed = make_pipeline('2024-01-01T01:00:00Z', status=PipelineStatus.RUNNING, run_id='10')
+        self.assertEqual(self.sync.sync(self.provider, [listed]), {'1': 1})
+        with self.db.get_session() as session:
+            self.assertEqual(session.get(PipelineRunModel, '10').status, 'running')
+        
+        rerun.update(status='completed', conclusion='failure')
+        self.provider.session.routes['/workflows/1/runs'] = make_response(data={'workflow_runs': [self.running, rerun]})
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        with self.db.get_session() as session:
+            self.assertEqual(session.get(PipelineRunModel, '10').status, 'failure')
+        
+        self.sync.reopen('10')
+        with self.db.get_session() as session:
+            self.assertIsNone(session.get(PipelineRunModel, '10').finished_at)
+        self.sync.sync(self.provider, [make_pipeline('2024-01-01T01:00:00Z')])
+        with self.db.get_session() as session:
+            self.assertIsNotNone(session.get(PipelineRunModel, '10').finished_at)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the stale-while-revalidate read cache.
+"""
+
+import threading
+import unittest
+
+from src.providers.registry import ProviderRegistry
+from src.providers.swr_cache import StaleWhileRevalidateCache
+from tests.helpers import FakeClock, SlowProvider
+
+
+class TestStaleWhileRevalidateCache(unittest.TestCase):
+    """
+    Test cases for StaleWhileRevalidateCache.
+    """
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = StaleWhileRevalidateCache(max_entries=2, clock=self.clock)
+    
+    def test_stale_value_served_while_refreshing(self):
+        """Test that an expired value is returned at once and refreshed once."""
+        refreshed = threading.Event()
+        release = threading.Event()
+        
+        def reload():
+            release.wait(5)
+            refreshed.set()
+            return 'new'
+        
+        self.cache.get('key', lambda: 'old', ttl=10, max_staleness=100)
+        self.clock.now = 20
+        
+        first = self.cache.get('key', reload, ttl=10, max_staleness=100)
+        second = self.cache.get('key', reload, ttl=10, max_staleness=100)
+        release.set()
+        refreshed.wait(5)
+        
+        self.assertEqual(first, ('old', 20))
+        self.assertEqual(second, ('old', 20))
+        self.assertEqual(self.cache.stats()['refreshes'], 1)
+    
+    def test_max_staleness_forces_reload(self):
+        """Test that values past the staleness cap are never served."""
+        self.cache.get('key', lambda: 'old', ttl=10, max_staleness=100)
+        self.clock.now = 150
+        
+        self.assertEqual(self.cache.get('key', lambda: 'new', ttl=10, max_staleness=100), ('new', 0.0))
+        self.assertIsNone(self.cache.peek('missing', 100))
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        for key in ('a', 'b'):
+            self.cache.put(key, key)
+        self.cache.peek('a', 100)
+        self.cache.put('c', 'c')
+        
+        self.assertIsNone(self.cache.peek('b', 100))
+        self.assertIsNotNone(self.cache.peek('a', 100))
+    
+    def test_registry_listing_served_from_cache(self):
+        """Test that cached listings skip the provider and report their age."""
+        registry = ProviderRegistry(deadline=5)
+        registry.read_cache = self.cache
+        provider = SlowProvider('gh')
+        provider.config.refresh_interval = 30
+        registry.register(provider)
+        
+        registry.fetch_all_pipelines_detailed(cached=True)
+        self.clock.now = 5
+        result = registry.fetch_all_pipelines_detailed(cached=True)
+        
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(result.ages, {'gh': 5})
+        self.assertEqual(len(result.pipelines), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
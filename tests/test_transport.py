@@ -0,0 +1,76 @@
+"""
+Tests for the shared HTTP transport.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.providers.base import ProviderConfig
+from src.providers.github import GitHubProvider
+from src.providers.transport import HttpTransport, LatencyHistogram
+
+
+class TestHttpTransport(unittest.TestCase):
+    """
+    Test cases for HttpTransport.
+    """
+    
+    def test_session_shared_per_host(self):
+        """Test that providers on the same host share one session."""
+        transport = HttpTransport()
+        first = transport.session_for('https://api.github.com')
+        second = transport.session_for('https://api.github.com/')
+        other = transport.session_for('https://ghe.example.com/api/v3')
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+    
+    def test_adapter_configuration(self):
+        """Test pool size, retry policy and enlarging the pool on demand."""
+        transport = HttpTransport(pool_maxsize=4, max_retries=2)
+        session = transport.session_for('https://api.github.com')
+        adapter = session.get_adapter('https://api.github.com/user')
+        
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+        
+        transport.session_for('https://api.github.com', pool_maxsize=16)
+        self.assertEqual(session.get_adapter('https://api.github.com/user')._pool_maxsize, 16)
+    
+    def test_default_timeout_and_latency(self):
+        """Test that requests get the default timeout and are recorded."""
+        transport = HttpTransport(connect_timeout=2, read_timeout=7)
+        session = transport.session_for('https://api.github.com')
+        
+        with patch('requests.Session.request') as request:
+            session.get('https://api.github.com/user')
+        
+        self.assertEqual(request.call_args.kwargs['timeout'], (2, 7))
+        self.assertEqual(transport.stats()['latency']['api.github.com']['count'], 1)
+    
+    def test_histogram_buckets(self):
+        """Test that latencies land in the right buckets."""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        histogram.observe('h', 0.05)
+        histogram.observe('h', 0.5)
+        histogram.observe('h', 5.0)
+        
+        snapshot = histogram.snapshot()['h']
+        self.assertEqual(snapshot['buckets'], {'le_0.1': 1, 'le_1.0': 1, 'le_inf': 1})
+    
+    def test_provider_sends_auth_per_request(self):
+        """Test that the shared session carries no provider credentials."""
+        provider = GitHubProvider(ProviderConfig(
+            name='gh',
+            provider_type='github',
+            config={'token': 'secret', 'owner': 'org', 'repo': 'repo'}
+        ))
+        
+        self.assertNotIn('Authorization', provider.session.headers)
+        self.assertEqual(provider._headers['Authorization'], 'token secret')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Tests for workflow dispatch input parsing and validation.
+"""
+
+import base64
+import unittest
+from unittest.mock import MagicMock
+
+from src.providers.workflow_inputs import (
+    WorkflowSchemaCache,
+    parse_dispatch_inputs,
+    validate_inputs
+)
+from src.utils.errors import RateLimitError, ValidationError
+from tests.helpers import FakeSession, make_provider, make_response
+
+WORKFLOW = '''
+name: Deploy
+on:
+  push:
+  workflow_dispatch:
+    inputs:
+      environment:
+        type: choice
+        required: true
+        options: [staging, production]
+      dry_run:
+        type: boolean
+        default: true
+      replicas:
+        type: number
+      note:
+        description: Free text
+'''
+
+
+class TestParseDispatchInputs(unittest.TestCase):
+    """
+    Test cases for parse_dispatch_inputs.
+    """
+    
+    def test_parses_input_schema(self):
+        """Test types, defaults, choices and required flags."""
+        schema = parse_dispatch_inputs(WORKFLOW)
+        
+        self.assertTrue(schema.dispatchable)
+        self.assertEqual(schema.inputs['environment']['options'], ['staging', 'production'])
+        self.assertTrue(schema.inputs['environment']['required'])
+        self.assertEqual(schema.inputs['dry_run']['default'], True)
+        self.assertEqual(schema.inputs['note']['type'], 'string')
+    
+    def test_trigger_forms(self):
+        """Test string and list triggers and workflows without dispatch."""
+        self.assertTrue(parse_dispatch_inputs('on: workflow_dispatch').dispatchable)
+        self.assertTrue(parse_dispatch_inputs('on: [push, workflow_dispatch]').dispatchable)
+        self.assertFalse(parse_dispatch_inputs('on: push').dispatchable)
+    
+    def test_malformed_specs_fall_back_to_defaults(self):
+        """Test that non-mapping dispatch, inputs and specs don't break parsing."""
+        self.assertEqual(parse_dispatch_inputs('on:\n  workflow_dispatch: yes').inputs, {})
+        self.assertEqual(parse_dispatch_inputs('on:\n  workflow_dispatch:\n    inputs: [a, b]').inputs, {})
+        
+        schema = parse_dispatch_inputs('on:\n  workflow_dispatch:\n    inputs:\n      note: free text')
+        self.assertEqual(schema.inputs['note']['type'], 'string')
+        self.assertFalse(schema.inputs['note']['required'])
+    
+    def test_validate_inputs(self):
+        """Test that invalid payloads are rejected with every problem listed."""
+        schema = parse_dispatch_inputs(WORKFLOW)
+        
+        self.assertEqual(
+            validate_inputs(schema, {'environment': 'staging', 'dry_run': False, 'replicas': 3}),
+            {'environment': 'staging', 'dry_run': 'false', 'replicas': '3'}
+        )
+        with self.assertRaises(ValidationError) as context:
+            validate_inputs(schema, {'dry_run': 'maybe', 'replicas': 'x', 'extra': 1})
+        
+        message = str(context.exception)
+        for problem in ("missing required input 'environment'", "'dry_run' must be true or false",
+                        "'replicas' must be a number", "unexpected input 'extra'"):
+            self.assertIn(problem, message)
+
+
+class TestWorkflowSchemaCache(unittest.TestCase):
+    """
+    Test cases for the SHA-keyed schema cache and its use by GitHubProvider.
+    """
+    
+    def test_parses_once_per_blob(self):
+        """Test that a file revision is parsed only once."""
+        cache = WorkflowSchemaCache()
+        load = MagicMock(return_value=WORKFLOW)
+        
+        cache.get_or_parse('abc', load)
+        cache.get_or_parse('abc', load)
+        
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(cache.stats()['parses'], 1)
+    
+    def test_invalid_trigger_rejected_locally(self):
+        """Test that schemas are fetched once per ref and bad triggers are never posted."""
+        provider = make_provider()
+        provider.session = FakeSession({
+            '/actions/workflows/1': make_response(data={'id': 1, 'name': 'Deploy', 'path': 'deploy.yml'}),
+            '/contents/deploy.yml': make_response(data={
+                'sha': 'blob-deploy',
+                'content': base64.b64encode(WORKFLOW.encode()).decode()
+            }),
+        })
+        provider.session.post = MagicMock()
+        
+        parameters = provider.get_available_parameters('1')
+        for _ in range(2):
+            with self.assertRaises(ValidationError):
+                provider.trigger_pipeline('1', {'inputs': {'environment': 'qa'}})
+        
+        self.assertIn('environment', parameters['inputs'])
+        provider.session.post.assert_not_called()
+        contents_calls = [url for url, _ in provider.session.calls if '/contents/' in url]
+        self.assertEqual(len(contents_calls), 2)  # default branch and 'main'
+        self.assertEqual(provider.workflow_cache.get('1').inputs, parameters['inputs'])
+    
+    def test_schema_lookup_failure_does_not_block_trigger(self):
+        """Test that a trigger is dispatched unvalidated when the schema can't be fetched."""
+        provider = make_provider()
+        provider._actor_login = 'octocat'
+        provider.get_dispatch_inputs = MagicMock(side_effect=RateLimitError('deferred', 'gh', retry_after=30))
+        provider.session = FakeSession({})
+        provider.session.post = MagicMock(return_value=make_response(204))
+        
+        run = provider.trigger_pipeline('1', {'inputs': {'environment': 'qa'}})
+        
+        self.assertIsNotNone(run.tracking_id)
+        self.assertEqual(provider.session.post.call_args.kwargs['json']['inputs']['environment'], 'qa')
+
+
+if __name__ == '__main__':
+    unittest.main()